@@ -0,0 +1,95 @@
+"""
+Benchmark of the token-aware chunkers on synthetic markdown pages
+
+Usage:
+    python chunking_benchmark.py --sizes 100000 1000000 10000000 --chunk-size 4096
+"""
+
+import argparse
+import random
+import time
+
+from scrapegraphai.utils import tokenizer
+from scrapegraphai.utils.split_text_into_chunks import (
+    split_text_into_chunks,
+    split_text_into_token_chunks,
+)
+
+WORDS = (
+    "scraping graph node pipeline token chunk model answer page content "
+    "données über naïve 東京 search result price product review"
+).split()
+
+
+def make_markdown(size: int, seed: int = 0) -> str:
+    """
+    Builds a markdown page of about ``size`` characters with headings,
+    paragraphs and sentences of random words.
+    """
+    rng = random.Random(seed)
+    parts = []
+    length = 0
+    while length < size:
+        if rng.random() < 0.05:
+            part = f"## Section {len(parts)}\n\n"
+        else:
+            sentences = [
+                " ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 25))) + "."
+                for _ in range(rng.randint(1, 6))
+            ]
+            part = " ".join(sentences) + "\n\n"
+        parts.append(part)
+        length += len(part)
+    return "".join(parts)[:size]
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[100_000, 1_000_000, 10_000_000]
+    )
+    parser.add_argument("--chunk-size", type=int, default=4096)
+    parser.add_argument(
+        "--skip-semchunk-above",
+        type=int,
+        default=2_000_000,
+        help="Inputs larger than this many characters skip the semchunk run.",
+    )
+    args = parser.parse_args()
+
+    print(f"{'size':>10} {'implementation':>14} {'chunks':>7} {'seconds':>9}")
+    for size in args.sizes:
+        text = make_markdown(size)
+
+        # fresh counters, so that no run benefits from the memo of another one
+        semchunk_seconds = None
+        if size <= args.skip_semchunk_above:
+            _reset_token_counters()
+            chunks, semchunk_seconds = timed(
+                split_text_into_chunks, text, args.chunk_size
+            )
+            print(
+                f"{size:>10} {'semchunk':>14} {len(chunks):>7} {semchunk_seconds:>9.3f}"
+            )
+
+        _reset_token_counters()
+        chunks, seconds = timed(split_text_into_token_chunks, text, args.chunk_size)
+        print(f"{size:>10} {'token offsets':>14} {len(chunks):>7} {seconds:>9.3f}")
+
+        if semchunk_seconds:
+            speedup = semchunk_seconds / seconds
+            print(f"{'':>10} {'speedup':>14} {'':>7} {speedup:>8.1f}x")
+
+
+def _reset_token_counters():
+    tokenizer._counters.clear()
+
+
+if __name__ == "__main__":
+    main()
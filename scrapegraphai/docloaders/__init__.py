@@ -3,11 +3,15 @@ This module handles document loading functionalities for the ScrapeGraphAI appli
 """
 
 from .browser_base import browser_base_fetch
+from .browser_pool import BrowserPool
 from .chromium import ChromiumLoader
+from .resource_blocker import ResourceBlocker
 from .scrape_do import scrape_do_fetch
 
 __all__ = [
     "browser_base_fetch",
+    "BrowserPool",
     "ChromiumLoader",
+    "ResourceBlocker",
     "scrape_do_fetch",
 ]
@@ -0,0 +1,313 @@
+"""
+browser_pool module
+"""
+
+import asyncio
+import atexit
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Coroutine, Dict, List, Optional
+
+from ..utils import get_logger
+
+logger = get_logger("browser-pool")
+
+
+class _PooledBrowser:
+    """
+    Book-keeping wrapper around a long-lived browser owned by a BrowserPool.
+    """
+
+    def __init__(self, browser):
+        self.browser = browser
+        self.in_use = 0
+        self.pages_served = 0
+        self.retiring = False
+
+
+class BrowserPool:
+    """
+    Process-wide pool of long-lived Playwright browsers.
+
+    Every page gets a fresh BrowserContext (cookies and storage are not shared
+    between pages), but the browser process itself is reused, so the cost of
+    launching Chromium is paid once per browser instead of once per URL.
+    Browsers are health-checked before being handed out and recycled after
+    serving ``max_pages_per_browser`` pages.
+
+    All Playwright objects live on a dedicated event loop running in a daemon
+    thread. Callers from any thread or event loop submit their work through
+    ``run`` / ``arun``, which makes the pool safe to share between
+    ``ChromiumLoader.lazy_load`` (that calls ``asyncio.run`` per URL), nodes and
+    the threads spawned by ``GraphIteratorNode``.
+
+    Attributes:
+        browser_name (str): The browser to launch, "chromium" or "firefox".
+        headless (bool): Whether browsers run in headless mode.
+        proxy (Optional[dict]): Proxy settings passed to the browser launch.
+        launch_kwargs (dict): Additional kwargs passed to the browser launch.
+        size (int): Maximum number of live browsers in the pool.
+        max_pages_per_browser (int): Number of pages after which a browser is recycled.
+
+    Example:
+        >>> pool = BrowserPool.get(headless=True, size=2)
+        >>> async def fetch(url):
+        ...     async with pool.page() as page:
+        ...         await page.goto(url)
+        ...         return await page.content()
+        >>> html = pool.run(fetch("https://example.com"))
+    """
+
+    _pools: Dict[tuple, "BrowserPool"] = {}
+    _pools_lock = threading.Lock()
+
+    def __init__(
+        self,
+        browser_name: str = "chromium",
+        headless: bool = True,
+        proxy: Optional[dict] = None,
+        launch_kwargs: Optional[dict] = None,
+        size: int = 2,
+        max_pages_per_browser: int = 100,
+    ):
+        if size < 1:
+            raise ValueError("The browser pool size must be at least 1.")
+        if max_pages_per_browser < 1:
+            raise ValueError("max_pages_per_browser must be at least 1.")
+
+        self.browser_name = browser_name
+        self.headless = headless
+        self.proxy = proxy
+        self.launch_kwargs = launch_kwargs or {}
+        self.size = size
+        self.max_pages_per_browser = max_pages_per_browser
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._lock: Optional[asyncio.Lock] = None
+        self._playwright = None
+        self._browsers: List[_PooledBrowser] = []
+
+    @classmethod
+    def get(
+        cls,
+        browser_name: str = "chromium",
+        headless: bool = True,
+        proxy: Optional[dict] = None,
+        launch_kwargs: Optional[dict] = None,
+        size: int = 2,
+        max_pages_per_browser: int = 100,
+    ) -> "BrowserPool":
+        """
+        Returns the shared pool for the given browser configuration,
+        creating it on first use.
+
+        Args:
+            browser_name (str): The browser to launch, "chromium" or "firefox".
+            headless (bool): Whether browsers run in headless mode.
+            proxy (Optional[dict]): Proxy settings passed to the browser launch.
+            launch_kwargs (Optional[dict]): Additional browser launch kwargs.
+            size (int): Maximum number of live browsers in the pool.
+            max_pages_per_browser (int): Pages served before a browser is recycled.
+
+        Returns:
+            BrowserPool: The pool shared by every caller with the same configuration.
+        """
+        key = (
+            browser_name,
+            headless,
+            repr(sorted((proxy or {}).items())),
+            repr(sorted((launch_kwargs or {}).items())),
+            size,
+            max_pages_per_browser,
+        )
+        with cls._pools_lock:
+            pool = cls._pools.get(key)
+            if pool is None:
+                pool = cls(
+                    browser_name=browser_name,
+                    headless=headless,
+                    proxy=proxy,
+                    launch_kwargs=launch_kwargs,
+                    size=size,
+                    max_pages_per_browser=max_pages_per_browser,
+                )
+                cls._pools[key] = pool
+            return pool
+
+    @classmethod
+    def close_all(cls):
+        """
+        Closes every shared pool and the browsers they own.
+        """
+        with cls._pools_lock:
+            pools = list(cls._pools.values())
+            cls._pools.clear()
+        for pool in pools:
+            pool.close()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Starts the pool event loop thread if it is not running yet."""
+        with self._start_lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._lock = asyncio.Lock()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="scrapegraphai-browser-pool",
+                    daemon=True,
+                )
+                self._thread.start()
+            return self._loop
+
+    def run(self, coro: Coroutine) -> Any:
+        """
+        Runs a coroutine on the pool event loop and blocks until it completes.
+
+        Args:
+            coro (Coroutine): The coroutine to run; it may use ``page()``.
+
+        Returns:
+            Any: The result of the coroutine.
+        """
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("BrowserPool.run cannot be called from the pool loop.")
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    async def arun(self, coro: Coroutine) -> Any:
+        """
+        Runs a coroutine on the pool event loop from any other event loop.
+        Cancelling the awaiting task cancels the work on the pool loop as well.
+
+        Args:
+            coro (Coroutine): The coroutine to run; it may use ``page()``.
+
+        Returns:
+            Any: The result of the coroutine.
+        """
+        loop = self._ensure_loop()
+        if asyncio.get_running_loop() is loop:
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+    async def _launch_browser(self):
+        """Launches a new browser on the pool event loop."""
+        if self._playwright is None:
+            from playwright.async_api import async_playwright
+
+            self._playwright = await async_playwright().start()
+
+        if self.browser_name == "chromium":
+            launcher = self._playwright.chromium
+        elif self.browser_name == "firefox":
+            launcher = self._playwright.firefox
+        else:
+            raise ValueError(f"Invalid browser name: {self.browser_name}")
+
+        logger.info(f"Launching pooled {self.browser_name} browser")
+        return await launcher.launch(
+            headless=self.headless, proxy=self.proxy, **self.launch_kwargs
+        )
+
+    async def _close_slot(self, slot: _PooledBrowser):
+        """Closes a pooled browser and removes it from the pool."""
+        if slot in self._browsers:
+            self._browsers.remove(slot)
+        try:
+            await slot.browser.close()
+        except Exception as e:
+            logger.warning(f"Failed to close pooled browser: {e}")
+
+    async def _acquire(self) -> _PooledBrowser:
+        """Returns the least loaded healthy browser, launching one if needed."""
+        async with self._lock:
+            for slot in list(self._browsers):
+                if not slot.browser.is_connected():
+                    logger.warning("Dropping disconnected pooled browser")
+                    await self._close_slot(slot)
+                elif slot.retiring and slot.in_use == 0:
+                    await self._close_slot(slot)
+
+            candidates = [slot for slot in self._browsers if not slot.retiring]
+            if len(candidates) < self.size:
+                slot = _PooledBrowser(await self._launch_browser())
+                self._browsers.append(slot)
+            else:
+                slot = min(candidates, key=lambda s: s.in_use)
+
+            slot.in_use += 1
+            slot.pages_served += 1
+            if slot.pages_served >= self.max_pages_per_browser:
+                slot.retiring = True
+            return slot
+
+    async def _release(self, slot: _PooledBrowser):
+        """Returns a browser to the pool, closing it if it is due for recycling."""
+        async with self._lock:
+            slot.in_use -= 1
+            if (slot.retiring or not slot.browser.is_connected()) and slot.in_use == 0:
+                await self._close_slot(slot)
+
+    @asynccontextmanager
+    async def page(
+        self, storage_state: Optional[str] = None, stealth: bool = False
+    ) -> AsyncIterator[Any]:
+        """
+        Yields a page opened in a fresh BrowserContext of a pooled browser.
+        Must be used from a coroutine running on the pool loop (see ``run``).
+
+        Args:
+            storage_state (Optional[str]): Playwright storage state for the context.
+            stealth (bool): Whether to apply undetected-playwright stealth patches.
+
+        Yields:
+            The Playwright page; its context is closed on exit.
+        """
+        slot = await self._acquire()
+        context = None
+        try:
+            context = await slot.browser.new_context(storage_state=storage_state)
+            if stealth:
+                from undetected_playwright import Malenia
+
+                await Malenia.apply_stealth(context)
+            yield await context.new_page()
+        finally:
+            if context is not None:
+                try:
+                    await context.close()
+                except Exception as e:
+                    logger.warning(f"Failed to close browser context: {e}")
+            await self._release(slot)
+
+    async def _aclose(self):
+        async with self._lock:
+            for slot in list(self._browsers):
+                await self._close_slot(slot)
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+    def close(self):
+        """
+        Closes every browser owned by the pool and stops its event loop.
+        """
+        with self._start_lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._aclose(), loop).result(timeout=30)
+        except Exception as e:
+            logger.warning(f"Failed to close browser pool cleanly: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5)
+        loop.close()
+
+
+atexit.register(BrowserPool.close_all)
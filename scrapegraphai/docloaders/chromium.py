@@ -1,5 +1,6 @@
 import asyncio
-from typing import Any, AsyncIterator, Iterator, List, Optional, Union
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
 
 import aiohttp
 import async_timeout
@@ -7,6 +8,11 @@ from langchain_community.document_loaders.base import BaseLoader
 from langchain_core.documents import Document
 
 from ..utils import Proxy, dynamic_import, get_logger, parse_or_search_proxy
+from ..utils.host_limiter import get_host
+from ..utils.http_client import DEFAULT_MAX_BODY_SIZE, ahttp_fetch, http_fetch
+from ..utils.render_detection import HostRenderTable, needs_js_rendering
+from .browser_pool import BrowserPool
+from .resource_blocker import ResourceBlocker, ResourceStats
 
 logger = get_logger("web-loader")
 
@@ -17,11 +23,23 @@ class ChromiumLoader(BaseLoader):
 
     Attributes:
         backend: The web driver backend library; defaults to 'playwright'.
+            'http' fetches pages with a pooled HTTP client instead of a browser,
+            'auto' uses the browser only for pages that need JavaScript.
         browser_config: A dictionary containing additional browser kwargs.
         headless: Whether to run browser in headless mode.
         proxy: A dictionary containing proxy settings; None disables protection.
         urls: A list of URLs to scrape content from.
         requires_js_support: Flag to determine if JS rendering is required.
+        browser_pool: Settings of the shared browser pool; None launches a
+            new browser for every URL.
+        max_body_size: Maximum size in bytes of a page fetched by the 'http' backend.
+        browser_fallback: Whether the 'http' backend retries with Playwright
+            when the plain HTTP fetch fails or returns an empty page.
+        render_table_path: Path of the persistent per-host table of the 'auto'
+            backend; None keeps it in memory.
+        resource_blocker: The request-interception policy of the Playwright
+            pages; None loads every subresource.
+        resource_stats: The requests blocked and loaded for each scraped URL.
     """
 
     def __init__(
@@ -37,29 +55,53 @@ class ChromiumLoader(BaseLoader):
         browser_name: str = "chromium",  # default chromium
         retry_limit: int = 1,
         timeout: int = 60,
+        browser_pool: Union[bool, dict, BrowserPool, None] = None,
+        max_body_size: Optional[int] = DEFAULT_MAX_BODY_SIZE,
+        browser_fallback: bool = True,
+        render_table_path: Optional[str] = None,
+        block_resources: Union[bool, dict, ResourceBlocker, None] = None,
         **kwargs: Any,
     ):
         """Initialize the loader with a list of URL paths.
 
         Args:
             backend: The web driver backend library; defaults to 'playwright'.
+                'http' fetches pages with a pooled HTTP client instead of a browser,
+                'auto' fetches them over HTTP first and renders them with Playwright
+                only when they need JavaScript.
             headless: Whether to run browser in headless mode.
             proxy: A dictionary containing proxy information; None disables protection.
             urls: A list of URLs to scrape content from.
             requires_js_support: Whether to use JS rendering for scraping.
             retry_limit: Maximum number of retry attempts for scraping. Defaults to 3.
             timeout: Maximum time in seconds to wait for scraping. Defaults to 10.
+            browser_pool: Reuse long-lived browsers from a process-wide BrowserPool
+                instead of launching one per URL. Either True for the default pool
+                settings, a dict with ``size`` and ``max_pages_per_browser`` keys,
+                or a BrowserPool instance.
+            max_body_size: Maximum size in bytes of a page fetched by the 'http'
+                backend; None disables the limit.
+            browser_fallback: Whether the 'http' backend falls back to Playwright
+                when the plain HTTP fetch fails or returns an empty page.
+            render_table_path: Path of the SQLite table where the 'auto' backend
+                remembers which hosts need a browser; None keeps it in memory.
+            block_resources: Abort the subresources not needed to extract text
+                while Playwright loads a page. Either True to block images, media,
+                fonts, stylesheets and common ad and analytics domains, a dict
+                with ``resource_types``, ``domains`` and ``extra_domains`` keys,
+                or a ResourceBlocker instance.
             kwargs: A dictionary containing additional browser kwargs.
 
         Raises:
             ImportError: If the required backend package is not installed.
         """
-        message = (
-            f"{backend} is required for ChromiumLoader. "
-            f"Please install it with `pip install {backend}`."
-        )
+        if backend not in ("http", "auto"):
+            message = (
+                f"{backend} is required for ChromiumLoader. "
+                f"Please install it with `pip install {backend}`."
+            )
 
-        dynamic_import(backend, message)
+            dynamic_import(backend, message)
 
         self.browser_config = kwargs
         self.headless = headless
@@ -72,10 +114,252 @@ class ChromiumLoader(BaseLoader):
         self.browser_name = kwargs.get("browser_name", browser_name)
         self.retry_limit = kwargs.get("retry_limit", retry_limit)
         self.timeout = kwargs.get("timeout", timeout)
+        self.browser_pool = browser_pool
+        self.max_body_size = max_body_size
+        self.browser_fallback = browser_fallback
+        self.render_table_path = render_table_path
+        self.resource_blocker = ResourceBlocker.from_config(block_resources)
+        self.resource_stats: Dict[str, ResourceStats] = {}
+
+    async def _attach_resource_blocker(self, page: Any, url: str):
+        """
+        Installs the request-interception policy, if any, on a page about to load a URL.
+        """
+        if self.resource_blocker is not None:
+            self.resource_stats[url] = await self.resource_blocker.attach(page)
+
+    def _make_document(self, url: str, content: str) -> Document:
+        """
+        Wraps scraped content in a Document, adding the resource stats of the page.
+        """
+        metadata = {"source": url}
+        stats = self.resource_stats.get(url)
+        if stats is not None:
+            logger.info(
+                f"Blocked {stats.blocked_requests} requests while loading {url} "
+                f"({stats.loaded_requests} loaded, {stats.loaded_bytes} bytes)"
+            )
+            metadata["resources"] = stats.as_dict()
+        return Document(page_content=content, metadata=metadata)
+
+    def _get_http_proxy(self) -> Optional[str]:
+        """
+        Converts the Playwright proxy settings into a proxy URL for the HTTP client.
+        """
+        if not self.proxy:
+            return None
+
+        server = self.proxy["server"]
+        scheme, sep, address = server.partition("://")
+        if not sep:
+            scheme, address = "http", server
+        if self.proxy.get("username"):
+            credentials = self.proxy["username"]
+            if self.proxy.get("password"):
+                credentials += f":{self.proxy['password']}"
+            address = f"{credentials}@{address}"
+        return f"{scheme}://{address}"
+
+    def _get_browser_pool(self, browser_name: str) -> Optional[BrowserPool]:
+        """
+        Resolves the ``browser_pool`` setting into the shared pool to use, if any.
+
+        Args:
+            browser_name (str): The browser the pool must launch.
+
+        Returns:
+            Optional[BrowserPool]: The pool, or None when pooling is disabled.
+        """
+        if not self.browser_pool:
+            return None
+        if isinstance(self.browser_pool, BrowserPool):
+            return self.browser_pool
+
+        pool_config = self.browser_pool if isinstance(self.browser_pool, dict) else {}
+        return BrowserPool.get(
+            browser_name=browser_name,
+            headless=self.headless,
+            proxy=self.proxy,
+            launch_kwargs=self.browser_config,
+            **pool_config,
+        )
+
+    async def _ascrape_pooled(
+        self,
+        pool: BrowserPool,
+        url: str,
+        wait_until: str,
+        stealth: bool,
+        scroll_kwargs: Optional[dict] = None,
+    ) -> str:
+        """
+        Scrapes a URL in a fresh context of a pooled browser.
+
+        Args:
+            pool (BrowserPool): The pool providing the browser.
+            url (str): The URL to scrape.
+            wait_until (str): The Playwright load event to wait for in ``goto``.
+            stealth (bool): Whether to apply stealth patches to the context.
+            scroll_kwargs (Optional[dict]): Arguments for ``_scroll_page``;
+                None disables scrolling.
+
+        Returns:
+            str: The scraped HTML content.
+        """
+
+        async def _scrape() -> str:
+            async with pool.page(
+                storage_state=self.storage_state, stealth=stealth
+            ) as page:
+                await self._attach_resource_blocker(page, url)
+                await page.goto(url, wait_until=wait_until)
+                if wait_until != "networkidle":
+                    await page.wait_for_load_state(self.load_state)
+                if scroll_kwargs is not None:
+                    await self._scroll_page(page, url, **scroll_kwargs)
+                return await page.content()
+
+        return await pool.arun(_scrape())
+
+    def scrape_http(self, url: str) -> str:
+        """
+        Fetches a URL with the pooled HTTP client, without running a browser.
+
+        Args:
+            url (str): The URL to fetch.
+
+        Returns:
+            str: The raw HTML content.
+
+        Raises:
+            RuntimeError: When the fetch fails and ``browser_fallback`` is disabled.
+        """
+        logger.info(f"Fetching {url} over HTTP...")
+        try:
+            results = http_fetch(
+                url,
+                timeout=self.timeout,
+                max_body_size=self.max_body_size,
+                proxy=self._get_http_proxy(),
+            )
+        except Exception as e:
+            if not self.browser_fallback:
+                raise RuntimeError(f"Failed to fetch {url} over HTTP: {e}") from e
+            logger.warning(f"HTTP fetch of {url} failed ({e}), using Playwright")
+            return asyncio.run(self.ascrape_playwright(url))
+
+        if not results.strip() and self.browser_fallback:
+            logger.warning(f"HTTP fetch of {url} returned no content, using Playwright")
+            return asyncio.run(self.ascrape_playwright(url))
+        return results
+
+    async def ascrape_http(self, url: str) -> str:
+        """
+        Asynchronously fetches a URL with the pooled HTTP client, without running
+        a browser.
+
+        Args:
+            url (str): The URL to fetch.
+
+        Returns:
+            str: The raw HTML content.
+
+        Raises:
+            RuntimeError: When the fetch fails and ``browser_fallback`` is disabled.
+        """
+        logger.info(f"Fetching {url} over HTTP...")
+        try:
+            results = await ahttp_fetch(
+                url,
+                timeout=self.timeout,
+                max_body_size=self.max_body_size,
+                proxy=self._get_http_proxy(),
+            )
+        except Exception as e:
+            if not self.browser_fallback:
+                raise RuntimeError(f"Failed to fetch {url} over HTTP: {e}") from e
+            logger.warning(f"HTTP fetch of {url} failed ({e}), using Playwright")
+            return await self.ascrape_playwright(url)
+
+        if not results.strip() and self.browser_fallback:
+            logger.warning(f"HTTP fetch of {url} returned no content, using Playwright")
+            return await self.ascrape_playwright(url)
+        return results
+
+    def scrape_auto(self, url: str) -> str:
+        """
+        Fetches a URL over HTTP and renders it with Playwright only if the page
+        needs JavaScript, remembering the decision for its host.
+
+        Args:
+            url (str): The URL to scrape.
+
+        Returns:
+            str: The HTML content.
+        """
+        host = get_host(url)
+        table = HostRenderTable.from_path(self.render_table_path)
+        if table.get(host):
+            return asyncio.run(self.ascrape_with_js_support(url))
+
+        try:
+            results = http_fetch(
+                url,
+                timeout=self.timeout,
+                max_body_size=self.max_body_size,
+                proxy=self._get_http_proxy(),
+            )
+        except Exception as e:
+            logger.warning(f"HTTP fetch of {url} failed ({e}), using Playwright")
+            return asyncio.run(self.ascrape_with_js_support(url))
+
+        needs_js = needs_js_rendering(results)
+        table.set(host, needs_js)
+        if needs_js:
+            logger.info(f"{url} needs JavaScript, using Playwright")
+            return asyncio.run(self.ascrape_with_js_support(url))
+        return results
+
+    async def ascrape_auto(self, url: str) -> str:
+        """
+        Asynchronous counterpart of ``scrape_auto``.
+
+        Args:
+            url (str): The URL to scrape.
+
+        Returns:
+            str: The HTML content.
+        """
+        host = get_host(url)
+        table = HostRenderTable.from_path(self.render_table_path)
+        if table.get(host):
+            return await self.ascrape_with_js_support(url)
+
+        try:
+            results = await ahttp_fetch(
+                url,
+                timeout=self.timeout,
+                max_body_size=self.max_body_size,
+                proxy=self._get_http_proxy(),
+            )
+        except Exception as e:
+            logger.warning(f"HTTP fetch of {url} failed ({e}), using Playwright")
+            return await self.ascrape_with_js_support(url)
+
+        needs_js = await asyncio.to_thread(needs_js_rendering, results)
+        table.set(host, needs_js)
+        if needs_js:
+            logger.info(f"{url} needs JavaScript, using Playwright")
+            return await self.ascrape_with_js_support(url)
+        return results
 
     async def scrape(self, url: str) -> str:
         if self.backend == "playwright":
             return await self.ascrape_playwright(url)
+        elif self.backend == "http":
+            return await self.ascrape_http(url)
+        elif self.backend == "auto":
+            return await self.ascrape_auto(url)
         elif self.backend == "selenium":
             try:
                 return await self.ascrape_undetected_chromedriver(url)
@@ -221,18 +505,33 @@ class ChromiumLoader(BaseLoader):
                 "Scroll value for scrolling scraper must be greater than or equal to 5000."
             )
 
-        import time
-
         from playwright.async_api import async_playwright
         from undetected_playwright import Malenia
 
         logger.info(f"Starting scraping with scrolling support for {url}...")
 
+        pool = self._get_browser_pool(browser_name)
         results = ""
         attempt = 0
+        browser = None
 
         while attempt < self.retry_limit:
             try:
+                if pool is not None:
+                    results = await self._ascrape_pooled(
+                        pool,
+                        url,
+                        wait_until="domcontentloaded",
+                        stealth=True,
+                        scroll_kwargs={
+                            "timeout": timeout,
+                            "scroll": scroll,
+                            "sleep": sleep,
+                            "scroll_to_bottom": scroll_to_bottom,
+                        },
+                    )
+                    break
+
                 async with async_playwright() as p:
                     browser = None
                     if browser_name == "chromium":
@@ -252,58 +551,13 @@ class ChromiumLoader(BaseLoader):
                     context = await browser.new_context()
                     await Malenia.apply_stealth(context)
                     page = await context.new_page()
+                    await self._attach_resource_blocker(page, url)
                     await page.goto(url, wait_until="domcontentloaded")
                     await page.wait_for_load_state(self.load_state)
 
-                    previous_height = None
-                    start_time = time.time()
-
-                    # Store the heights of the page after each scroll
-                    # This is useful in case we scroll with a timer and want to stop shortly after reaching the bottom
-                    # or simly when the page stops changing for some reason.
-                    heights = []
-
-                    while True:
-                        current_height = await page.evaluate(
-                            "document.body.scrollHeight"
-                        )
-                        heights.append(current_height)
-                        heights = heights[
-                            -5:
-                        ]  # Keep only the last 5 heights, to not run out of memory
-
-                        # Break if we've reached the bottom of the page i.e. if scrolling makes no more progress
-                        # Attention!!! This is not always reliable. Sometimes the page might not change due to lazy loading
-                        # or other reasons. In such cases, the user should set scroll_to_bottom=False and set a timeout.
-                        if scroll_to_bottom and previous_height == current_height:
-                            logger.info(f"Reached bottom of page for url {url}")
-                            break
-
-                        previous_height = current_height
-
-                        await page.mouse.wheel(0, scroll)
-                        logger.debug(
-                            f"Scrolled {url} to current height {current_height}px..."
-                        )
-                        time.sleep(
-                            sleep
-                        )  # Allow some time for any lazy-loaded content to load
-
-                        current_time = time.time()
-                        elapsed_time = current_time - start_time
-                        logger.debug(f"Elapsed time: {elapsed_time} seconds")
-
-                        if timeout:
-                            if elapsed_time >= timeout:
-                                logger.info(
-                                    f"Reached timeout of {timeout} seconds for url {url}"
-                                )
-                                break
-                            elif len(heights) == 5 and len(set(heights)) == 1:
-                                logger.info(
-                                    f"Page height has not changed for url {url} for the last 5 scrolls. Stopping."
-                                )
-                                break
+                    await self._scroll_page(
+                        page, url, timeout, scroll, sleep, scroll_to_bottom
+                    )
 
                     results = await page.content()
                     break
@@ -316,10 +570,69 @@ class ChromiumLoader(BaseLoader):
                         f"Error: Network error after {self.retry_limit} attempts - {e}"
                     )
             finally:
-                await browser.close()
+                if browser is not None:
+                    await browser.close()
+                    browser = None
 
         return results
 
+    async def _scroll_page(
+        self,
+        page,
+        url: str,
+        timeout: Union[int, None],
+        scroll: int,
+        sleep: float,
+        scroll_to_bottom: bool,
+    ):
+        """
+        Scrolls an already loaded page until the bottom is reached, the page height
+        stops changing or the scrolling timeout expires.
+        See ``ascrape_playwright_scroll`` for the meaning of the arguments.
+        """
+        previous_height = None
+        start_time = time.time()
+
+        # Store the heights of the page after each scroll
+        # This is useful in case we scroll with a timer and want to stop shortly after reaching the bottom
+        # or simly when the page stops changing for some reason.
+        heights = []
+
+        while True:
+            current_height = await page.evaluate("document.body.scrollHeight")
+            heights.append(current_height)
+            heights = heights[
+                -5:
+            ]  # Keep only the last 5 heights, to not run out of memory
+
+            # Break if we've reached the bottom of the page i.e. if scrolling makes no more progress
+            # Attention!!! This is not always reliable. Sometimes the page might not change due to lazy loading
+            # or other reasons. In such cases, the user should set scroll_to_bottom=False and set a timeout.
+            if scroll_to_bottom and previous_height == current_height:
+                logger.info(f"Reached bottom of page for url {url}")
+                break
+
+            previous_height = current_height
+
+            await page.mouse.wheel(0, scroll)
+            logger.debug(f"Scrolled {url} to current height {current_height}px...")
+            # Allow some time for any lazy-loaded content to load
+            await asyncio.sleep(sleep)
+
+            current_time = time.time()
+            elapsed_time = current_time - start_time
+            logger.debug(f"Elapsed time: {elapsed_time} seconds")
+
+            if timeout:
+                if elapsed_time >= timeout:
+                    logger.info(f"Reached timeout of {timeout} seconds for url {url}")
+                    break
+                elif len(heights) == 5 and len(set(heights)) == 1:
+                    logger.info(
+                        f"Page height has not changed for url {url} for the last 5 scrolls. Stopping."
+                    )
+                    break
+
     async def ascrape_playwright(self, url: str, browser_name: str = "chromium") -> str:
         """
         Asynchronously scrape the content of a given URL using Playwright's async API.
@@ -338,11 +651,20 @@ class ChromiumLoader(BaseLoader):
         from undetected_playwright import Malenia
 
         logger.info(f"Starting scraping with {self.backend}...")
+        pool = self._get_browser_pool(browser_name)
         results = ""
         attempt = 0
 
         while attempt < self.retry_limit:
             try:
+                if pool is not None:
+                    async with async_timeout.timeout(self.timeout):
+                        results = await self._ascrape_pooled(
+                            pool, url, wait_until="domcontentloaded", stealth=True
+                        )
+                    logger.info("Content scraped")
+                    return results
+
                 async with async_playwright() as p, async_timeout.timeout(self.timeout):
                     browser = None
                     if browser_name == "chromium":
@@ -364,6 +686,7 @@ class ChromiumLoader(BaseLoader):
                     )
                     await Malenia.apply_stealth(context)
                     page = await context.new_page()
+                    await self._attach_resource_blocker(page, url)
                     await page.goto(url, wait_until="domcontentloaded")
                     await page.wait_for_load_state(self.load_state)
                     results = await page.content()
@@ -397,10 +720,20 @@ class ChromiumLoader(BaseLoader):
         from playwright.async_api import async_playwright
 
         logger.info(f"Starting scraping with JavaScript support for {url}...")
+        pool = self._get_browser_pool(browser_name)
         attempt = 0
+        browser = None
 
         while attempt < self.retry_limit:
             try:
+                if pool is not None:
+                    async with async_timeout.timeout(self.timeout):
+                        results = await self._ascrape_pooled(
+                            pool, url, wait_until="networkidle", stealth=False
+                        )
+                    logger.info("Content scraped after JavaScript rendering")
+                    return results
+
                 async with async_playwright() as p, async_timeout.timeout(self.timeout):
                     browser = None
                     if browser_name == "chromium":
@@ -421,6 +754,7 @@ class ChromiumLoader(BaseLoader):
                         storage_state=self.storage_state
                     )
                     page = await context.new_page()
+                    await self._attach_resource_blocker(page, url)
                     await page.goto(url, wait_until="networkidle")
                     results = await page.content()
                     logger.info("Content scraped after JavaScript rendering")
@@ -433,7 +767,9 @@ class ChromiumLoader(BaseLoader):
                         f"Failed to scrape after {self.retry_limit} attempts: {str(e)}"
                     )
             finally:
-                await browser.close()
+                if browser is not None:
+                    await browser.close()
+                    browser = None
 
     def lazy_load(self) -> Iterator[Document]:
         """
@@ -445,6 +781,13 @@ class ChromiumLoader(BaseLoader):
         Yields:
             Document: The scraped content encapsulated within a Document object.
         """
+        if self.backend in ("http", "auto") and not self.requires_js_support:
+            # the pooled client is synchronous: no event loop per URL
+            scrape_fn = getattr(self, f"scrape_{self.backend}")
+            for url in self.urls:
+                yield self._make_document(url, scrape_fn(url))
+            return
+
         scraping_fn = (
             self.ascrape_with_js_support
             if self.requires_js_support
@@ -453,8 +796,7 @@ class ChromiumLoader(BaseLoader):
 
         for url in self.urls:
             html_content = asyncio.run(scraping_fn(url))
-            metadata = {"source": url}
-            yield Document(page_content=html_content, metadata=metadata)
+            yield self._make_document(url, html_content)
 
     async def alazy_load(self) -> AsyncIterator[Document]:
         """
@@ -478,5 +820,4 @@ class ChromiumLoader(BaseLoader):
         tasks = [scraping_fn(url) for url in self.urls]
         results = await asyncio.gather(*tasks)
         for url, content in zip(self.urls, results):
-            metadata = {"source": url}
-            yield Document(page_content=content, metadata=metadata)
+            yield self._make_document(url, content)
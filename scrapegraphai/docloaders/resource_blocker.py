@@ -0,0 +1,167 @@
+"""
+resource_blocker module
+"""
+
+from collections import Counter
+from typing import Any, Iterable, Optional, Union
+from urllib.parse import urlsplit
+
+DEFAULT_BLOCKED_RESOURCE_TYPES = ("image", "media", "font", "stylesheet")
+DEFAULT_BLOCKED_DOMAINS = (
+    "doubleclick.net",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googletagservices.com",
+    "adservice.google.com",
+    "amazon-adsystem.com",
+    "adnxs.com",
+    "criteo.com",
+    "criteo.net",
+    "taboola.com",
+    "outbrain.com",
+    "scorecardresearch.com",
+    "quantserve.com",
+    "connect.facebook.net",
+    "hotjar.com",
+    "clarity.ms",
+    "segment.io",
+    "mixpanel.com",
+)
+
+
+class ResourceStats:
+    """
+    Requests blocked and loaded while a page was loading.
+
+    Aborted requests never download anything, so only the bytes of the loaded
+    responses (from their Content-Length) are known.
+
+    Attributes:
+        blocked_requests (int): Number of requests aborted.
+        blocked_by_type (Counter): Aborted requests per resource type.
+        loaded_requests (int): Number of responses received.
+        loaded_bytes (int): Declared size of the responses received.
+    """
+
+    def __init__(self):
+        self.blocked_requests = 0
+        self.blocked_by_type: Counter = Counter()
+        self.loaded_requests = 0
+        self.loaded_bytes = 0
+
+    def as_dict(self) -> dict:
+        return {
+            "blocked_requests": self.blocked_requests,
+            "blocked_by_type": dict(self.blocked_by_type),
+            "loaded_requests": self.loaded_requests,
+            "loaded_bytes": self.loaded_bytes,
+        }
+
+
+class ResourceBlocker:
+    """
+    Request-interception policy aborting the subresources a Playwright page does
+    not need for text extraction: heavy resource types and ad or analytics domains.
+    The page document itself is never blocked.
+
+    Attributes:
+        resource_types (frozenset): Playwright resource types to abort.
+        domains (frozenset): Domains to abort, subdomains included.
+
+    Example:
+        >>> blocker = ResourceBlocker.from_config({"resource_types": ["image"]})
+        >>> stats = await blocker.attach(page)
+        >>> await page.goto(url)
+        >>> stats.blocked_requests
+        12
+    """
+
+    def __init__(
+        self,
+        resource_types: Iterable[str] = DEFAULT_BLOCKED_RESOURCE_TYPES,
+        domains: Iterable[str] = DEFAULT_BLOCKED_DOMAINS,
+    ):
+        self.resource_types = frozenset(resource_types)
+        self.domains = frozenset(domain.lower().lstrip(".") for domain in domains)
+
+    @classmethod
+    def from_config(
+        cls, config: Union[bool, dict, "ResourceBlocker", None]
+    ) -> Optional["ResourceBlocker"]:
+        """
+        Builds the policy described by the ``block_resources`` loader option.
+
+        Args:
+            config: False/None disables blocking, True blocks the default resource
+                types and domains, a dict overrides them with its
+                ``resource_types`` and ``domains`` keys (``extra_domains`` extends
+                the default domains), and a ResourceBlocker is used as is.
+
+        Returns:
+            Optional[ResourceBlocker]: The policy, or None when blocking is disabled.
+        """
+        if not config:
+            return None
+        if isinstance(config, ResourceBlocker):
+            return config
+        if not isinstance(config, dict):
+            return cls()
+
+        domains = list(config.get("domains", DEFAULT_BLOCKED_DOMAINS))
+        domains.extend(config.get("extra_domains", []))
+        return cls(
+            resource_types=config.get("resource_types", DEFAULT_BLOCKED_RESOURCE_TYPES),
+            domains=domains,
+        )
+
+    def is_blocked_domain(self, url: str) -> bool:
+        """
+        Tells whether a URL belongs to a blocked domain or one of its subdomains.
+        """
+        try:
+            host = (urlsplit(url).hostname or "").lower()
+        except ValueError:
+            return False
+        labels = host.split(".")
+        return any(".".join(labels[i:]) in self.domains for i in range(len(labels) - 1))
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        """
+        Tells whether a request of the given resource type to a URL is aborted.
+        """
+        if resource_type == "document":
+            return False
+        return resource_type in self.resource_types or self.is_blocked_domain(url)
+
+    async def attach(self, page: Any) -> ResourceStats:
+        """
+        Installs the policy on a Playwright page before it navigates.
+
+        Args:
+            page: The Playwright page.
+
+        Returns:
+            ResourceStats: The counters, updated while the page loads.
+        """
+        stats = ResourceStats()
+
+        async def _route(route):
+            request = route.request
+            if self.should_block(request.resource_type, request.url):
+                stats.blocked_requests += 1
+                stats.blocked_by_type[request.resource_type] += 1
+                await route.abort()
+            else:
+                await route.continue_()
+
+        def _on_response(response):
+            stats.loaded_requests += 1
+            length = response.headers.get("content-length", "")
+            if length.isdigit():
+                stats.loaded_bytes += int(length)
+
+        page.on("response", _on_response)
+        await page.route("**/*", _route)
+        return stats
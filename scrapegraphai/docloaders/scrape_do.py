@@ -2,17 +2,21 @@
 Scrape_do module
 """
 
+import os
 import urllib.parse
 
-import requests
-import os
-import urllib3
+from ..utils.http_client import get_http_client
 
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+DEFAULT_SCRAPE_DO_TIMEOUT = 60
 
 
 def scrape_do_fetch(
-    token, target_url, use_proxy=False, geoCode=None, super_proxy=False
+    token,
+    target_url,
+    use_proxy=False,
+    geoCode=None,
+    super_proxy=False,
+    timeout=DEFAULT_SCRAPE_DO_TIMEOUT,
 ):
     """
     Fetches the IP address of the machine associated with the given URL using Scrape.do.
@@ -24,6 +28,7 @@ def scrape_do_fetch(
         geoCode (str, optional): Specify the country code for
         geolocation-based proxies. Default is None.
         super_proxy (bool): If True, use Residential & Mobile Proxy Networks. Default is False.
+        timeout (float): Timeout in seconds of each network operation. Default is 60.
 
     Returns:
         str: The raw response from the target URL.
@@ -32,19 +37,14 @@ def scrape_do_fetch(
     if use_proxy:
         proxy_scrape_do_url = os.getenv("PROXY_SCRAPE_DO_URL", "proxy.scrape.do:8080")
         proxy_mode_url = f"http://{token}:@{proxy_scrape_do_url}"
-        proxies = {
-            "http": proxy_mode_url,
-            "https": proxy_mode_url,
-        }
         params = (
             {"geoCode": geoCode, "super": str(super_proxy).lower()} if geoCode else {}
         )
-        response = requests.get(
-            target_url, proxies=proxies, verify=False, params=params
-        )
+        client = get_http_client(proxy=proxy_mode_url, verify=False)
+        response = client.get(target_url, params=params, timeout=timeout)
     else:
         api_scrape_do_url = os.getenv("API_SCRAPE_DO_URL", "api.scrape.do")
         url = f"http://{api_scrape_do_url}?token={token}&url={encoded_url}"
-        response = requests.get(url)
+        response = get_http_client().get(url, timeout=timeout)
 
     return response.text
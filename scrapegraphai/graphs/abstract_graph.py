@@ -3,10 +3,11 @@ AbstractGraph Module
 """
 
 import asyncio
+import re
 import uuid
 import warnings
 from abc import ABC, abstractmethod
-from typing import Optional, Type
+from typing import Any, AsyncIterator, Iterator, Optional, Tuple, Type
 
 from langchain.chat_models import init_chat_model
 from langchain_core.rate_limiters import InMemoryRateLimiter
@@ -14,7 +15,16 @@ from pydantic import BaseModel
 
 from ..helpers import models_tokens
 from ..models import DeepSeek, OneApi
+from ..nodes import GraphIteratorNode, ParseNode
+from ..utils.async_map import DEFAULT_MAX_CONCURRENCY, DEFAULT_MAX_RETRIES, iter_sync
+from ..utils.boilerplate import create_boilerplate_store
+from ..utils.checkpoint import create_checkpoint_store
+from ..utils.fetch_cache import DEFAULT_CACHE_MAX_SIZE, DEFAULT_CACHE_TTL
+from ..utils.jsonl_sink import JSONLSink
+from ..utils.llm_cache import create_llm_cache
 from ..utils.logging import set_verbosity_info, set_verbosity_warning
+from ..utils.process_pool import create_parse_executor
+from ..utils.tree_reduce import concat_answers
 
 
 class AbstractGraph(ABC):
@@ -46,6 +56,13 @@ class AbstractGraph(ABC):
         >>> result = my_graph.run()
     """
 
+    # the key of the state receiving the source, None for graphs without one
+    input_key: Optional[str] = None
+    # the key of the final state holding the answer, and the answer when it is
+    # missing; graphs declaring it are run natively on the event loop by ``arun``
+    answer_key: Optional[str] = None
+    no_answer: str = "No answer found."
+
     def __init__(
         self,
         prompt: str,
@@ -65,6 +82,14 @@ class AbstractGraph(ABC):
         self.headless = True if self.config is None else config.get("headless", True)
         self.loader_kwargs = self.config.get("loader_kwargs", {})
         self.cache_path = self.config.get("cache_path", False)
+        self.cache_ttl = self.config.get("cache_ttl", DEFAULT_CACHE_TTL)
+        self.cache_max_size = self.config.get("cache_max_size", DEFAULT_CACHE_MAX_SIZE)
+        self.llm_cache = create_llm_cache(self.config.get("llm_cache"))
+        self.boilerplate_store = create_boilerplate_store(
+            self.config.get("boilerplate_filter")
+        )
+        self.checkpoint_store = create_checkpoint_store(self.config.get("checkpoint"))
+        self.parse_executor = create_parse_executor(self.config.get("parse_executor"))
         self.browser_base = self.config.get("browser_base")
         self.scrape_do = self.config.get("scrape_do")
         self.storage_state = self.config.get("storage_state")
@@ -87,10 +112,22 @@ class AbstractGraph(ABC):
             "loader_kwargs": self.loader_kwargs,
             "llm_model": self.llm_model,
             "cache_path": self.cache_path,
+            "cache_ttl": self.cache_ttl,
+            "cache_max_size": self.cache_max_size,
+            "llm_cache": self.llm_cache,
+            "boilerplate_store": self.boilerplate_store,
+            "checkpoint_store": self.checkpoint_store,
+            "parse_executor": self.parse_executor,
             "timeout": self.timeout,
+            "max_concurrency": self.config.get(
+                "max_concurrency", DEFAULT_MAX_CONCURRENCY
+            ),
+            "chunk_retries": self.config.get("chunk_retries", DEFAULT_MAX_RETRIES),
+            "model_token": getattr(self, "model_token", None),
         }
 
         self.set_common_params(common_params, overwrite=True)
+        self._plan_token_budgets()
 
         self.burr_kwargs = config.get("burr_kwargs", None)
         if self.burr_kwargs is not None:
@@ -100,6 +137,12 @@ class AbstractGraph(ABC):
 
             self.graph.burr_config = self.burr_kwargs
 
+        parallel_execution = config.get("parallel_execution")
+        if parallel_execution:
+            self.graph.parallel = True
+            if isinstance(parallel_execution, dict):
+                self.graph.max_workers = parallel_execution.get("max_workers")
+
     def set_common_params(self, params: dict, overwrite=False):
         """
         Pass parameters to every node in the graph unless otherwise defined in the graph.
@@ -111,6 +154,27 @@ class AbstractGraph(ABC):
         for node in self.graph.nodes:
             node.update_config(params, overwrite)
 
+    def _plan_token_budgets(self):
+        """
+        Gives the ParseNodes of the graph the token budget of the prompts their
+        chunks are answered with, so that the chunks are as large as the context
+        window of the model allows. ParseNodes of graphs without such a node, or
+        with an explicit budget, are left untouched.
+        """
+        model_token = getattr(self, "model_token", None)
+        nodes = getattr(self.graph, "nodes", None)
+        if not model_token or not nodes:
+            return
+
+        answer_node = next(
+            (node for node in nodes if hasattr(node, "plan_token_budget")), None
+        )
+        if answer_node is None:
+            return
+        for node in nodes:
+            if isinstance(node, ParseNode) and node.token_budget is None:
+                node.token_budget = answer_node.plan_token_budget(model_token)
+
     def _create_llm(self, llm_config: dict) -> object:
         """
         Create a large language model instance based on the configuration provided.
@@ -304,12 +368,45 @@ class AbstractGraph(ABC):
         Abstract method to create a graph representation.
         """
 
+    def _graph_inputs(self) -> dict:
+        """
+        Returns the initial state of the graph: the prompt and the source under
+        the input key.
+        """
+        inputs = {"user_prompt": self.prompt}
+        if self.input_key is not None:
+            inputs[self.input_key] = self.source
+        return inputs
+
+    def _graph_answer(self) -> Any:
+        """
+        Returns the result of a run from the final state.
+        """
+        return self.final_state.get(self.answer_key, self.no_answer)
+
     @abstractmethod
     def run(self) -> str:
         """
         Abstract method to execute the graph and return the result.
         """
 
+    async def arun(self) -> str:
+        """
+        Asynchronous counterpart of ``run``, executing the graph on the running
+        event loop. Graphs without an ``answer_key`` run ``run`` in the default
+        executor.
+
+        Returns:
+            str: The answer to the prompt.
+        """
+        if self.answer_key is None:
+            return await self.run_safe_async()
+
+        self.final_state, self.execution_info = await self.graph.aexecute(
+            self._graph_inputs()
+        )
+        return self._graph_answer()
+
     async def run_safe_async(self) -> str:
         """
         Executes the run process asynchronously safety.
@@ -320,3 +417,118 @@ class AbstractGraph(ABC):
 
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, self.run)
+
+    def _get_iterator_node(self) -> GraphIteratorNode:
+        """
+        Returns the node running a sub-graph per source.
+
+        Raises:
+            TypeError: If the graph does not run over several sources.
+        """
+        for node in getattr(self.graph, "nodes", None) or []:
+            if isinstance(node, GraphIteratorNode):
+                return node
+        raise TypeError(f"{type(self).__name__} does not run over several sources")
+
+    async def _astate_before(self, node) -> dict:
+        """
+        Returns the state reaching a node: the prompt and the sources when the
+        node is the entry point, otherwise the state left by the nodes before it.
+        """
+        state = {"user_prompt": self.prompt}
+        if self.graph.entry_point == node.node_name:
+            sources_key = next(
+                key for key in re.findall(r"\w+", node.input) if key != "user_prompt"
+            )
+            state[sources_key] = self.source
+            return state
+
+        state, _ = await self.graph._aexecute_standard(state, stop_at=node.node_name)
+        return state
+
+    async def arun_iter(
+        self, merge: bool = False, sink: Optional[str] = None
+    ) -> AsyncIterator[Tuple[str, Any, list]]:
+        """
+        Runs a graph over several sources and yields the result of each source
+        as soon as its sub-graph completes, instead of waiting for all of them.
+
+        With ``merge``, answers of schemas made of lists are concatenated into
+        ``final_state["answer"]`` as they arrive, and the nodes following the
+        sub-graphs (e.g. MergeAnswersNode) run once every source is done, setting
+        ``final_state`` as ``run`` does. With ``sink``, every result is appended
+        to a JSONL file as soon as it completes.
+
+        Args:
+            merge (bool): Whether to merge the answers.
+            sink (Optional[str]): The JSONL file the results are appended to.
+
+        Yields:
+            Tuple[str, Any, list]: The source, its answer and the execution info
+            of its sub-graph, in completion order.
+
+        Raises:
+            TypeError: If the graph does not run over several sources.
+
+        Example:
+            >>> graph = SmartScraperMultiGraph(prompt, urls, config)
+            >>> async for source, answer, exec_info in graph.arun_iter(sink="out.jsonl"):
+            ...     print(source, answer)
+        """
+        iterator_node = self._get_iterator_node()
+        state = await self._astate_before(iterator_node)
+        user_prompt, sources = (
+            state[key] for key in iterator_node.get_input_keys(state)
+        )
+        sources = list(sources)
+        order = {}
+        for index, source in enumerate(sources):
+            order.setdefault(source, index)
+
+        results = []
+        merged, concatenable = None, merge
+        writer = JSONLSink(sink) if sink else None
+        try:
+            async for source, answer, exec_info in iterator_node.aiter_results(
+                user_prompt, sources
+            ):
+                if writer is not None:
+                    writer.write(
+                        {"source": source, "answer": answer, "exec_info": exec_info}
+                    )
+                results.append((source, answer))
+                if concatenable:
+                    parts = [answer] if merged is None else [merged, answer]
+                    merged = concat_answers(parts, self.schema)
+                    concatenable = merged is not None
+                    if concatenable:
+                        self.final_state = {**state, "answer": merged}
+                yield source, answer, exec_info
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if not merge:
+            return
+        results.sort(key=lambda result: order.get(result[0], len(order)))
+        state[iterator_node.output[0]] = [answer for _, answer in results]
+        next_node = self.graph.edges.get(iterator_node.node_name)
+        if next_node:
+            self.final_state, self.execution_info = await self.graph._aexecute_standard(
+                state, entry_point=next_node
+            )
+        else:
+            self.final_state = state
+
+    def run_iter(
+        self, merge: bool = False, sink: Optional[str] = None
+    ) -> Iterator[Tuple[str, Any, list]]:
+        """
+        Synchronous counterpart of ``arun_iter``; the sub-graphs keep running in
+        a worker thread while the caller processes each result.
+
+        Raises:
+            TypeError: If the graph does not run over several sources.
+        """
+        self._get_iterator_node()
+        return iter_sync(self.arun_iter(merge=merge, sink=sink))
@@ -2,12 +2,19 @@
 base_graph module
 """
 
+import asyncio
+import contextvars
+import re
 import time
 import warnings
-from typing import Tuple
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from typing import Dict, List, Optional, Set, Tuple
 
 from ..telemetry import log_graph_execution
 from ..utils import CustomLLMCallbackManager
+from ..utils.llm_cache import track_llm_cache_stats
 
 
 class BaseGraph:
@@ -18,13 +25,22 @@ class BaseGraph:
         nodes (list): A dictionary mapping each node's name to its corresponding node instance.
         edges (list): A dictionary representing the directed edges of the graph where each
                       key-value pair corresponds to the from-node and to-node relationship.
+        successors (dict): A dictionary mapping each node's name to the names of all the
+                           nodes it has an edge to, in declaration order.
         entry_point (str): The name of the entry point node from which the graph execution begins.
+        parallel (bool): Whether independent nodes are executed concurrently.
+        max_workers (Optional[int]): The maximum number of nodes running at the same time
+                                     in parallel mode.
 
     Args:
         nodes (iterable): An iterable of node instances that will be part of the graph.
         edges (iterable): An iterable of tuples where each tuple represents a directed edge
                           in the graph, defined by a pair of nodes (from_node, to_node).
         entry_point (BaseNode): The node instance that represents the entry point of the graph.
+        parallel (bool): Whether to run the nodes whose inputs are ready concurrently.
+            A node waits for the ancestors whose declared output keys it reads or writes,
+            whose input keys it overwrites, and for every ConditionalNode above it.
+        max_workers (Optional[int]): The size of the thread pool used in parallel mode.
 
     Raises:
         Warning: If the entry point node is not the first node in the list.
@@ -56,10 +72,13 @@ class BaseGraph:
         use_burr: bool = False,
         burr_config: dict = None,
         graph_name: str = "Custom",
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
     ):
         self.nodes = nodes
         self.raw_edges = edges
         self.edges = self._create_edges(set(edges))
+        self.successors = self._create_successors(edges)
         self.entry_point = entry_point.node_name
         self.graph_name = graph_name
         self.initial_state = {}
@@ -75,6 +94,9 @@ class BaseGraph:
         self.use_burr = use_burr
         self.burr_config = burr_config or {}
 
+        self.parallel = parallel
+        self.max_workers = max_workers
+
     def _create_edges(self, edges: list) -> dict:
         """
         Helper method to create a dictionary of edges from the given iterable of tuples.
@@ -92,6 +114,28 @@ class BaseGraph:
                 edge_dict[from_node.node_name] = to_node.node_name
         return edge_dict
 
+    def _create_successors(self, edges: list) -> Dict[str, List[str]]:
+        """
+        Helper method to create a dictionary of all the successors of each node,
+        keeping fan-out edges and the declaration order.
+
+        Args:
+            edges (iterable): An iterable of tuples representing the directed edges.
+
+        Returns:
+            dict: A dictionary with the node names as keys and the lists of
+                  successor names as values.
+        """
+
+        successors = {node.node_name: [] for node in self.nodes}
+        for from_node, to_node in edges:
+            if to_node is None:
+                continue
+            names = successors.setdefault(from_node.node_name, [])
+            if to_node.node_name not in names:
+                names.append(to_node.node_name)
+        return successors
+
     def _set_conditional_node_edges(self):
         """
         Sets the true_node_name and false_node_name for each ConditionalNode.
@@ -190,27 +234,61 @@ class BaseGraph:
         except Exception:
             return None
 
-    def _execute_node(self, current_node, state, llm_model, llm_model_name):
+    def _build_cb_data(self, current_node, cb, cache_stats, node_exec_time):
+        """Builds the execution info row of a node from its callback."""
+        if cb is None:
+            return None
+        return {
+            "node_name": current_node.node_name,
+            "total_tokens": cb.total_tokens,
+            "prompt_tokens": cb.prompt_tokens,
+            "completion_tokens": cb.completion_tokens,
+            "successful_requests": cb.successful_requests,
+            "total_cost_USD": cb.total_cost,
+            "cache_hits": cache_stats.hits,
+            "cache_misses": cache_stats.misses,
+            "exec_time": node_exec_time,
+        }
+
+    def _execute_node(
+        self, current_node, state, llm_model, llm_model_name, callback_context=None
+    ):
         """Executes a single node and returns execution information."""
         curr_time = time.time()
 
-        with self.callback_manager.exclusive_get_callback(
-            llm_model, llm_model_name
-        ) as cb:
+        if callback_context is None:
+            callback_context = self.callback_manager.exclusive_get_callback(
+                llm_model, llm_model_name
+            )
+
+        with (
+            callback_context as cb,
+            track_llm_cache_stats() as cache_stats,
+        ):
             result = current_node.execute(state)
             node_exec_time = time.time() - curr_time
+            cb_data = self._build_cb_data(current_node, cb, cache_stats, node_exec_time)
 
-            cb_data = None
-            if cb is not None:
-                cb_data = {
-                    "node_name": current_node.node_name,
-                    "total_tokens": cb.total_tokens,
-                    "prompt_tokens": cb.prompt_tokens,
-                    "completion_tokens": cb.completion_tokens,
-                    "successful_requests": cb.successful_requests,
-                    "total_cost_USD": cb.total_cost,
-                    "exec_time": node_exec_time,
-                }
+        return result, node_exec_time, cb_data
+
+    async def _aexecute_node(
+        self, current_node, state, llm_model, llm_model_name, callback_context=None
+    ):
+        """Asynchronously executes a single node and returns execution information."""
+        curr_time = time.time()
+
+        if callback_context is None:
+            callback_context = self.callback_manager.exclusive_get_callback(
+                llm_model, llm_model_name
+            )
+
+        with (
+            callback_context as cb,
+            track_llm_cache_stats() as cache_stats,
+        ):
+            result = await current_node.aexecute(state)
+            node_exec_time = time.time() - curr_time
+            cb_data = self._build_cb_data(current_node, cb, cache_stats, node_exec_time)
 
         return result, node_exec_time, cb_data
 
@@ -235,110 +313,337 @@ class BaseGraph:
         """
         current_node_name = self.entry_point
         state = initial_state
-
-        total_exec_time = 0.0
-        exec_info = []
-        cb_total = {
-            "total_tokens": 0,
-            "prompt_tokens": 0,
-            "completion_tokens": 0,
-            "successful_requests": 0,
-            "total_cost_USD": 0.0,
-        }
-
-        start_time = time.time()
-        error_node = None
-        source_type = None
-        llm_model = None
-        llm_model_name = None
-        embedder_model = None
-        source = []
-        prompt = None
-        schema = None
+        tracker = _ExecutionTracker(self)
 
         while current_node_name:
             current_node = self._get_node_by_name(current_node_name)
+            tracker.inspect(current_node, state)
 
-            if source_type is None:
-                source_type, source, prompt = self._update_source_info(
-                    current_node, state
+            try:
+                result, node_exec_time, cb_data = self._execute_node(
+                    current_node, state, tracker.llm_model, tracker.llm_model_name
                 )
+                tracker.record(node_exec_time, cb_data)
 
-            if llm_model is None:
-                llm_model, llm_model_name, embedder_model = self._get_model_info(
-                    current_node
-                )
+                current_node_name = self._get_next_node(current_node, result)
 
-            if schema is None:
-                schema = self._get_schema(current_node)
+            except Exception as e:
+                tracker.log_error(current_node.node_name, e)
+                raise e
+
+        return state, tracker.finish(state)
+
+    async def _aexecute_standard(
+        self,
+        initial_state: dict,
+        entry_point: Optional[str] = None,
+        stop_at: Optional[str] = None,
+    ) -> Tuple[dict, list]:
+        """
+        Asynchronously executes the graph by traversing nodes
+        starting from the entry point using the standard method.
+
+        ``entry_point`` starts the traversal at another node and ``stop_at``
+        ends it right before the given node, to run a part of the graph.
+        """
+        current_node_name = entry_point or self.entry_point
+        state = initial_state
+        tracker = _ExecutionTracker(self)
+
+        while current_node_name and current_node_name != stop_at:
+            current_node = self._get_node_by_name(current_node_name)
+            tracker.inspect(current_node, state)
 
             try:
-                result, node_exec_time, cb_data = self._execute_node(
-                    current_node, state, llm_model, llm_model_name
+                result, node_exec_time, cb_data = await self._aexecute_node(
+                    current_node, state, tracker.llm_model, tracker.llm_model_name
                 )
-                total_exec_time += node_exec_time
-
-                if cb_data:
-                    exec_info.append(cb_data)
-                    for key in cb_total:
-                        cb_total[key] += cb_data[key]
+                tracker.record(node_exec_time, cb_data)
 
                 current_node_name = self._get_next_node(current_node, result)
 
             except Exception as e:
-                error_node = current_node.node_name
-                graph_execution_time = time.time() - start_time
-                log_graph_execution(
-                    graph_name=self.graph_name,
-                    source=source,
-                    prompt=prompt,
-                    schema=schema,
-                    llm_model=llm_model_name,
-                    embedder_model=embedder_model,
-                    source_type=source_type,
-                    execution_time=graph_execution_time,
-                    error_node=error_node,
-                    exception=str(e),
-                )
+                tracker.log_error(current_node.node_name, e)
                 raise e
 
-        exec_info.append(
-            {
-                "node_name": "TOTAL RESULT",
-                "total_tokens": cb_total["total_tokens"],
-                "prompt_tokens": cb_total["prompt_tokens"],
-                "completion_tokens": cb_total["completion_tokens"],
-                "successful_requests": cb_total["successful_requests"],
-                "total_cost_USD": cb_total["total_cost_USD"],
-                "exec_time": total_exec_time,
-            }
-        )
+        return state, tracker.finish(state)
 
-        graph_execution_time = time.time() - start_time
-        response = state.get("answer", None) if source_type == "url" else None
-        content = state.get("parsed_doc", None) if response is not None else None
+    @staticmethod
+    def _get_node_keys(node) -> Tuple[Set[str], Set[str]]:
+        """Returns the state keys a node declares to read and to write."""
+        reads = set(re.findall(r"[^\s&|()]+", node.input or ""))
+        writes = set(node.output or [])
+        return reads, writes
 
-        log_graph_execution(
-            graph_name=self.graph_name,
-            source=source,
-            prompt=prompt,
-            schema=schema,
-            llm_model=llm_model_name,
-            embedder_model=embedder_model,
-            source_type=source_type,
-            content=content,
-            response=response,
-            execution_time=graph_execution_time,
-            total_tokens=(
-                cb_total["total_tokens"] if cb_total["total_tokens"] > 0 else None
-            ),
+    def _plan_parallel_execution(self):
+        """
+        Computes the topological order of the nodes reachable from the entry point,
+        their predecessors and the nodes each of them has to wait for.
+
+        Returns:
+            Optional[tuple]: (order, predecessors, dependencies), or None if the
+            reachable part of the graph contains a cycle.
+        """
+        reachable = []
+        stack = [self.entry_point]
+        while stack:
+            name = stack.pop()
+            if name in reachable:
+                continue
+            reachable.append(name)
+            stack.extend(self.successors.get(name, []))
+
+        predecessors = {name: [] for name in reachable}
+        for name in reachable:
+            for succ in self.successors.get(name, []):
+                predecessors[succ].append(name)
+
+        in_degree = {name: len(predecessors[name]) for name in reachable}
+        queue = deque(name for name in reachable if in_degree[name] == 0)
+        order = []
+        while queue:
+            name = queue.popleft()
+            order.append(name)
+            for succ in self.successors.get(name, []):
+                in_degree[succ] -= 1
+                if in_degree[succ] == 0:
+                    queue.append(succ)
+
+        if len(order) != len(reachable):
+            return None
+
+        ancestors = {}
+        for name in order:
+            ancestors[name] = set(predecessors[name])
+            for pred in predecessors[name]:
+                ancestors[name] |= ancestors[pred]
+
+        keys = {
+            name: self._get_node_keys(self._get_node_by_name(name)) for name in order
+        }
+        dependencies = {}
+        for name in order:
+            reads, writes = keys[name]
+            dependencies[name] = set()
+            for ancestor in ancestors[name]:
+                ancestor_reads, ancestor_writes = keys[ancestor]
+                if (
+                    self._get_node_by_name(ancestor).node_type == "conditional_node"
+                    or ancestor_writes & (reads | writes)
+                    or ancestor_reads & writes
+                ):
+                    dependencies[name].add(ancestor)
+
+        return order, predecessors, dependencies
+
+    @staticmethod
+    def _get_state_changes(snapshot: dict, result) -> dict:
+        """Returns the keys a node added or replaced in its copy of the state."""
+        if not isinstance(result, dict):
+            return {}
+        return {
+            key: value
+            for key, value in result.items()
+            if key not in snapshot or snapshot[key] is not value
+        }
+
+    def _get_parallel_callback(self, llm_model, llm_model_name, use_callback):
+        """Returns the callback context of a node run in parallel mode."""
+        if use_callback:
+            return self.callback_manager.get_callback(llm_model, llm_model_name)
+        return nullcontext()
+
+    def _execute_parallel_node(
+        self, current_node, state, llm_model, llm_model_name, use_callback
+    ):
+        """
+        Executes a node on a copy of the state in a worker thread and returns
+        its execution information along with the state keys it changed.
+        """
+        snapshot = dict(state)
+        result, node_exec_time, cb_data = self._execute_node(
+            current_node,
+            state,
+            llm_model,
+            llm_model_name,
+            self._get_parallel_callback(llm_model, llm_model_name, use_callback),
+        )
+        return (
+            result,
+            node_exec_time,
+            cb_data,
+            self._get_state_changes(snapshot, result),
+        )
+
+    async def _aexecute_parallel_node(
+        self, current_node, state, llm_model, llm_model_name, use_callback
+    ):
+        """
+        Asynchronously executes a node on a copy of the state and returns
+        its execution information along with the state keys it changed.
+        """
+        snapshot = dict(state)
+        result, node_exec_time, cb_data = await self._aexecute_node(
+            current_node,
+            state,
+            llm_model,
+            llm_model_name,
+            self._get_parallel_callback(llm_model, llm_model_name, use_callback),
         )
+        return (
+            result,
+            node_exec_time,
+            cb_data,
+            self._get_state_changes(snapshot, result),
+        )
+
+    def _complete_parallel_node(self, tracker, schedule, state, current_node, outcome):
+        """Merges the outcome of a node run in parallel mode into the graph run."""
+        result, node_exec_time, cb_data, changes = outcome
+        next_node_name = self._get_next_node(current_node, result)
+        tracker.record(node_exec_time, cb_data)
+        state.update(changes)
+        schedule.complete(current_node, next_node_name)
+
+    def _execute_parallel(self, initial_state: dict) -> Tuple[dict, list]:
+        """
+        Executes the graph by running concurrently every node whose dependencies
+        are satisfied, starting from the entry point.
+        Falls back to the standard method if the graph contains cycles.
+        """
+        plan = self._plan_parallel_execution()
+        if plan is None:
+            warnings.warn(
+                "The graph contains cycles, falling back to sequential execution."
+            )
+            return self._execute_standard(initial_state)
 
-        return state, exec_info
+        state = initial_state
+        tracker = _ExecutionTracker(self)
+        schedule = _ParallelSchedule(self, *plan)
+        for node_name in schedule.order:
+            tracker.inspect(self._get_node_by_name(node_name), state)
+
+        running = {}
+        with (
+            self.callback_manager.exclusive_scope() as use_callback,
+            ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="scrapegraphai-node"
+            ) as executor,
+        ):
+            while True:
+                for node_name in schedule.ready():
+                    context = contextvars.copy_context()
+                    future = executor.submit(
+                        context.run,
+                        self._execute_parallel_node,
+                        self._get_node_by_name(node_name),
+                        dict(state),
+                        tracker.llm_model,
+                        tracker.llm_model_name,
+                        use_callback,
+                    )
+                    running[future] = node_name
+
+                if not running:
+                    schedule.check_finished()
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    current_node = self._get_node_by_name(running.pop(future))
+                    try:
+                        self._complete_parallel_node(
+                            tracker, schedule, state, current_node, future.result()
+                        )
+                    except Exception as e:
+                        for other in running:
+                            other.cancel()
+                        tracker.log_error(current_node.node_name, e)
+                        raise e
+
+        return state, tracker.finish(state)
+
+    async def _aexecute_parallel(self, initial_state: dict) -> Tuple[dict, list]:
+        """
+        Asynchronously executes the graph by running concurrently, as tasks of the
+        running event loop, every node whose dependencies are satisfied.
+        Falls back to the standard method if the graph contains cycles.
+        """
+        plan = self._plan_parallel_execution()
+        if plan is None:
+            warnings.warn(
+                "The graph contains cycles, falling back to sequential execution."
+            )
+            return await self._aexecute_standard(initial_state)
+
+        state = initial_state
+        tracker = _ExecutionTracker(self)
+        schedule = _ParallelSchedule(self, *plan)
+        for node_name in schedule.order:
+            tracker.inspect(self._get_node_by_name(node_name), state)
+
+        semaphore = asyncio.Semaphore(self.max_workers) if self.max_workers else None
+
+        async def _run(current_node, node_state, use_callback):
+            if semaphore is None:
+                return await self._aexecute_parallel_node(
+                    current_node,
+                    node_state,
+                    tracker.llm_model,
+                    tracker.llm_model_name,
+                    use_callback,
+                )
+            async with semaphore:
+                return await self._aexecute_parallel_node(
+                    current_node,
+                    node_state,
+                    tracker.llm_model,
+                    tracker.llm_model_name,
+                    use_callback,
+                )
+
+        running = {}
+        with self.callback_manager.exclusive_scope() as use_callback:
+            try:
+                while True:
+                    for node_name in schedule.ready():
+                        task = asyncio.create_task(
+                            _run(
+                                self._get_node_by_name(node_name),
+                                dict(state),
+                                use_callback,
+                            )
+                        )
+                        running[task] = node_name
+
+                    if not running:
+                        schedule.check_finished()
+                        break
+
+                    done, _ = await asyncio.wait(
+                        running, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        current_node = self._get_node_by_name(running.pop(task))
+                        try:
+                            self._complete_parallel_node(
+                                tracker, schedule, state, current_node, task.result()
+                            )
+                        except Exception as e:
+                            tracker.log_error(current_node.node_name, e)
+                            raise e
+            finally:
+                for task in running:
+                    task.cancel()
+                if running:
+                    await asyncio.gather(*running, return_exceptions=True)
+
+        return state, tracker.finish(state)
 
     def execute(self, initial_state: dict) -> Tuple[dict, list]:
         """
-        Executes the graph by either using BurrBridge or the standard method.
+        Executes the graph by either using BurrBridge, the parallel or the standard method.
 
         Args:
             initial_state (dict): The initial state to pass to the entry point node.
@@ -354,9 +659,32 @@ class BaseGraph:
             bridge = BurrBridge(self, self.burr_config)
             result = bridge.execute(initial_state)
             return (result["_state"], [])
+        elif self.parallel:
+            return self._execute_parallel(initial_state)
         else:
             return self._execute_standard(initial_state)
 
+    async def aexecute(self, initial_state: dict) -> Tuple[dict, list]:
+        """
+        Asynchronously executes the graph on the running event loop, awaiting
+        the ``aexecute`` method of every node. BurrBridge runs in a worker thread.
+
+        Args:
+            initial_state (dict): The initial state to pass to the entry point node.
+
+        Returns:
+            Tuple[dict, list]: A tuple containing the final state and a list of execution info.
+        """
+
+        if self.use_burr:
+            return await asyncio.to_thread(self.execute, initial_state)
+
+        self.initial_state = initial_state
+        if self.parallel:
+            return await self._aexecute_parallel(initial_state)
+        else:
+            return await self._aexecute_standard(initial_state)
+
     def append_node(self, node):
         """
         Adds a node to the graph.
@@ -376,3 +704,173 @@ class BaseGraph:
         self.raw_edges.append((last_node, node))
         self.nodes.append(node)
         self.edges = self._create_edges(set(self.raw_edges))
+        self.successors = self._create_successors(self.raw_edges)
+
+
+class _ExecutionTracker:
+    """
+    Collects the execution info of a graph run and reports it to the telemetry.
+    """
+
+    def __init__(self, graph: "BaseGraph"):
+        self.graph = graph
+        self.start_time = time.time()
+        self.total_exec_time = 0.0
+        self.exec_info = []
+        self.cb_total = {
+            "total_tokens": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "successful_requests": 0,
+            "total_cost_USD": 0.0,
+            "cache_hits": 0,
+            "cache_misses": 0,
+        }
+        self.source_type = None
+        self.llm_model = None
+        self.llm_model_name = None
+        self.embedder_model = None
+        self.source = []
+        self.prompt = None
+        self.schema = None
+
+    def inspect(self, current_node, state: dict):
+        """Picks the source, model and schema information up from a node."""
+        if self.source_type is None:
+            self.source_type, self.source, self.prompt = self.graph._update_source_info(
+                current_node, state
+            )
+
+        if self.llm_model is None:
+            self.llm_model, self.llm_model_name, self.embedder_model = (
+                self.graph._get_model_info(current_node)
+            )
+
+        if self.schema is None:
+            self.schema = self.graph._get_schema(current_node)
+
+    def record(self, node_exec_time: float, cb_data: Optional[dict]):
+        """Accounts the execution of a node."""
+        self.total_exec_time += node_exec_time
+
+        if cb_data:
+            self.exec_info.append(cb_data)
+            for key in self.cb_total:
+                self.cb_total[key] += cb_data[key]
+
+    def log_error(self, error_node: str, exception: Exception):
+        """Reports a failed graph run."""
+        log_graph_execution(
+            graph_name=self.graph.graph_name,
+            source=self.source,
+            prompt=self.prompt,
+            schema=self.schema,
+            llm_model=self.llm_model_name,
+            embedder_model=self.embedder_model,
+            source_type=self.source_type,
+            execution_time=time.time() - self.start_time,
+            error_node=error_node,
+            exception=str(exception),
+        )
+
+    def finish(self, state: dict) -> list:
+        """Reports a successful graph run and returns its execution info."""
+        self.exec_info.append(
+            {
+                "node_name": "TOTAL RESULT",
+                "total_tokens": self.cb_total["total_tokens"],
+                "prompt_tokens": self.cb_total["prompt_tokens"],
+                "completion_tokens": self.cb_total["completion_tokens"],
+                "successful_requests": self.cb_total["successful_requests"],
+                "total_cost_USD": self.cb_total["total_cost_USD"],
+                "cache_hits": self.cb_total["cache_hits"],
+                "cache_misses": self.cb_total["cache_misses"],
+                "exec_time": self.total_exec_time,
+            }
+        )
+
+        response = state.get("answer", None) if self.source_type == "url" else None
+        content = state.get("parsed_doc", None) if response is not None else None
+
+        log_graph_execution(
+            graph_name=self.graph.graph_name,
+            source=self.source,
+            prompt=self.prompt,
+            schema=self.schema,
+            llm_model=self.llm_model_name,
+            embedder_model=self.embedder_model,
+            source_type=self.source_type,
+            content=content,
+            response=response,
+            execution_time=time.time() - self.start_time,
+            total_tokens=(
+                self.cb_total["total_tokens"]
+                if self.cb_total["total_tokens"] > 0
+                else None
+            ),
+        )
+
+        return self.exec_info
+
+
+class _ParallelSchedule:
+    """
+    Book-keeping of a parallel graph run: which nodes are ready, done or skipped.
+
+    A node is skipped when every edge leading to it comes from a skipped node
+    or from a ConditionalNode that chose another branch.
+    """
+
+    def __init__(
+        self,
+        graph: "BaseGraph",
+        order: List[str],
+        predecessors: Dict[str, List[str]],
+        dependencies: Dict[str, Set[str]],
+    ):
+        self.graph = graph
+        self.order = order
+        self.predecessors = predecessors
+        self.dependencies = dependencies
+        self.pending = list(order)
+        self.resolved = set()
+        self.skipped = set()
+        self.inactive_edges = set()
+
+    def ready(self) -> List[str]:
+        """Returns the nodes to start, removing them from the pending ones."""
+        ready = [
+            name for name in self.pending if self.dependencies[name] <= self.resolved
+        ]
+        for name in ready:
+            self.pending.remove(name)
+        return [name for name in ready if name not in self.skipped]
+
+    def complete(self, current_node, next_node_name: Optional[str]):
+        """Marks a node as done, pruning the branches a ConditionalNode did not take."""
+        self.resolved.add(current_node.node_name)
+
+        if current_node.node_type == "conditional_node":
+            for succ in self.graph.successors.get(current_node.node_name, []):
+                if succ != next_node_name:
+                    self.inactive_edges.add((current_node.node_name, succ))
+                    self._prune(succ)
+
+    def _prune(self, node_name: str):
+        if node_name == self.graph.entry_point or node_name in self.skipped:
+            return
+        if all(
+            pred in self.skipped or (pred, node_name) in self.inactive_edges
+            for pred in self.predecessors[node_name]
+        ):
+            self.skipped.add(node_name)
+            self.resolved.add(node_name)
+            for succ in self.graph.successors.get(node_name, []):
+                self._prune(succ)
+
+    def check_finished(self):
+        """Raises if nodes are left pending while nothing is running."""
+        if self.pending:
+            raise RuntimeError(
+                f"Could not schedule the nodes {self.pending} of the graph."
+            )
@@ -48,6 +48,8 @@ class CSVScraperGraph(AbstractGraph):
             generates an answer based on these chunks, and returns this answer as a string.
     """
 
+    answer_key = "answer"
+
     def __init__(
         self,
         prompt: str,
@@ -97,7 +99,5 @@ class CSVScraperGraph(AbstractGraph):
         Executes the web scraping process and returns the answer to the prompt.
         """
 
-        inputs = {"user_prompt": self.prompt, self.input_key: self.source}
-        self.final_state, self.execution_info = self.graph.execute(inputs)
-
-        return self.final_state.get("answer", "No answer found.")
+        self.final_state, self.execution_info = self.graph.execute(self._graph_inputs())
+        return self._graph_answer()
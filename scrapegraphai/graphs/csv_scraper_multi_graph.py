@@ -42,6 +42,9 @@ class CSVScraperMultiGraph(AbstractGraph):
         >>> result = search_graph.run()
     """
 
+    input_key = "jsons"
+    answer_key = "answer"
+
     def __init__(
         self,
         prompt: str,
@@ -98,7 +101,5 @@ class CSVScraperMultiGraph(AbstractGraph):
             str: The answer to the prompt.
         """
 
-        inputs = {"user_prompt": self.prompt, "jsons": self.source}
-        self.final_state, self.execution_info = self.graph.execute(inputs)
-
-        return self.final_state.get("answer", "No answer found.")
+        self.final_state, self.execution_info = self.graph.execute(self._graph_inputs())
+        return self._graph_answer()
@@ -83,6 +83,10 @@ class DepthSearchGraph(AbstractGraph):
                 "storage_state": self.config.get("storage_state"),
                 "depth": self.config.get("depth", 1),
                 "only_inside_links": self.config.get("only_inside_links", False),
+                "concurrency": self.config.get("concurrency", 1),
+                "max_per_host": self.config.get("max_per_host", 2),
+                "host_delay": self.config.get("host_delay", 0.0),
+                "max_pages": self.config.get("max_pages"),
             },
         )
 
@@ -43,6 +43,8 @@ class DocumentScraperGraph(AbstractGraph):
         >>> result = smart_scraper.run()
     """
 
+    answer_key = "answer"
+
     def __init__(
         self,
         prompt: str,
@@ -108,7 +110,5 @@ class DocumentScraperGraph(AbstractGraph):
             str: The answer to the prompt.
         """
 
-        inputs = {"user_prompt": self.prompt, self.input_key: self.source}
-        self.final_state, self.execution_info = self.graph.execute(inputs)
-
-        return self.final_state.get("answer", "No answer found.")
+        self.final_state, self.execution_info = self.graph.execute(self._graph_inputs())
+        return self._graph_answer()
@@ -41,6 +41,8 @@ class JSONScraperGraph(AbstractGraph):
         >>> result = json_scraper.run()
     """
 
+    answer_key = "answer"
+
     def __init__(
         self,
         prompt: str,
@@ -93,7 +95,5 @@ class JSONScraperGraph(AbstractGraph):
             str: The answer to the prompt.
         """
 
-        inputs = {"user_prompt": self.prompt, self.input_key: self.source}
-        self.final_state, self.execution_info = self.graph.execute(inputs)
-
-        return self.final_state.get("answer", "No answer found.")
+        self.final_state, self.execution_info = self.graph.execute(self._graph_inputs())
+        return self._graph_answer()
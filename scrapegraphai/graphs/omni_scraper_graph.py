@@ -46,6 +46,8 @@ class OmniScraperGraph(AbstractGraph):
         )
     """
 
+    answer_key = "answer"
+
     def __init__(
         self,
         prompt: str,
@@ -129,7 +131,5 @@ class OmniScraperGraph(AbstractGraph):
             str: The answer to the prompt.
         """
 
-        inputs = {"user_prompt": self.prompt, self.input_key: self.source}
-        self.final_state, self.execution_info = self.graph.execute(inputs)
-
-        return self.final_state.get("answer", "No answer found.")
+        self.final_state, self.execution_info = self.graph.execute(self._graph_inputs())
+        return self._graph_answer()
@@ -41,6 +41,8 @@ class OmniSearchGraph(AbstractGraph):
         >>> result = search_graph.run()
     """
 
+    answer_key = "answer"
+
     def __init__(
         self, prompt: str, config: dict, schema: Optional[Type[BaseModel]] = None
     ):
@@ -104,7 +106,5 @@ class OmniSearchGraph(AbstractGraph):
             str: The answer to the prompt.
         """
 
-        inputs = {"user_prompt": self.prompt}
-        self.final_state, self.execution_info = self.graph.execute(inputs)
-
-        return self.final_state.get("answer", "No answer found.")
+        self.final_state, self.execution_info = self.graph.execute(self._graph_inputs())
+        return self._graph_answer()
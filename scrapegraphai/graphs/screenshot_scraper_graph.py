@@ -32,6 +32,8 @@ class ScreenshotScraperGraph(AbstractGraph):
             Executes the scraping process and returns the answer to the prompt.
     """
 
+    answer_key = "answer"
+
     def __init__(
         self,
         prompt: str,
@@ -76,7 +78,5 @@ class ScreenshotScraperGraph(AbstractGraph):
             str: The answer to the prompt.
         """
 
-        inputs = {"user_prompt": self.prompt}
-        self.final_state, self.execution_info = self.graph.execute(inputs)
-
-        return self.final_state.get("answer", "No answer found.")
+        self.final_state, self.execution_info = self.graph.execute(self._graph_inputs())
+        return self._graph_answer()
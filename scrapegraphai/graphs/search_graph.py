@@ -42,6 +42,8 @@ class SearchGraph(AbstractGraph):
         >>> print(search_graph.get_considered_urls())
     """
 
+    answer_key = "answer"
+
     def __init__(
         self, prompt: str, config: dict, schema: Optional[Type[BaseModel]] = None
     ):
@@ -108,14 +110,16 @@ class SearchGraph(AbstractGraph):
             str: The answer to the prompt.
         """
 
-        inputs = {"user_prompt": self.prompt}
-        self.final_state, self.execution_info = self.graph.execute(inputs)
+        self.final_state, self.execution_info = self.graph.execute(self._graph_inputs())
+        return self._graph_answer()
 
-        # Store the URLs after execution
+    def _graph_answer(self) -> str:
+        """
+        Stores the URLs considered by the search and returns the answer.
+        """
         if "urls" in self.final_state:
             self.considered_urls = self.final_state["urls"]
-
-        return self.final_state.get("answer", "No answer found.")
+        return super()._graph_answer()
 
     def get_considered_urls(self) -> List[str]:
         """
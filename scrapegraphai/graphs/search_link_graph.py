@@ -36,6 +36,8 @@ class SearchLinkGraph(AbstractGraph):
 
     """
 
+    answer_key = "parsed_doc"
+
     def __init__(
         self, source: str, config: dict, schema: Optional[Type[BaseModel]] = None
     ):
@@ -97,7 +99,5 @@ class SearchLinkGraph(AbstractGraph):
             str: The answer to the prompt.
         """
 
-        inputs = {"user_prompt": self.prompt, self.input_key: self.source}
-        self.final_state, self.execution_info = self.graph.execute(inputs)
-
-        return self.final_state.get("parsed_doc", "No answer found.")
+        self.final_state, self.execution_info = self.graph.execute(self._graph_inputs())
+        return self._graph_answer()
@@ -12,6 +12,7 @@ from ..nodes import (
     GenerateAnswerNode,
     ParseNode,
     ReasoningNode,
+    RelevanceFilterNode,
 )
 from ..prompts import REGEN_ADDITIONAL_INFO
 from .abstract_graph import AbstractGraph
@@ -51,6 +52,8 @@ class SmartScraperGraph(AbstractGraph):
         )
     """
 
+    answer_key = "answer"
+
     def __init__(
         self,
         prompt: str,
@@ -113,10 +116,20 @@ class SmartScraperGraph(AbstractGraph):
                 "storage_state": self.config.get("storage_state"),
             },
         )
+        # only GenerateAnswerNode consumes the chunks as they are produced, the
+        # relevance filter needs all of them to rank them
+        relevance_filter = self.config.get("relevance_filter")
+        stream_chunks = self.config.get("stream_chunks", False)
+        if self.config.get("reasoning") or relevance_filter:
+            stream_chunks = False
         parse_node = ParseNode(
             input="doc",
             output=["parsed_doc"],
-            node_config={"llm_model": self.llm_model, "chunk_size": self.model_token},
+            node_config={
+                "llm_model": self.llm_model,
+                "chunk_size": self.model_token,
+                "stream_chunks": stream_chunks,
+            },
         )
 
         generate_answer_node = GenerateAnswerNode(
@@ -158,6 +171,7 @@ class SmartScraperGraph(AbstractGraph):
                 node_config={
                     "llm_model": self.llm_model,
                     "chunk_size": self.model_token,
+                    "stream_chunks": stream_chunks,
                 },
             )
 
@@ -268,22 +282,60 @@ class SmartScraperGraph(AbstractGraph):
         # Retrieve the appropriate graph configuration
         config = graph_variation_config.get((html_mode, reasoning, reattempt))
 
-        if config:
-            return BaseGraph(
-                nodes=config["nodes"],
-                edges=config["edges"],
-                entry_point=fetch_node,
-                graph_name=self.__class__.__name__,
-            )
+        # Default configuration if no conditions match
+        if not config:
+            config = {
+                "nodes": [fetch_node, parse_node, generate_answer_node],
+                "edges": [(fetch_node, parse_node), (parse_node, generate_answer_node)],
+            }
+
+        if relevance_filter and parse_node in config["nodes"]:
+            config = self._with_relevance_filter(config, parse_node, relevance_filter)
 
-        # Default return if no conditions match
         return BaseGraph(
-            nodes=[fetch_node, parse_node, generate_answer_node],
-            edges=[(fetch_node, parse_node), (parse_node, generate_answer_node)],
+            nodes=config["nodes"],
+            edges=config["edges"],
             entry_point=fetch_node,
             graph_name=self.__class__.__name__,
         )
 
+    def _with_relevance_filter(
+        self, config: dict, parse_node: ParseNode, relevance_filter
+    ) -> dict:
+        """
+        Inserts a RelevanceFilterNode right after the parse node of a graph
+        variation, so that only the chunks related to the prompt reach the LLM.
+
+        Args:
+            config (dict): The nodes and edges of the graph variation.
+            parse_node (ParseNode): The node producing the chunks.
+            relevance_filter (bool | dict): The "relevance_filter" option, optionally
+                holding the "top_k" and "min_score" of the filter.
+
+        Returns:
+            dict: The nodes and edges of the graph with the filter.
+        """
+        options = relevance_filter if isinstance(relevance_filter, dict) else {}
+        relevance_node = RelevanceFilterNode(
+            input="user_prompt & parsed_doc",
+            output=["relevant_chunks"],
+            node_config={
+                "llm_model": self.llm_model,
+                "schema": self.schema,
+                **options,
+            },
+        )
+
+        nodes = list(config["nodes"])
+        nodes.insert(nodes.index(parse_node) + 1, relevance_node)
+        edges = []
+        for from_node, to_node in config["edges"]:
+            if from_node is parse_node:
+                edges.append((parse_node, relevance_node))
+                from_node = relevance_node
+            edges.append((from_node, to_node))
+        return {"nodes": nodes, "edges": edges}
+
     def run(self) -> str:
         """
         Executes the scraping process and returns the answer to the prompt.
@@ -292,7 +344,5 @@ class SmartScraperGraph(AbstractGraph):
             str: The answer to the prompt.
         """
 
-        inputs = {"user_prompt": self.prompt, self.input_key: self.source}
-        self.final_state, self.execution_info = self.graph.execute(inputs)
-
-        return self.final_state.get("answer", "No answer found.")
+        self.final_state, self.execution_info = self.graph.execute(self._graph_inputs())
+        return self._graph_answer()
@@ -39,6 +39,9 @@ class SmartScraperLiteGraph(AbstractGraph):
         )
     """
 
+    answer_key = "parsed_doc"
+    no_answer = "No document found."
+
     def __init__(
         self,
         source: str,
@@ -97,7 +100,5 @@ class SmartScraperLiteGraph(AbstractGraph):
             str: The scraping content.
         """
 
-        inputs = {"user_prompt": self.prompt, self.input_key: self.source}
-        self.final_state, self.execution_info = self.graph.execute(inputs)
-
-        return self.final_state.get("parsed_doc", "No document found.")
+        self.final_state, self.execution_info = self.graph.execute(self._graph_inputs())
+        return self._graph_answer()
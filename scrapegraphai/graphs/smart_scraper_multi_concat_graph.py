@@ -46,6 +46,9 @@ class SmartScraperMultiConcatGraph(AbstractGraph):
         >>> result = smart_scraper_multi_concat_graph.run()
     """
 
+    input_key = "urls"
+    answer_key = "answer"
+
     def __init__(
         self,
         prompt: str,
@@ -123,7 +126,5 @@ class SmartScraperMultiConcatGraph(AbstractGraph):
             str: The answer to the prompt.
         """
 
-        inputs = {"user_prompt": self.prompt, "urls": self.source}
-        self.final_state, self.execution_info = self.graph.execute(inputs)
-
-        return self.final_state.get("answer", "No answer found.")
+        self.final_state, self.execution_info = self.graph.execute(self._graph_inputs())
+        return self._graph_answer()
@@ -27,6 +27,7 @@ from .parse_node_depth_k_node import ParseNodeDepthK
 from .prompt_refiner_node import PromptRefinerNode
 from .rag_node import RAGNode
 from .reasoning_node import ReasoningNode
+from .relevance_filter_node import RelevanceFilterNode
 from .robots_node import RobotsNode
 from .search_internet_node import SearchInternetNode
 from .search_link_node import SearchLinkNode
@@ -50,6 +51,7 @@ __all__ = [
     "GetProbableTagsNode",
     "DescriptionNode",
     "ReasoningNode",
+    "RelevanceFilterNode",
     # Generation nodes
     "GenerateAnswerNode",
     "GenerateAnswerNodeKLevel",
@@ -2,6 +2,7 @@
 This module defines the base node class for the ScrapeGraphAI application.
 """
 
+import asyncio
 import re
 from abc import ABC, abstractmethod
 from typing import List, Optional
@@ -82,6 +83,20 @@ class BaseNode(ABC):
 
         pass
 
+    async def aexecute(self, state: dict) -> dict:
+        """
+        Asynchronously execute the node's logic. Nodes doing I/O override it with
+        a native implementation; by default ``execute`` runs in a worker thread.
+
+        Args:
+            state (dict): The current state of the graph.
+
+        Returns:
+            dict: The updated state after executing the node's logic.
+        """
+
+        return await asyncio.to_thread(self.execute, state)
+
     def update_config(self, params: dict, overwrite: bool = False):
         """
         Updates the node_config dictionary as well as attributes with same key.
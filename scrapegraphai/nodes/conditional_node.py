@@ -83,6 +83,12 @@ class ConditionalNode(BaseNode):
         else:
             return self.false_node_name
 
+    async def aexecute(self, state: dict) -> dict:
+        """
+        Evaluates the condition on the running event loop, it does no I/O.
+        """
+        return self.execute(state)
+
     def _evaluate_condition(self, state: dict, condition: str) -> bool:
         """
         Parses and evaluates the condition expression against the state.
@@ -9,6 +9,7 @@ from langchain_core.runnables import RunnableParallel
 from tqdm import tqdm
 
 from ..prompts.description_node_prompts import DESCRIPTION_NODE_PROMPT
+from ..utils.llm_cache import cached_chain
 from .base_node import BaseNode
 
 
@@ -43,6 +44,7 @@ class DescriptionNode(BaseNode):
             False if node_config is None else node_config.get("verbose", False)
         )
         self.cache_path = node_config.get("cache_path", False)
+        self.llm_cache = node_config.get("llm_cache")
 
     def execute(self, state: dict) -> dict:
         self.logger.info(f"--- Executing {self.node_name} Node ---")
@@ -59,7 +61,9 @@ class DescriptionNode(BaseNode):
                 partial_variables={"content": chunk.get("document")},
             )
             chain_name = f"chunk{i+1}"
-            chains_dict[chain_name] = prompt | self.llm_model
+            chains_dict[chain_name] = cached_chain(
+                prompt, self.llm_model, llm_cache=self.llm_cache
+            )
 
         async_runner = RunnableParallel(**chains_dict)
         batch_results = async_runner.invoke({})
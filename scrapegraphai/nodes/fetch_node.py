@@ -2,17 +2,29 @@
 FetchNode Module
 """
 
+import asyncio
 import json
 from typing import List, Optional
 
-import requests
 from langchain_community.document_loaders import PyPDFLoader
 from langchain_core.documents import Document
 from langchain_openai import AzureChatOpenAI, ChatOpenAI
 
 from ..docloaders import ChromiumLoader
-from ..utils.cleanup_html import cleanup_html
-from ..utils.convert_to_md import convert_to_md
+from ..utils.fetch_cache import (
+    DEFAULT_CACHE_MAX_SIZE,
+    DEFAULT_CACHE_TTL,
+    FetchCache,
+    get_fetch_cache,
+)
+from ..utils.html_document import PARSED_HTML_KEY, HTMLDocument
+from ..utils.http_client import (
+    DEFAULT_HTTP_TIMEOUT,
+    DEFAULT_MAX_BODY_SIZE,
+    ahttp_fetch,
+    http_fetch,
+)
+from ..utils.process_pool import run_cpu_bound
 from .base_node import BaseNode
 
 
@@ -82,6 +94,23 @@ class FetchNode(BaseNode):
             None if node_config is None else node_config.get("storage_state", None)
         )
 
+        self.cache_path = (
+            False if node_config is None else node_config.get("cache_path", False)
+        )
+        self.cache_ttl = (
+            DEFAULT_CACHE_TTL
+            if node_config is None
+            else node_config.get("cache_ttl", DEFAULT_CACHE_TTL)
+        )
+        self.cache_max_size = (
+            DEFAULT_CACHE_MAX_SIZE
+            if node_config is None
+            else node_config.get("cache_max_size", DEFAULT_CACHE_MAX_SIZE)
+        )
+        self.parse_executor = (
+            None if node_config is None else node_config.get("parse_executor", None)
+        )
+
     def execute(self, state):
         """
         Executes the node's logic to fetch HTML content from a specified URL and
@@ -117,6 +146,21 @@ class FetchNode(BaseNode):
         else:
             raise ValueError(f"Invalid input type: {input_type}")
 
+    async def aexecute(self, state):
+        """
+        Fetches the content of a URL with ``ChromiumLoader.alazy_load`` on the
+        running event loop. Other sources and backends are handled by ``execute``
+        in a worker thread.
+        """
+        input_keys = self.get_input_keys(state)
+        input_type = input_keys[0]
+
+        if input_type != "url" or self.browser_base or self.scrape_do:
+            return await super().aexecute(state)
+
+        self.logger.info(f"--- Executing {self.node_name} Node ---")
+        return await self.ahandle_web_source(state, state[input_type])
+
     def handle_directory(self, state, input_type, source):
         """
         Handles the directory by compressing the source document and updating the state.
@@ -230,18 +274,53 @@ class FetchNode(BaseNode):
             or self.force
             and not self.script_creator
         ):
-            parsed_content = convert_to_md(source)
+            html_document = HTMLDocument(source)
+            compressed_document = [
+                self._markdown_document(html_document, source="local_dir")
+            ]
         else:
-            parsed_content = source
-
-        compressed_document = [
-            Document(page_content=parsed_content, metadata={"source": "local_dir"})
-        ]
+            compressed_document = [
+                Document(page_content=parsed_content, metadata={"source": "local_dir"})
+            ]
 
         # return self.update_state(state, compressed_document)
         state.update({self.output[0]: compressed_document})
         return state
 
+    def _fetch_cache_key(self, source: str, loader_kwargs: dict) -> str:
+        """
+        Builds the fetch cache key of a URL from the options that affect its content.
+
+        Parameters:
+        source (str): The URL to fetch.
+        loader_kwargs (dict): The kwargs passed to the content loader.
+
+        Returns:
+        str: The cache key.
+        """
+        if self.use_soup:
+            backend = "http"
+        elif self.browser_base:
+            backend = "browser_base"
+        elif self.scrape_do:
+            backend = "scrape_do"
+        else:
+            backend = "chromium"
+
+        return FetchCache.make_key(
+            source,
+            {
+                "backend": backend,
+                "headless": self.headless,
+                "storage_state": self.storage_state,
+                "loader_kwargs": {
+                    key: value
+                    for key, value in loader_kwargs.items()
+                    if key != "browser_pool"
+                },
+            },
+        )
+
     def handle_web_source(self, state, source):
         """
         Handles the web source by fetching HTML content from a URL,
@@ -259,103 +338,224 @@ class FetchNode(BaseNode):
         """
 
         self.logger.info(f"--- (Fetching HTML from: {source}) ---")
-        if self.use_soup:
-            response = requests.get(source)
-            if response.status_code == 200:
-                if not response.text.strip():
-                    raise ValueError("No HTML body content found in the response.")
-
-                if not self.cut:
-                    parsed_content = cleanup_html(response, source)
-
-                if (
-                    isinstance(self.llm_model, (ChatOpenAI, AzureChatOpenAI))
-                    and not self.script_creator
-                    or (self.force and not self.script_creator)
-                ):
-                    parsed_content = convert_to_md(source, parsed_content)
-
-                compressed_document = [Document(page_content=parsed_content)]
+        loader_kwargs = {}
+
+        if self.node_config:
+            loader_kwargs = self.node_config.get("loader_kwargs", {})
+
+        fetch_cache, cache_key, document = self._lookup_fetch_cache(
+            source, loader_kwargs
+        )
+
+        if document is not None:
+            self.logger.info(f"--- (Serving {source} from the fetch cache) ---")
+        elif self.use_soup:
+            data = http_fetch(source, **self._http_fetch_kwargs(loader_kwargs))
+            document = [Document(page_content=data, metadata={"source": source})]
+            self._store_fetch_cache(fetch_cache, cache_key, source, document)
+        elif self.browser_base:
+            try:
+                from ..docloaders.browser_base import browser_base_fetch
+            except ImportError:
+                raise ImportError("""The browserbase module is not installed.
+                                  Please install it using `pip install browserbase`.""")
+
+            data = browser_base_fetch(
+                self.browser_base.get("api_key"),
+                self.browser_base.get("project_id"),
+                [source],
+            )
+
+            document = [
+                Document(page_content=content, metadata={"source": source})
+                for content in data
+            ]
+            self._store_fetch_cache(fetch_cache, cache_key, source, document)
+        elif self.scrape_do:
+            from ..docloaders.scrape_do import scrape_do_fetch
+
+            if (
+                (self.scrape_do.get("use_proxy") is None)
+                or self.scrape_do.get("geoCode") is None
+                or self.scrape_do.get("super_proxy") is None
+            ):
+                data = scrape_do_fetch(self.scrape_do.get("api_key"), source)
             else:
-                self.logger.warning(
-                    f"Failed to retrieve contents from the webpage at url: {source}"
+                data = scrape_do_fetch(
+                    self.scrape_do.get("api_key"),
+                    source,
+                    self.scrape_do.get("use_proxy"),
+                    self.scrape_do.get("geoCode"),
+                    self.scrape_do.get("super_proxy"),
                 )
+
+            document = [Document(page_content=data, metadata={"source": source})]
+            self._store_fetch_cache(fetch_cache, cache_key, source, document)
         else:
-            loader_kwargs = {}
-
-            if self.node_config:
-                loader_kwargs = self.node_config.get("loader_kwargs", {})
-
-            if self.browser_base:
-                try:
-                    from ..docloaders.browser_base import browser_base_fetch
-                except ImportError:
-                    raise ImportError(
-                        """The browserbase module is not installed.
-                                      Please install it using `pip install browserbase`."""
-                    )
+            loader = ChromiumLoader(
+                [source],
+                headless=self.headless,
+                storage_state=self.storage_state,
+                **loader_kwargs,
+            )
+            document = loader.load()
+            self._store_fetch_cache(fetch_cache, cache_key, source, document)
 
-                data = browser_base_fetch(
-                    self.browser_base.get("api_key"),
-                    self.browser_base.get("project_id"),
-                    [source],
-                )
+        return self._update_web_state(state, document)
 
-                document = [
-                    Document(page_content=content, metadata={"source": source})
-                    for content in data
-                ]
-            elif self.scrape_do:
-                from ..docloaders.scrape_do import scrape_do_fetch
-
-                if (
-                    (self.scrape_do.get("use_proxy") is None)
-                    or self.scrape_do.get("geoCode") is None
-                    or self.scrape_do.get("super_proxy") is None
-                ):
-                    data = scrape_do_fetch(self.scrape_do.get("api_key"), source)
-                else:
-                    data = scrape_do_fetch(
-                        self.scrape_do.get("api_key"),
-                        source,
-                        self.scrape_do.get("use_proxy"),
-                        self.scrape_do.get("geoCode"),
-                        self.scrape_do.get("super_proxy"),
-                    )
+    async def ahandle_web_source(self, state, source):
+        """
+        Asynchronous counterpart of ``handle_web_source`` for the ChromiumLoader
+        and plain HTTP backends, loading the page on the running event loop.
 
-                document = [Document(page_content=data, metadata={"source": source})]
-            else:
-                loader = ChromiumLoader(
-                    [source],
-                    headless=self.headless,
-                    storage_state=self.storage_state,
-                    **loader_kwargs,
-                )
-                document = loader.load()
+        Parameters:
+        state (dict): The current state of the graph.
+        source (str): The URL of the web source to fetch HTML content from.
 
-            if not document or not document[0].page_content.strip():
-                raise ValueError(
-                    """No HTML body content found in
-                                 the document fetched by ChromiumLoader."""
-                )
+        Returns:
+        dict: The updated state with the processed content.
 
-            parsed_content = document[0].page_content
+        Raises:
+        ValueError: If the fetched HTML content is empty or contains only whitespace.
+        """
 
-            if (
-                (
-                    isinstance(self.llm_model, ChatOpenAI)
-                    or isinstance(self.llm_model, AzureChatOpenAI)
-                )
-                and not self.script_creator
-                or self.force
-                and not self.script_creator
-                and not self.openai_md_enabled
-            ):
-                parsed_content = convert_to_md(document[0].page_content, parsed_content)
+        self.logger.info(f"--- (Fetching HTML from: {source}) ---")
+        loader_kwargs = {}
+
+        if self.node_config:
+            loader_kwargs = self.node_config.get("loader_kwargs", {})
+
+        fetch_cache, cache_key, document = await asyncio.to_thread(
+            self._lookup_fetch_cache, source, loader_kwargs
+        )
+
+        if document is not None:
+            self.logger.info(f"--- (Serving {source} from the fetch cache) ---")
+        elif self.use_soup:
+            data = await ahttp_fetch(source, **self._http_fetch_kwargs(loader_kwargs))
+            document = [Document(page_content=data, metadata={"source": source})]
+            await asyncio.to_thread(
+                self._store_fetch_cache, fetch_cache, cache_key, source, document
+            )
+        else:
+            loader = ChromiumLoader(
+                [source],
+                headless=self.headless,
+                storage_state=self.storage_state,
+                **loader_kwargs,
+            )
+            document = [doc async for doc in loader.alazy_load()]
+            await asyncio.to_thread(
+                self._store_fetch_cache, fetch_cache, cache_key, source, document
+            )
+
+        # the conversion to Markdown is CPU-bound, keep it off the event loop
+        return await asyncio.to_thread(self._update_web_state, state, document)
+
+    @staticmethod
+    def _http_fetch_kwargs(loader_kwargs: dict) -> dict:
+        """
+        Picks the options of the plain HTTP fetch used with ``use_soup`` from the
+        loader kwargs.
+        """
+        return {
+            "timeout": loader_kwargs.get("timeout", DEFAULT_HTTP_TIMEOUT),
+            "max_body_size": loader_kwargs.get("max_body_size", DEFAULT_MAX_BODY_SIZE),
+        }
+
+    def _lookup_fetch_cache(self, source: str, loader_kwargs: dict):
+        """
+        Looks a URL up in the fetch cache.
+
+        Parameters:
+        source (str): The URL to fetch.
+        loader_kwargs (dict): The kwargs passed to the content loader.
+
+        Returns:
+        tuple: The fetch cache (or None if disabled), the cache key and the
+        cached document (or None on a miss).
+        """
+        fetch_cache = get_fetch_cache(
+            self.cache_path, self.cache_ttl, self.cache_max_size
+        )
+        if fetch_cache is None:
+            return None, None, None
+
+        cache_key = self._fetch_cache_key(source, loader_kwargs)
+        cached_content = fetch_cache.get(cache_key)
+        if cached_content is None:
+            return fetch_cache, cache_key, None
+
+        document = [Document(page_content=cached_content, metadata={"source": source})]
+        return fetch_cache, cache_key, document
+
+    def _store_fetch_cache(self, fetch_cache, cache_key, source, document):
+        """
+        Stores a freshly fetched, non-empty document in the fetch cache.
+        """
+        if fetch_cache is None or not document or not document[0].page_content.strip():
+            return
+        fetch_cache.put(cache_key, document[0].page_content, url=source)
+
+    @staticmethod
+    def _markdown_document(html_document: HTMLDocument, source: str) -> Document:
+        """
+        Converts a parsed page to a Markdown document.
+
+        The title, links and images are derived from the same parse and cached
+        in the metadata, with the format of the content, so that ParseNode does
+        not need to parse the page again.
+        """
+        return Document(
+            page_content=html_document.markdown,
+            metadata={
+                "source": source,
+                "format": "markdown",
+                PARSED_HTML_KEY: html_document.to_metadata(),
+            },
+        )
 
+    def _update_web_state(self, state, document):
+        """
+        Optionally converts a fetched web document to Markdown and updates the state.
+
+        Parameters:
+        state (dict): The current state of the graph.
+        document (list): The documents returned by the loader.
+
+        Returns:
+        dict: The updated state with the processed content.
+
+        Raises:
+        ValueError: If the fetched HTML content is empty or contains only whitespace.
+        """
+        if not document or not document[0].page_content.strip():
+            raise ValueError("""No HTML body content found in
+                             the document fetched by ChromiumLoader.""")
+
+        if (
+            (
+                isinstance(self.llm_model, ChatOpenAI)
+                or isinstance(self.llm_model, AzureChatOpenAI)
+            )
+            and not self.script_creator
+            or self.force
+            and not self.script_creator
+            and not self.openai_md_enabled
+        ):
+            compressed_document = [
+                run_cpu_bound(
+                    self.parse_executor, _to_markdown_document, document[0], "html file"
+                )
+            ]
+        else:
             compressed_document = [
-                Document(page_content=parsed_content, metadata={"source": "html file"})
+                Document(
+                    page_content=document[0].page_content,
+                    metadata={"source": "html file"},
+                )
             ]
+
         state["original_html"] = document
         state.update(
             {
@@ -363,3 +563,11 @@ class FetchNode(BaseNode):
             }
         )
         return state
+
+
+def _to_markdown_document(document: Document, source: str) -> Document:
+    """
+    Converts a fetched HTML document to a Markdown document, in a worker
+    process when FetchNode has a parse executor.
+    """
+    return FetchNode._markdown_document(HTMLDocument.from_document(document), source)
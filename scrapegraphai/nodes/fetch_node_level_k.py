@@ -2,6 +2,7 @@
 fetch_node_level_k module
 """
 
+import asyncio
 from typing import List, Optional
 from urllib.parse import urljoin
 
@@ -9,6 +10,15 @@ from bs4 import BeautifulSoup
 from langchain_core.documents import Document
 
 from ..docloaders import ChromiumLoader
+from ..utils.async_map import run_sync
+from ..utils.crawl_frontier import CrawlFrontier
+from ..utils.fetch_cache import (
+    DEFAULT_CACHE_MAX_SIZE,
+    DEFAULT_CACHE_TTL,
+    FetchCache,
+    get_fetch_cache,
+)
+from ..utils.host_limiter import HostLimiter
 from .base_node import BaseNode
 
 
@@ -23,11 +33,17 @@ class FetchNodeLevelK(BaseNode):
         embedder_model: An optional model for embedding the fetched content.
         verbose (bool): A flag indicating whether to show print statements during execution.
         cache_path (str): Path to cache fetched content.
+        cache_ttl (float): Time to live of cached content in seconds.
+        cache_max_size (int): Maximum size of the fetch cache in bytes.
         headless (bool): Whether to run the Chromium browser in headless mode.
         loader_kwargs (dict): Additional arguments for the content loader.
         browser_base (dict): Optional configuration for the browser base API.
         depth (int): Maximum depth of hyperlink graph traversal.
         only_inside_links (bool): Whether to fetch only internal links.
+        concurrency (int): Maximum number of pages fetched at the same time.
+        max_per_host (Optional[int]): Maximum number of concurrent requests to the same host.
+        host_delay (float): Minimum delay in seconds between two requests to the same host.
+        max_pages (Optional[int]): Maximum number of pages fetched by the crawl.
         min_input_len (int): Minimum required length of input data.
 
     Args:
@@ -58,6 +74,8 @@ class FetchNodeLevelK(BaseNode):
         self.embedder_model = node_config.get("embedder_model", None)
         self.verbose = node_config.get("verbose", False) if node_config else False
         self.cache_path = node_config.get("cache_path", False)
+        self.cache_ttl = node_config.get("cache_ttl", DEFAULT_CACHE_TTL)
+        self.cache_max_size = node_config.get("cache_max_size", DEFAULT_CACHE_MAX_SIZE)
         self.headless = node_config.get("headless", True) if node_config else True
         self.loader_kwargs = node_config.get("loader_kwargs", {}) if node_config else {}
         self.browser_base = node_config.get("browser_base", None)
@@ -67,6 +85,10 @@ class FetchNodeLevelK(BaseNode):
         self.only_inside_links = (
             node_config.get("only_inside_links", False) if node_config else False
         )
+        self.concurrency = node_config.get("concurrency", 1) if node_config else 1
+        self.max_per_host = node_config.get("max_per_host", 2) if node_config else 2
+        self.host_delay = node_config.get("host_delay", 0.0) if node_config else 0.0
+        self.max_pages = node_config.get("max_pages", None) if node_config else None
         self.min_input_len = 1
 
     def execute(self, state: dict) -> dict:
@@ -89,18 +111,178 @@ class FetchNodeLevelK(BaseNode):
         input_data = [state[key] for key in input_keys]
         source = input_data[0]
 
-        documents = [{"source": source}]
         loader_kwargs = (
             self.node_config.get("loader_kwargs", {}) if self.node_config else {}
         )
 
-        for _ in range(self.depth):
-            documents = self.obtain_content(documents, loader_kwargs)
+        if self.concurrency > 1 or self.host_delay:
+            documents = run_sync(self.acrawl(source, loader_kwargs))
+        else:
+            documents = self.crawl(source, loader_kwargs)
 
-        filtered_documents = [doc for doc in documents if "document" in doc]
-        state.update({self.output[0]: filtered_documents})
+        state.update({self.output[0]: documents})
         return state
 
+    async def aexecute(self, state: dict) -> dict:
+        """
+        Crawls the specified URL and its sub-links on the running event loop,
+        fetching up to ``concurrency`` pages at the same time.
+
+        Args:
+            state (dict): The current state of the graph.
+
+        Returns:
+            dict: The updated state with a new output key containing the fetched HTML content.
+        """
+        self.logger.info(f"--- Executing {self.node_name} Node ---")
+
+        input_keys = self.get_input_keys(state)
+        source = state[input_keys[0]]
+        loader_kwargs = (
+            self.node_config.get("loader_kwargs", {}) if self.node_config else {}
+        )
+
+        documents = await self.acrawl(source, loader_kwargs)
+
+        state.update({self.output[0]: documents})
+        return state
+
+    def _remaining_pages(self, documents: List) -> Optional[int]:
+        """Returns how many pages the crawl may still fetch, None if unlimited."""
+        if self.max_pages is None:
+            return None
+        return max(0, self.max_pages - len(documents))
+
+    def crawl(self, source: str, loader_kwargs) -> List:
+        """
+        Fetches a URL and its sub-links breadth first, one page at a time.
+
+        Args:
+            source (str): The URL the crawl starts from.
+            loader_kwargs (dict): Additional arguments for the content loader.
+
+        Returns:
+            List: The fetched documents, as dicts with a "source" and a "document" key.
+        """
+        frontier = CrawlFrontier([source])
+        documents = []
+        for level in range(self.depth):
+            sources = frontier.pop_level()
+            if not sources or self._remaining_pages(documents) == 0:
+                break
+            # links found at the last level would never be fetched
+            next_frontier = frontier if level + 1 < self.depth else None
+            documents.extend(
+                self.obtain_content(
+                    sources,
+                    loader_kwargs,
+                    next_frontier,
+                    self._remaining_pages(documents),
+                )
+            )
+        return documents
+
+    async def acrawl(self, source: str, loader_kwargs) -> List:
+        """
+        Fetches a URL and its sub-links breadth first, running up to ``concurrency``
+        fetches at the same time within the per-host limits. The fetches still
+        pending are cancelled once ``max_pages`` pages have been fetched.
+
+        Args:
+            source (str): The URL the crawl starts from.
+            loader_kwargs (dict): Additional arguments for the content loader.
+
+        Returns:
+            List: The fetched documents, as dicts with a "source" and a "document" key,
+            in the order their URLs were discovered.
+        """
+        frontier = CrawlFrontier([source])
+        limiter = HostLimiter(self.max_per_host, self.host_delay)
+        semaphore = asyncio.Semaphore(max(1, self.concurrency))
+
+        async def _fetch(url):
+            try:
+                # errors raised within the slot slow the host down when throttled
+                async with semaphore, limiter.slot(url):
+                    return await self.afetch_content(url, loader_kwargs)
+            except Exception as e:
+                self.logger.warning(f"Failed to fetch content for {url}: {str(e)}")
+                return None
+
+        documents = []
+        for level in range(self.depth):
+            sources = frontier.pop_level()
+            remaining = self._remaining_pages(documents)
+            if not sources or remaining == 0:
+                break
+            next_frontier = frontier if level + 1 < self.depth else None
+
+            pending = {
+                asyncio.ensure_future(_fetch(url)): i for i, url in enumerate(sources)
+            }
+            fetched = {}
+            try:
+                while pending:
+                    done, _ = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        i = pending.pop(task)
+                        document = task.result()
+                        if not document or not document[0].page_content.strip():
+                            self.logger.warning(
+                                f"Failed to fetch content for {sources[i]}"
+                            )
+                            continue
+                        fetched[i] = document
+                    if remaining is not None and len(fetched) >= remaining:
+                        break
+            finally:
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    await asyncio.gather(*pending, return_exceptions=True)
+
+            for i in sorted(fetched)[:remaining]:
+                documents.append({"source": sources[i], "document": fetched[i]})
+                if next_frontier is not None:
+                    links = self.extract_links(fetched[i][0].page_content)
+                    next_frontier.add(self.get_full_links(sources[i], links))
+
+        return documents
+
+    def _fetch_cache_key(self, source: str, loader_kwargs: dict) -> str:
+        """
+        Builds the fetch cache key of a URL from the options that affect its content.
+
+        Args:
+            source (str): The URL to fetch.
+            loader_kwargs (dict): Additional arguments for the content loader.
+
+        Returns:
+            str: The cache key.
+        """
+        if self.browser_base is not None:
+            backend = "browser_base"
+        elif self.scrape_do:
+            backend = "scrape_do"
+        else:
+            backend = "chromium"
+
+        return FetchCache.make_key(
+            source,
+            {
+                "backend": backend,
+                "headless": self.headless,
+                "storage_state": self.storage_state,
+                "loader_kwargs": {
+                    key: value
+                    for key, value in loader_kwargs.items()
+                    if key != "browser_pool"
+                },
+            },
+        )
+
     def fetch_content(self, source: str, loader_kwargs) -> Optional[str]:
         """
         Fetches the HTML content of a given source URL.
@@ -114,6 +296,12 @@ class FetchNodeLevelK(BaseNode):
         """
         self.logger.info(f"--- (Fetching HTML from: {source}) ---")
 
+        fetch_cache, cache_key, document = self._lookup_fetch_cache(
+            source, loader_kwargs
+        )
+        if document is not None:
+            return document
+
         if self.browser_base is not None:
             try:
                 from ..docloaders.browser_base import browser_base_fetch
@@ -145,8 +333,82 @@ class FetchNodeLevelK(BaseNode):
                 **loader_kwargs,
             )
             document = loader.load()
+
+        self._store_fetch_cache(fetch_cache, cache_key, source, document)
+        return document
+
+    async def afetch_content(self, source: str, loader_kwargs) -> Optional[str]:
+        """
+        Asynchronously fetches the HTML content of a given source URL, with
+        ``ChromiumLoader.alazy_load`` on the running event loop. The browserbase
+        and scrape.do backends run ``fetch_content`` in a worker thread.
+
+        Args:
+            source (str): The URL to fetch content from.
+            loader_kwargs (dict): Additional arguments for the content loader.
+
+        Returns:
+            Optional[str]: The fetched HTML content or None if fetching failed.
+        """
+        if self.browser_base is not None or self.scrape_do:
+            return await asyncio.to_thread(self.fetch_content, source, loader_kwargs)
+
+        self.logger.info(f"--- (Fetching HTML from: {source}) ---")
+
+        fetch_cache, cache_key, document = await asyncio.to_thread(
+            self._lookup_fetch_cache, source, loader_kwargs
+        )
+        if document is not None:
+            return document
+
+        loader = ChromiumLoader(
+            [source],
+            headless=self.headless,
+            storage_state=self.storage_state,
+            **loader_kwargs,
+        )
+        document = [doc async for doc in loader.alazy_load()]
+
+        await asyncio.to_thread(
+            self._store_fetch_cache, fetch_cache, cache_key, source, document
+        )
         return document
 
+    def _lookup_fetch_cache(self, source: str, loader_kwargs: dict):
+        """
+        Looks a URL up in the fetch cache.
+
+        Args:
+            source (str): The URL to fetch.
+            loader_kwargs (dict): Additional arguments for the content loader.
+
+        Returns:
+            tuple: The fetch cache (or None if disabled), the cache key and the
+            cached document (or None on a miss).
+        """
+        fetch_cache = get_fetch_cache(
+            self.cache_path, self.cache_ttl, self.cache_max_size
+        )
+        if fetch_cache is None:
+            return None, None, None
+
+        cache_key = self._fetch_cache_key(source, loader_kwargs)
+        cached_content = fetch_cache.get(cache_key)
+        if cached_content is None:
+            return fetch_cache, cache_key, None
+
+        self.logger.info(f"--- (Serving {source} from the fetch cache) ---")
+        document = [Document(page_content=cached_content, metadata={"source": source})]
+        return fetch_cache, cache_key, document
+
+    def _store_fetch_cache(self, fetch_cache, cache_key, source, document):
+        """
+        Stores a freshly fetched, non-empty document in the fetch cache.
+        """
+        if fetch_cache is None or not document or not document[0].page_content.strip():
+            return
+        fetch_cache.put(cache_key, document[0].page_content, url=source)
+
     def extract_links(self, html_content: str) -> list:
         """
         Extracts all hyperlinks from the HTML content.
@@ -231,45 +493,47 @@ class FetchNodeLevelK(BaseNode):
 
         return full_links
 
-    def obtain_content(self, documents: List, loader_kwargs) -> List:
+    def obtain_content(
+        self,
+        sources: List[str],
+        loader_kwargs,
+        frontier: Optional[CrawlFrontier] = None,
+        max_pages: Optional[int] = None,
+    ) -> List:
         """
-        Iterates through documents, fetching and updating content recursively.
+        Fetches the content of the URLs of a depth level, enqueuing the links
+        they contain in the crawl frontier.
 
         Args:
-            documents (List): A list of documents containing the source URLs.
+            sources (List[str]): The URLs to fetch.
             loader_kwargs (dict): Additional arguments for the content loader.
+            frontier (Optional[CrawlFrontier]): The frontier collecting the URLs of
+                the next depth level; None skips the link extraction.
+            max_pages (Optional[int]): Stop after fetching this many pages.
 
         Returns:
-            List: The updated list of documents with fetched content.
+            List: The fetched documents, as dicts with a "source" and a "document" key.
         """
-        new_documents = []
-        for doc in documents:
-            source = doc["source"]
-            if "document" not in doc:
-                try:
-                    document = self.fetch_content(source, loader_kwargs)
-                except Exception as e:
-                    self.logger.warning(
-                        f"Failed to fetch content for {source}: {str(e)}"
-                    )
-                    continue
+        documents = []
+        for source in sources:
+            if max_pages is not None and len(documents) >= max_pages:
+                break
+            try:
+                document = self.fetch_content(source, loader_kwargs)
+            except Exception as e:
+                self.logger.warning(f"Failed to fetch content for {source}: {str(e)}")
+                continue
 
-                if not document or not document[0].page_content.strip():
-                    self.logger.warning(f"Failed to fetch content for {source}")
-                    documents.remove(doc)
-                    continue
+            if not document or not document[0].page_content.strip():
+                self.logger.warning(f"Failed to fetch content for {source}")
+                continue
 
-                doc["document"] = document
-                links = self.extract_links(doc["document"][0].page_content)
-                full_links = self.get_full_links(source, links)
+            documents.append({"source": source, "document": document})
 
-                for link in full_links:
-                    if not any(
-                        d.get("source", "") == link for d in documents
-                    ) and not any(d.get("source", "") == link for d in new_documents):
-                        new_documents.append({"source": link})
+            if frontier is not None:
+                links = self.extract_links(document[0].page_content)
+                frontier.add(self.get_full_links(source, links))
 
-        documents.extend(new_documents)
         return documents
 
     def process_links(
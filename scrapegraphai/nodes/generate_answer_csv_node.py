@@ -12,6 +12,7 @@ from langchain_openai import ChatOpenAI
 from tqdm import tqdm
 
 from ..prompts import TEMPLATE_CHUKS_CSV, TEMPLATE_MERGE_CSV, TEMPLATE_NO_CHUKS_CSV
+from ..utils.llm_cache import cached_chain
 from ..utils.output_parser import (
     get_pydantic_output_parser,
     get_structured_output_parser,
@@ -66,6 +67,7 @@ class GenerateAnswerCSVNode(BaseNode):
         )
 
         self.additional_info = node_config.get("additional_info")
+        self.llm_cache = node_config.get("llm_cache")
 
     def execute(self, state):
         """
@@ -133,7 +135,13 @@ class GenerateAnswerCSVNode(BaseNode):
                 },
             )
 
-            chain = prompt | self.llm_model | output_parser
+            chain = cached_chain(
+                prompt,
+                self.llm_model,
+                output_parser,
+                self.llm_cache,
+                self.node_config.get("schema"),
+            )
             answer = chain.invoke({"question": user_prompt})
             state.update({self.output[0]: answer})
             return state
@@ -152,7 +160,13 @@ class GenerateAnswerCSVNode(BaseNode):
             )
 
             chain_name = f"chunk{i+1}"
-            chains_dict[chain_name] = prompt | self.llm_model | output_parser
+            chains_dict[chain_name] = cached_chain(
+                prompt,
+                self.llm_model,
+                output_parser,
+                self.llm_cache,
+                self.node_config.get("schema"),
+            )
 
         async_runner = RunnableParallel(**chains_dict)
 
@@ -164,7 +178,13 @@ class GenerateAnswerCSVNode(BaseNode):
             partial_variables={"format_instructions": format_instructions},
         )
 
-        merge_chain = merge_prompt | self.llm_model | output_parser
+        merge_chain = cached_chain(
+            merge_prompt,
+            self.llm_model,
+            output_parser,
+            self.llm_cache,
+            self.node_config.get("schema"),
+        )
         answer = merge_chain.invoke({"context": batch_results, "question": user_prompt})
 
         state.update({self.output[0]: answer})
@@ -2,18 +2,17 @@
 GenerateAnswerNode Module
 """
 
-import time
+import asyncio
 import json
+import time
 from typing import List, Optional
 
 from langchain.prompts import PromptTemplate
 from langchain_aws import ChatBedrock
 from langchain_community.chat_models import ChatOllama
 from langchain_core.output_parsers import JsonOutputParser
-from langchain_core.runnables import RunnableParallel
 from langchain_openai import ChatOpenAI
 from requests.exceptions import Timeout
-from tqdm import tqdm
 
 from ..prompts import (
     TEMPLATE_CHUNKS,
@@ -23,7 +22,23 @@ from ..prompts import (
     TEMPLATE_NO_CHUNKS,
     TEMPLATE_NO_CHUNKS_MD,
 )
+from ..utils.async_map import (
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_MAX_RETRIES,
+    aiter_items,
+    amap_bounded,
+    run_sync,
+)
+from ..utils.llm_cache import cached_chain
 from ..utils.output_parser import get_pydantic_output_parser
+from ..utils.split_text_into_chunks import ChunkStream
+from ..utils.token_budget import TokenBudget
+from ..utils.tokenizer import get_token_counter
+from ..utils.tree_reduce import (
+    DEFAULT_MERGE_BUDGET_RATIO,
+    atree_reduce,
+    concat_answers,
+)
 from .base_node import BaseNode
 
 
@@ -47,6 +62,12 @@ class GenerateAnswerNode(BaseNode):
         is_md_scraper (bool): Whether the node is scraping markdown data.
         additional_info (Optional[str]): Any additional information to be
         included in the prompt templates.
+        max_concurrency (int): The maximum number of chunks sent to the LLM
+        at the same time.
+        chunk_retries (int): The number of retries of a chunk whose call fails
+        or exceeds the timeout.
+        model_token (Optional[int]): The context window of the model, bounding
+        the answers merged by one call; None merges all the answers at once.
     """
 
     def __init__(
@@ -71,6 +92,12 @@ class GenerateAnswerNode(BaseNode):
         self.is_md_scraper = node_config.get("is_md_scraper", False)
         self.additional_info = node_config.get("additional_info")
         self.timeout = node_config.get("timeout", 480)
+        self.llm_cache = node_config.get("llm_cache")
+        self.max_concurrency = node_config.get(
+            "max_concurrency", DEFAULT_MAX_CONCURRENCY
+        )
+        self.chunk_retries = node_config.get("chunk_retries", DEFAULT_MAX_RETRIES)
+        self.model_token = node_config.get("model_token")
 
     def invoke_with_timeout(self, chain, inputs, timeout):
         """Helper method to invoke chain with timeout"""
@@ -118,24 +145,19 @@ class GenerateAnswerNode(BaseNode):
             self.logger.error(f"Error in GenerateAnswerNode: {str(e)}")
             raise
 
-    def execute(self, state: dict) -> dict:
-        """
-        Executes the GenerateAnswerNode.
-
-        Args:
-            state (dict): The current state of the graph. The input keys will be used
-                          to fetch the correct data from the state.
-
-        Returns:
-            dict: The updated state with the output key containing the generated answer.
-        """
-        self.logger.info(f"--- Executing {self.node_name} Node ---")
-
-        input_keys = self.get_input_keys(state)
-        input_data = [state[key] for key in input_keys]
-        user_prompt = input_data[0]
-        doc = input_data[1]
+    async def ainvoke_with_timeout(self, chain, inputs, timeout):
+        """Helper method to asynchronously invoke chain with timeout"""
+        try:
+            return await asyncio.wait_for(chain.ainvoke(inputs), timeout)
+        except asyncio.TimeoutError as e:
+            self.logger.error(f"Timeout error: Response took longer than {timeout} seconds")
+            raise Timeout(f"Response took longer than {timeout} seconds") from e
+        except Exception as e:
+            self.logger.error(f"Error during chain execution: {str(e)}")
+            raise
 
+    def _get_output_parser(self):
+        """Returns the output parser and the format instructions for the LLM."""
         if self.node_config.get("schema", None) is not None:
             if isinstance(self.llm_model, ChatOpenAI):
                 output_parser = get_pydantic_output_parser(self.node_config["schema"])
@@ -161,6 +183,16 @@ class GenerateAnswerNode(BaseNode):
                 output_parser = None
                 format_instructions = ""
 
+        return output_parser, format_instructions
+
+    def _get_templates(self, format_instructions: str):
+        """Returns the no-chunks, chunks and merge prompt templates."""
+        # the instructions are appended verbatim to the templates, so literal
+        # braces must not be parsed as template variables
+        escaped_instructions = format_instructions.replace("{", "{{").replace(
+            "}", "}}"
+        )
+
         if (
             not self.script_creator
             or self.force
@@ -168,23 +200,23 @@ class GenerateAnswerNode(BaseNode):
             or self.is_md_scraper
         ):
             template_no_chunks_prompt = (
-                TEMPLATE_NO_CHUNKS_MD + "\n\nIMPORTANT: " + format_instructions
+                TEMPLATE_NO_CHUNKS_MD + "\n\nIMPORTANT: " + escaped_instructions
             )
             template_chunks_prompt = (
-                TEMPLATE_CHUNKS_MD + "\n\nIMPORTANT: " + format_instructions
+                TEMPLATE_CHUNKS_MD + "\n\nIMPORTANT: " + escaped_instructions
             )
             template_merge_prompt = (
-                TEMPLATE_MERGE_MD + "\n\nIMPORTANT: " + format_instructions
+                TEMPLATE_MERGE_MD + "\n\nIMPORTANT: " + escaped_instructions
             )
         else:
             template_no_chunks_prompt = (
-                TEMPLATE_NO_CHUNKS + "\n\nIMPORTANT: " + format_instructions
+                TEMPLATE_NO_CHUNKS + "\n\nIMPORTANT: " + escaped_instructions
             )
             template_chunks_prompt = (
-                TEMPLATE_CHUNKS + "\n\nIMPORTANT: " + format_instructions
+                TEMPLATE_CHUNKS + "\n\nIMPORTANT: " + escaped_instructions
             )
             template_merge_prompt = (
-                TEMPLATE_MERGE + "\n\nIMPORTANT: " + format_instructions
+                TEMPLATE_MERGE + "\n\nIMPORTANT: " + escaped_instructions
             )
 
         if self.additional_info is not None:
@@ -192,78 +224,259 @@ class GenerateAnswerNode(BaseNode):
             template_chunks_prompt = self.additional_info + template_chunks_prompt
             template_merge_prompt = self.additional_info + template_merge_prompt
 
-        if len(doc) == 1:
-            prompt = PromptTemplate(
-                template=template_no_chunks_prompt,
-                input_variables=["question"],
-                partial_variables={
-                    "context": doc,
-                    "format_instructions": format_instructions,
-                },
-            )
-            chain = prompt | self.llm_model
-            if output_parser:
-                chain = chain | output_parser
+        return template_no_chunks_prompt, template_chunks_prompt, template_merge_prompt
 
-            try:
-                answer = self.invoke_with_timeout(
-                    chain, {"question": user_prompt}, self.timeout
-                )
-            except (Timeout, json.JSONDecodeError) as e:
-                error_msg = "Response timeout exceeded" if isinstance(e, Timeout) else "Invalid JSON response format"
-                state.update({self.output[0]: {"error": error_msg, "raw_response": str(e)}})
-                return state
+    def plan_token_budget(self, context_window: int) -> TokenBudget:
+        """
+        Returns the budget of the content sent with the prompts of this node,
+        measured on its single-chunk and chunk templates.
 
-            state.update({self.output[0]: answer})
-            return state
+        Args:
+            context_window (int): The number of tokens of the context window.
+        """
+        _, format_instructions = self._get_output_parser()
+        template_no_chunks_prompt, template_chunks_prompt, _ = self._get_templates(
+            format_instructions
+        )
+        return TokenBudget(
+            context_window,
+            self.llm_model,
+            [template_no_chunks_prompt, template_chunks_prompt],
+            {"format_instructions": format_instructions},
+        )
 
-        chains_dict = {}
-        for i, chunk in enumerate(
-            tqdm(doc, desc="Processing chunks", disable=not self.verbose)
-        ):
-            prompt = PromptTemplate(
-                template=template_chunks_prompt,
-                input_variables=["question"],
-                partial_variables={
+    def _make_chain(self, template, input_variables, partial_variables, output_parser):
+        """Builds the (optionally cached) chain of a prompt template."""
+        prompt = PromptTemplate(
+            template=template,
+            input_variables=input_variables,
+            partial_variables=partial_variables,
+        )
+        return cached_chain(
+            prompt,
+            self.llm_model,
+            output_parser,
+            self.llm_cache,
+            self.node_config.get("schema"),
+        )
+
+    def _get_chain_builders(self):
+        """
+        Returns the functions building the single-chunk chain of a document,
+        the chain of one of its chunks and the merge chain.
+        """
+        output_parser, format_instructions = self._get_output_parser()
+        template_no_chunks_prompt, template_chunks_prompt, template_merge_prompt = (
+            self._get_templates(format_instructions)
+        )
+
+        def no_chunks_chain(doc):
+            return self._make_chain(
+                template_no_chunks_prompt,
+                ["question"],
+                {"context": doc, "format_instructions": format_instructions},
+                output_parser,
+            )
+
+        def chunk_chain(chunk, chunk_id):
+            return self._make_chain(
+                template_chunks_prompt,
+                ["question"],
+                {
                     "context": chunk,
-                    "chunk_id": i + 1,
+                    "chunk_id": chunk_id,
                     "format_instructions": format_instructions,
                 },
+                output_parser,
             )
-            chain_name = f"chunk{i+1}"
-            chains_dict[chain_name] = prompt | self.llm_model
-            if output_parser:
-                chains_dict[chain_name] = chains_dict[chain_name] | output_parser
 
-        async_runner = RunnableParallel(**chains_dict)
-        try:
-            batch_results = self.invoke_with_timeout(
-                async_runner, {"question": user_prompt}, self.timeout
+        def merge_chain():
+            return self._make_chain(
+                template_merge_prompt,
+                ["context", "question"],
+                {"format_instructions": format_instructions},
+                output_parser,
             )
-        except (Timeout, json.JSONDecodeError) as e:
-            error_msg = "Response timeout exceeded during chunk processing" if isinstance(e, Timeout) else "Invalid JSON response format in chunk processing"
-            state.update({self.output[0]: {"error": error_msg, "raw_response": str(e)}})
-            return state
 
-        merge_prompt = PromptTemplate(
-            template=template_merge_prompt,
-            input_variables=["context", "question"],
-            partial_variables={"format_instructions": format_instructions},
+        return no_chunks_chain, chunk_chain, merge_chain
+
+    def _get_inputs(self, state: dict):
+        """
+        Returns the user prompt and the document (list of chunks or ChunkStream)
+        read from the state.
+        """
+        input_keys = self.get_input_keys(state)
+        return state[input_keys[0]], state[input_keys[1]]
+
+    @staticmethod
+    async def _split_head(doc, size: int = 2):
+        """
+        Returns the first chunks of a document and an iterable over the others,
+        pulling only those first chunks out of a ChunkStream.
+        """
+        if not isinstance(doc, ChunkStream):
+            return list(doc[:size]), doc[size:]
+
+        chunks = doc.__aiter__()
+        head = []
+        for _ in range(size):
+            chunk = await anext(chunks, None)
+            if chunk is None:
+                break
+            head.append(chunk)
+        return head, chunks
+
+    def _error_state(
+        self, state: dict, error: BaseException, timeout_msg: str, json_msg: str
+    ) -> dict:
+        """
+        Stores the error answer of a timeout or an invalid JSON response in the
+        state, and re-raises any other error.
+        """
+        if isinstance(error, (Timeout, asyncio.TimeoutError)):
+            error_msg = timeout_msg
+        elif isinstance(error, json.JSONDecodeError):
+            error_msg = json_msg
+        else:
+            raise error
+        self.logger.error(f"{error_msg}: {error}")
+        state.update({self.output[0]: {"error": error_msg, "raw_response": str(error)}})
+        return state
+
+    async def _amap_chains(self, chains, user_prompt: str):
+        """
+        Invokes the chains with at most ``max_concurrency`` in flight, a deadline
+        of ``timeout`` seconds per call and ``chunk_retries`` retries per chain.
+        """
+        return await amap_bounded(
+            lambda chain: chain.ainvoke({"question": user_prompt}),
+            chains,
+            max_concurrency=self.max_concurrency,
+            timeout=self.timeout,
+            max_retries=self.chunk_retries,
         )
 
-        merge_chain = merge_prompt | self.llm_model
-        if output_parser:
-            merge_chain = merge_chain | output_parser
-        try:
-            answer = self.invoke_with_timeout(
-                merge_chain,
-                {"context": batch_results, "question": user_prompt},
-                self.timeout,
+    def _count_tokens(self, answer) -> int:
+        return get_token_counter(self.llm_model).count(str(answer))
+
+    async def _amerge_answers(self, answers: list, user_prompt: str, merge_chain):
+        """
+        Merges the answers of the chunks with a tree reduce: groups of answers
+        filling at most half of the context window of the model are merged in
+        parallel, then their merged answers, until a single answer remains.
+        """
+        budget = (
+            int(self.model_token * DEFAULT_MERGE_BUDGET_RATIO)
+            if self.model_token
+            else None
+        )
+
+        async def _merge(group):
+            context = {f"chunk{i}": answer for i, answer in enumerate(group, start=1)}
+            return await merge_chain().ainvoke(
+                {"context": context, "question": user_prompt}
+            )
+
+        return await atree_reduce(
+            answers,
+            _merge,
+            self._count_tokens,
+            budget=budget,
+            max_concurrency=self.max_concurrency,
+            timeout=self.timeout,
+            max_retries=self.chunk_retries,
+        )
+
+    def execute(self, state: dict) -> dict:
+        """
+        Executes the GenerateAnswerNode.
+
+        Args:
+            state (dict): The current state of the graph. The input keys will be used
+                          to fetch the correct data from the state.
+
+        Returns:
+            dict: The updated state with the output key containing the generated answer.
+        """
+        return run_sync(self.aexecute(state))
+
+    async def aexecute(self, state: dict) -> dict:
+        """
+        Executes the GenerateAnswerNode with ``ainvoke`` on the running event loop.
+
+        The chunks are sent to the LLM with bounded concurrency, each call with
+        its own deadline and retries; when some chunks still fail, the answers of
+        the others are merged. Chunks of a ChunkStream are sent as soon as they
+        are produced.
+
+        Args:
+            state (dict): The current state of the graph. The input keys will be used
+                          to fetch the correct data from the state.
+
+        Returns:
+            dict: The updated state with the output key containing the generated answer.
+        """
+        self.logger.info(f"--- Executing {self.node_name} Node ---")
+
+        user_prompt, doc = self._get_inputs(state)
+        no_chunks_chain, chunk_chain, merge_chain = self._get_chain_builders()
+        head, rest = await self._split_head(doc)
+        if not head:
+            raise ValueError("No content found in state to generate answer from")
+
+        if len(head) == 1:
+            (result,) = await self._amap_chains([no_chunks_chain(head)], user_prompt)
+            if not result.ok:
+                return self._error_state(
+                    state,
+                    result.error,
+                    "Response timeout exceeded",
+                    "Invalid JSON response format",
+                )
+            state.update({self.output[0]: result.value})
+            return state
+
+        async def _chunk_chains():
+            for chunk_id, chunk in enumerate(head, start=1):
+                yield chunk_chain(chunk, chunk_id)
+            chunk_id = len(head)
+            async for chunk in aiter_items(rest):
+                chunk_id += 1
+                yield chunk_chain(chunk, chunk_id)
+
+        results = await self._amap_chains(_chunk_chains(), user_prompt)
+
+        failed = [i for i, result in enumerate(results, start=1) if not result.ok]
+        if len(failed) == len(results):
+            return self._error_state(
+                state,
+                results[0].error,
+                "Response timeout exceeded during chunk processing",
+                "Invalid JSON response format in chunk processing",
             )
-        except (Timeout, json.JSONDecodeError) as e:
-            error_msg = "Response timeout exceeded during merge" if isinstance(e, Timeout) else "Invalid JSON response format during merge"
-            state.update({self.output[0]: {"error": error_msg, "raw_response": str(e)}})
+        if failed:
+            self.logger.warning(
+                f"Merging the answers of {len(results) - len(failed)} of "
+                f"{len(results)} chunks, chunks {failed} failed"
+            )
+        answers = [result.value for result in results if result.ok]
+
+        answer = concat_answers(answers, self.node_config.get("schema"))
+        if answer is not None:
+            # list answers are concatenated without asking the LLM
+            state.update({self.output[0]: answer})
             return state
 
+        try:
+            answer = await self._amerge_answers(answers, user_prompt, merge_chain)
+        except (Timeout, asyncio.TimeoutError, json.JSONDecodeError) as e:
+            return self._error_state(
+                state,
+                e,
+                "Response timeout exceeded during merge",
+                "Invalid JSON response format during merge",
+            )
+
         state.update({self.output[0]: answer})
         return state
+
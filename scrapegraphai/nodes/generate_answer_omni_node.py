@@ -17,6 +17,7 @@ from ..prompts.generate_answer_node_omni_prompts import (
     TEMPLATE_MERGE_OMNI,
     TEMPLATE_NO_CHUNKS_OMNI,
 )
+from ..utils.llm_cache import cached_chain
 from ..utils.output_parser import (
     get_pydantic_output_parser,
     get_structured_output_parser,
@@ -60,6 +61,7 @@ class GenerateAnswerOmniNode(BaseNode):
         )
 
         self.additional_info = node_config.get("additional_info")
+        self.llm_cache = node_config.get("llm_cache")
 
     def execute(self, state: dict) -> dict:
         """
@@ -132,7 +134,13 @@ class GenerateAnswerOmniNode(BaseNode):
                 },
             )
 
-            chain = prompt | self.llm_model | output_parser
+            chain = cached_chain(
+                prompt,
+                self.llm_model,
+                output_parser,
+                self.llm_cache,
+                self.node_config.get("schema"),
+            )
             answer = chain.invoke({"question": user_prompt})
 
             state.update({self.output[0]: answer})
@@ -152,7 +160,13 @@ class GenerateAnswerOmniNode(BaseNode):
             )
 
             chain_name = f"chunk{i+1}"
-            chains_dict[chain_name] = prompt | self.llm_model | output_parser
+            chains_dict[chain_name] = cached_chain(
+                prompt,
+                self.llm_model,
+                output_parser,
+                self.llm_cache,
+                self.node_config.get("schema"),
+            )
 
         async_runner = RunnableParallel(**chains_dict)
 
@@ -164,7 +178,13 @@ class GenerateAnswerOmniNode(BaseNode):
             partial_variables={"format_instructions": format_instructions},
         )
 
-        merge_chain = merge_prompt | self.llm_model | output_parser
+        merge_chain = cached_chain(
+            merge_prompt,
+            self.llm_model,
+            output_parser,
+            self.llm_cache,
+            self.node_config.get("schema"),
+        )
         answer = merge_chain.invoke({"context": batch_results, "question": user_prompt})
 
         state.update({self.output[0]: answer})
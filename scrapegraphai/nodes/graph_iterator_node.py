@@ -3,20 +3,45 @@ GraphIterator Module
 """
 
 import asyncio
-from typing import List, Optional, Type
+import copy
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
 
 from pydantic import BaseModel
 from tqdm.asyncio import tqdm
 
+from ..utils.async_map import amap_bounded, run_sync
+from ..utils.checkpoint import CheckpointStore
+from ..utils.host_limiter import DEFAULT_MAX_DELAY, HostLimiter, is_throttle_error
 from .base_node import BaseNode
 
 DEFAULT_BATCHSIZE = 16
+DEFAULT_HOST_RETRIES = 1
 
 
 class GraphIteratorNode(BaseNode):
     """
     A node responsible for instantiating and running multiple graph instances in parallel.
-    It creates as many graph instances as the number of elements in the input list.
+    It creates as many graph instances as the number of elements in the input list,
+    or with the "reuse_graph" option compiles a single one and runs it for every
+    element, which keeps the LLM client and the nodes shared by all the runs.
+    With a checkpoint store, the elements already completed for the same prompt
+    and schema are skipped and each result is recorded as soon as it completes.
+
+    At most "batchsize" graphs run at the same time, and at most "max_per_host"
+    of them, started "host_delay" seconds apart, scrape the same host. A host
+    answering with a 429/503 or timing out is slowed down and its source is
+    run again up to "host_retries" times; the counters of each host are
+    reported under the "host_stats" key of the state.
 
     Attributes:
         verbose (bool): A flag indicating whether to show print statements during execution.
@@ -60,23 +85,26 @@ class GraphIteratorNode(BaseNode):
             indicating that thenecessary information for running
             the graph instances is missing.
         """
+        return run_sync(self.aexecute(state))
+
+    async def aexecute(self, state: dict) -> dict:
+        """
+        Runs the graph instances concurrently on the running event loop.
+
+        Args:
+            state (dict): The current state of the graph.
+
+        Returns:
+            dict: The updated state with the output key containing the results
+            aggregated out of all parallel graph instances.
+        """
         batchsize = self.node_config.get("batchsize", DEFAULT_BATCHSIZE)
 
         self.logger.info(
             f"--- Executing {self.node_name} Node with batchsize {batchsize} ---"
         )
 
-        try:
-            eventloop = asyncio.get_event_loop()
-        except RuntimeError:
-            eventloop = None
-
-        if eventloop and eventloop.is_running():
-            state = eventloop.run_until_complete(self._async_execute(state, batchsize))
-        else:
-            state = asyncio.run(self._async_execute(state, batchsize))
-
-        return state
+        return await self._async_execute(state, batchsize)
 
     async def _async_execute(self, state: dict, batchsize: int) -> dict:
         """asynchronously executes the node's logic with multiple graph instances
@@ -101,16 +129,56 @@ class GraphIteratorNode(BaseNode):
         user_prompt = input_data[0]
         urls = input_data[1]
 
-        graph_instance = self.node_config.get("graph_instance", None)
-        scraper_config = self.node_config.get("scraper_config", None)
+        graph_instance, scraper_config, reuse_graph = self._get_sub_graph_config()
+        limiter, run_limited = self._host_scheduler(scraper_config)
+        completed = self._completed_sources(user_prompt, urls)
+        pending = [url for url in urls if url not in completed]
+        try:
+            if reuse_graph:
+                results = await self._arun_compiled_graph(
+                    graph_instance,
+                    scraper_config,
+                    user_prompt,
+                    pending,
+                    batchsize,
+                    run_limited,
+                )
+            else:
+                results = await self._arun_graph_instances(
+                    graph_instance,
+                    scraper_config,
+                    user_prompt,
+                    pending,
+                    batchsize,
+                    run_limited,
+                )
+        finally:
+            self._log_host_stats(limiter)
+
+        results = iter(results)
+        answers = [
+            completed[url]["answer"] if url in completed else next(results)
+            for url in urls
+        ]
 
-        if graph_instance is None:
-            raise ValueError("graph instance is required for concurrent execution")
+        state.update({self.output[0]: answers, "host_stats": limiter.stats()})
+
+        return state
 
+    async def _arun_graph_instances(
+        self,
+        graph_class,
+        scraper_config,
+        user_prompt: str,
+        urls: List[str],
+        batchsize,
+        run_limited,
+    ) -> list:
+        """
+        Runs one complete graph instance per URL, all created upfront.
+        """
         graph_instance = [
-            graph_instance(
-                prompt="", source="", config=scraper_config, schema=self.schema
-            )
+            graph_class(prompt="", source="", config=scraper_config, schema=self.schema)
             for _ in range(len(urls))
         ]
 
@@ -127,8 +195,11 @@ class GraphIteratorNode(BaseNode):
         semaphore = asyncio.Semaphore(batchsize)
 
         async def _async_run(graph):
+            # the host slot is taken last, so that its start delay is not
+            # spent waiting for a batch slot
             async with semaphore:
-                return await asyncio.to_thread(graph.run)
+                answer = await run_limited(graph.source, graph.arun)
+            return self._record_result(graph, user_prompt, answer)
 
         for url, graph in zip(urls, graph_instance):
             graph.source = url
@@ -138,10 +209,251 @@ class GraphIteratorNode(BaseNode):
 
         futures = [_async_run(graph) for graph in participants]
 
-        answers = await tqdm.gather(
+        return await tqdm.gather(
             *futures, desc="processing graph instances", disable=not self.verbose
         )
 
-        state.update({self.output[0]: answers})
+    def _get_sub_graph_config(self):
+        """
+        Returns the class of the sub-graph, its config and whether one compiled
+        instance is reused for every source.
+        """
+        graph_instance = self.node_config.get("graph_instance", None)
+        scraper_config = self.node_config.get("scraper_config", None)
 
-        return state
+        if graph_instance is None:
+            raise ValueError("graph instance is required for concurrent execution")
+
+        boilerplate_store = getattr(self, "boilerplate_store", None)
+        if boilerplate_store is not None and scraper_config is not None:
+            # the pages of all the instances are deduplicated against each other
+            scraper_config = {**scraper_config, "boilerplate_filter": boilerplate_store}
+        parse_executor = getattr(self, "parse_executor", None)
+        if parse_executor is not None and scraper_config is not None:
+            # the sub-graphs share the worker processes of the graph
+            scraper_config = {**scraper_config, "parse_executor": parse_executor}
+        if scraper_config is not None and "checkpoint" in scraper_config:
+            # sources are checkpointed here, not by the sub-graphs
+            scraper_config = {
+                key: value
+                for key, value in scraper_config.items()
+                if key != "checkpoint"
+            }
+
+        reuse_graph = self._get_option(scraper_config, "reuse_graph", False)
+        return graph_instance, scraper_config, reuse_graph
+
+    def _get_option(self, scraper_config, key: str, default):
+        """
+        Returns an option of the node, falling back to the config of the sub-graph.
+        """
+        return self.node_config.get(key, (scraper_config or {}).get(key, default))
+
+    def _host_scheduler(self, scraper_config) -> Tuple[HostLimiter, Callable]:
+        """
+        Returns the per-host limiter of a run and a function running the graph
+        of a source within the limits of its host, running it again after the
+        host throttled it.
+        """
+        limiter = HostLimiter(
+            self._get_option(scraper_config, "max_per_host", None),
+            self._get_option(scraper_config, "host_delay", 0.0),
+            self._get_option(scraper_config, "host_max_delay", DEFAULT_MAX_DELAY),
+        )
+        retries = self._get_option(scraper_config, "host_retries", DEFAULT_HOST_RETRIES)
+
+        async def _run_limited(url: str, run: Callable[[], Any]):
+            attempt = 0
+            while True:
+                try:
+                    async with limiter.slot(url):
+                        return await run()
+                except Exception as e:
+                    if attempt >= retries or not is_throttle_error(e):
+                        raise
+                    attempt += 1
+                    self.logger.warning(
+                        f"{url} was throttled ({type(e).__name__}), retrying "
+                        f"{limiter.delay(url):.1f}s after the previous request"
+                    )
+
+        return limiter, _run_limited
+
+    def _log_host_stats(self, limiter: HostLimiter):
+        for host, stats in limiter.stats().items():
+            self.logger.info(
+                f"{host or 'local'}: {stats['succeeded']}/{stats['requests']} succeeded, "
+                f"{stats['throttled']} throttled, {stats['throughput']:.2f} sources/s"
+            )
+
+    def _graph_factory(
+        self, graph_class, scraper_config, user_prompt: str, reuse_graph: bool
+    ) -> Callable[[str], object]:
+        """
+        Returns a function creating the graph of a source: a shallow copy of a
+        graph compiled once when ``reuse_graph`` is set, a new instance otherwise.
+        """
+        if reuse_graph:
+            template = graph_class(
+                prompt=user_prompt, source="", config=scraper_config, schema=self.schema
+            )
+            template.config["graph_depth"] = template.config.get("graph_depth", 0) + 1
+
+        def _make_graph(url: str):
+            if reuse_graph:
+                graph = copy.copy(template)
+            else:
+                graph = graph_class(
+                    prompt=user_prompt,
+                    source="",
+                    config=scraper_config,
+                    schema=self.schema,
+                )
+                graph.config["graph_depth"] = graph.config.get("graph_depth", 0) + 1
+            graph.source = url
+            if url.startswith("http"):
+                graph.input_key = "url"
+            return graph
+
+        return _make_graph
+
+    def _completed_sources(self, user_prompt: str, urls: Iterable[str]) -> dict:
+        """
+        Returns the checkpoint records of the sources already completed for
+        the prompt and the schema, by source.
+        """
+        checkpoint = getattr(self, "checkpoint_store", None)
+        if checkpoint is None:
+            return {}
+
+        completed = {}
+        for url in urls:
+            record = checkpoint.get(
+                CheckpointStore.make_key(url, user_prompt, self.schema)
+            )
+            if record is not None:
+                completed[url] = record
+        if completed:
+            self.logger.info(
+                f"Skipping {len(completed)} sources completed in {checkpoint.path}"
+            )
+        return completed
+
+    def _record_result(self, graph, user_prompt: str, answer):
+        """
+        Records the answer of a graph in the checkpoint store, unless it holds
+        an error so that the source is run again by the next run.
+        """
+        checkpoint = getattr(self, "checkpoint_store", None)
+        if checkpoint is not None and not (
+            isinstance(answer, dict) and "error" in answer
+        ):
+            checkpoint.put(
+                CheckpointStore.make_key(graph.source, user_prompt, self.schema),
+                graph.source,
+                answer,
+                getattr(graph, "execution_info", None),
+            )
+        return answer
+
+    async def _arun_compiled_graph(
+        self,
+        graph_class,
+        scraper_config,
+        user_prompt: str,
+        urls: List[str],
+        batchsize,
+        run_limited,
+    ) -> list:
+        """
+        Compiles the graph once and runs it for every URL through a shallow copy
+        sharing its LLM client and nodes, so that only the state of the runs in
+        flight is allocated. The URLs are pulled as runs complete, at most
+        ``batchsize`` at a time.
+        """
+        make_graph = self._graph_factory(graph_class, scraper_config, user_prompt, True)
+        progress = tqdm(
+            total=len(urls), desc="processing graph instances", disable=not self.verbose
+        )
+
+        async def _run(url: str):
+            try:
+                graph = make_graph(url)
+                answer = await run_limited(url, graph.arun)
+                return self._record_result(graph, user_prompt, answer)
+            finally:
+                progress.update(1)
+
+        try:
+            results = await amap_bounded(
+                _run, urls, max_concurrency=batchsize, max_retries=0
+            )
+        finally:
+            progress.close()
+
+        for result in results:
+            if not result.ok:
+                raise result.error
+        return [result.value for result in results]
+
+    async def aiter_results(
+        self, user_prompt: str, urls: Iterable[str]
+    ) -> AsyncIterator[Tuple[str, Any, list]]:
+        """
+        Runs the graph of every source and yields its result as soon as it
+        completes, with at most ``batchsize`` graphs in flight. Graphs are
+        created only when their source is started.
+
+        A source whose graph raises is yielded with an answer holding the
+        error, so that one failure does not stop the others. Sources completed
+        in the checkpoint store are yielded first, from their records.
+
+        Args:
+            user_prompt (str): The prompt of the graphs.
+            urls (Iterable[str]): The sources.
+
+        Yields:
+            Tuple[str, Any, list]: The source, its answer and the execution info
+            of its graph, in completion order.
+        """
+        batchsize = self.node_config.get("batchsize", DEFAULT_BATCHSIZE)
+        graph_class, scraper_config, reuse_graph = self._get_sub_graph_config()
+        make_graph = self._graph_factory(
+            graph_class, scraper_config, user_prompt, reuse_graph
+        )
+        limiter, run_limited = self._host_scheduler(scraper_config)
+
+        urls = list(urls)
+        completed = self._completed_sources(user_prompt, urls)
+        for url in urls:
+            if url in completed:
+                yield url, completed[url]["answer"], completed[url]["exec_info"]
+
+        async def _run(url: str):
+            try:
+                graph = make_graph(url)
+                answer = await run_limited(url, graph.arun)
+                answer = self._record_result(graph, user_prompt, answer)
+                return url, answer, getattr(graph, "execution_info", None) or []
+            except Exception as e:
+                self.logger.error(f"Graph of {url} failed: {type(e).__name__}: {e}")
+                return url, {"error": f"{type(e).__name__}: {e}"}, []
+
+        sources = (url for url in urls if url not in completed)
+        pending = {
+            asyncio.ensure_future(_run(url)) for url in islice(sources, batchsize)
+        }
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    url = next(sources, None)
+                    if url is not None:
+                        pending.add(asyncio.ensure_future(_run(url)))
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            self._log_host_stats(limiter)
@@ -9,7 +9,7 @@ from langchain_community.chat_models import ChatOllama
 from langchain_core.output_parsers import StrOutputParser
 
 from ..prompts import TEMPLATE_HTML_ANALYSIS, TEMPLATE_HTML_ANALYSIS_WITH_CONTEXT
-from ..utils import reduce_html
+from ..utils.html_document import HTMLDocument
 from .base_node import BaseNode
 
 
@@ -76,8 +76,8 @@ class HtmlAnalyzerNode(BaseNode):
         input_data = [state[key] for key in input_keys]
         refined_prompt = input_data[0]
         html = input_data[1]
-        reduced_html = reduce_html(
-            html[0].page_content, self.node_config.get("reduction", 0)
+        reduced_html = HTMLDocument.from_document(html[0]).reduce(
+            self.node_config.get("reduction", 0)
         )
 
         if self.additional_info is not None:
@@ -11,10 +11,18 @@ from langchain_mistralai import ChatMistralAI
 from langchain_openai import ChatOpenAI
 
 from ..prompts import TEMPLATE_COMBINED
+from ..utils.async_map import DEFAULT_MAX_CONCURRENCY, run_sync
+from ..utils.llm_cache import cached_chain
 from ..utils.output_parser import (
     get_pydantic_output_parser,
     get_structured_output_parser,
 )
+from ..utils.tokenizer import get_token_counter
+from ..utils.tree_reduce import (
+    DEFAULT_MERGE_BUDGET_RATIO,
+    atree_reduce,
+    concat_answers,
+)
 from .base_node import BaseNode
 
 
@@ -25,6 +33,8 @@ class MergeAnswersNode(BaseNode):
     Attributes:
         llm_model: An instance of a language model client, configured for generating answers.
         verbose (bool): A flag indicating whether to show print statements during execution.
+        model_token (Optional[int]): The context window of the model, bounding the
+            answers merged by one call; None merges all the answers at once.
 
     Args:
         input (str): Boolean expression defining the input keys needed from the state.
@@ -53,6 +63,12 @@ class MergeAnswersNode(BaseNode):
         self.verbose = (
             False if node_config is None else node_config.get("verbose", False)
         )
+        self.llm_cache = node_config.get("llm_cache")
+        self.timeout = node_config.get("timeout")
+        self.max_concurrency = node_config.get(
+            "max_concurrency", DEFAULT_MAX_CONCURRENCY
+        )
+        self.model_token = node_config.get("model_token")
 
     def execute(self, state: dict) -> dict:
         """
@@ -70,20 +86,67 @@ class MergeAnswersNode(BaseNode):
             KeyError: If the input keys are not found in the state, indicating
                       that the necessary information for generating an answer is missing.
         """
+        return run_sync(self.aexecute(state))
 
-        self.logger.info(f"--- Executing {self.node_name} Node ---")
+    async def aexecute(self, state: dict) -> dict:
+        """
+        Merges the answers from multiple graph instances with ``ainvoke`` on the
+        running event loop.
 
-        input_keys = self.get_input_keys(state)
+        Answers of a schema made of lists are concatenated without the LLM.
+        Otherwise groups of answers filling at most half of the context window
+        of the model are merged in parallel, then their merged answers, until a
+        single answer remains.
 
-        input_data = [state[key] for key in input_keys]
+        Args:
+            state (dict): The current state of the graph. The input keys will be used
+                            to fetch the correct data from the state.
 
-        user_prompt = input_data[0]
-        answers = input_data[1]
+        Returns:
+            dict: The updated state with the output key containing the generated answer.
+        """
+
+        self.logger.info(f"--- Executing {self.node_name} Node ---")
 
-        answers_str = ""
-        for i, answer in enumerate(answers):
-            answers_str += f"CONTENT WEBSITE {i+1}: {answer}\n"
+        input_keys = self.get_input_keys(state)
+        user_prompt = state[input_keys[0]]
+        answers = list(state[input_keys[1]])
+        if not answers:
+            self.logger.warning("No answers to merge")
+            return self._update_state(state, {})
+
+        answer = concat_answers(answers, self.node_config.get("schema"))
+        if answer is not None:
+            return self._update_state(state, answer)
+
+        token_counter = get_token_counter(self.node_config["llm_model"])
+        merge_chain = self._make_merge_chain()
+
+        async def _merge(group):
+            answers_str = ""
+            for i, group_answer in enumerate(group):
+                answers_str += f"CONTENT WEBSITE {i+1}: {group_answer}\n"
+            return await merge_chain.ainvoke(
+                {"user_prompt": user_prompt, "website_content": answers_str}
+            )
+
+        answer = await atree_reduce(
+            answers,
+            _merge,
+            lambda group_answer: token_counter.count(str(group_answer)),
+            budget=(
+                int(self.model_token * DEFAULT_MERGE_BUDGET_RATIO)
+                if self.model_token
+                else None
+            ),
+            max_concurrency=self.max_concurrency,
+            timeout=self.timeout,
+        )
 
+        return self._update_state(state, answer)
+
+    def _make_merge_chain(self):
+        """Builds the chain merging the answers of several websites."""
         if self.node_config.get("schema", None) is not None:
 
             if isinstance(self.llm_model, (ChatOpenAI, ChatMistralAI)):
@@ -103,16 +166,20 @@ class MergeAnswersNode(BaseNode):
 
         prompt_template = PromptTemplate(
             template=TEMPLATE_COMBINED,
-            input_variables=["user_prompt"],
-            partial_variables={
-                "format_instructions": format_instructions,
-                "website_content": answers_str,
-            },
+            input_variables=["user_prompt", "website_content"],
+            partial_variables={"format_instructions": format_instructions},
         )
 
-        merge_chain = prompt_template | self.llm_model | output_parser
-        answer = merge_chain.invoke({"user_prompt": user_prompt})
+        return cached_chain(
+            prompt_template,
+            self.llm_model,
+            output_parser,
+            self.llm_cache,
+            self.node_config.get("schema"),
+        )
 
+    def _update_state(self, state: dict, answer) -> dict:
+        """Adds the scraped URLs to the merged answer and updates the state."""
         # Get the URLs from the state, ensuring we get the actual URLs used for scraping
         urls = []
         if "urls" in state:
@@ -3,17 +3,38 @@ ParseNode Module
 """
 
 import re
-from typing import List, Optional, Tuple
-from urllib.parse import urljoin
+from typing import Iterator, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
 
-from langchain_community.document_transformers import Html2TextTransformer
 from langchain_core.documents import Document
 
 from ..helpers import default_filters
-from ..utils.split_text_into_chunks import split_text_into_chunks
+from ..utils.html_document import PARSED_HTML_KEY, HTMLDocument
+from ..utils.process_pool import run_cpu_bound
+from ..utils.split_text_into_chunks import (
+    ChunkList,
+    ChunkStream,
+    TextChunk,
+    iter_token_chunks,
+)
+from ..utils.tokenizer import get_token_counter, tokenizer_model, tokenizer_spec
 from .base_node import BaseNode
 
 
+def _document_markdown(document: Document) -> str:
+    """
+    Converts an HTML document to Markdown, in a worker process of the parse executor.
+    """
+    return HTMLDocument.from_document(document).markdown
+
+
+def _chunk_text(text: str, chunk_size: int, tokenizer) -> List[TextChunk]:
+    """
+    Splits a text into chunks, in a worker process of the parse executor.
+    """
+    return list(iter_token_chunks(text, chunk_size, tokenizer_model(tokenizer)))
+
+
 class ParseNode(BaseNode):
     """
     A node responsible for parsing HTML content from a document.
@@ -24,6 +45,14 @@ class ParseNode(BaseNode):
 
     Attributes:
         verbose (bool): A flag indicating whether to show print statements during execution.
+        stream_chunks (bool): Whether to output a ChunkStream producing the chunks while
+            the next node consumes them, instead of the ChunkList of the chunks.
+        boilerplate_store (Optional[BoilerplateStore]): Store of the blocks repeated
+            across the pages of a host, stripped from the document before chunking.
+        token_budget (Optional[TokenBudget]): The budget of the prompts the chunks are
+            sent with, sizing the chunks to fill the context window of the model.
+        parse_executor (Optional[Executor]): Executor converting and chunking the
+            document, e.g. a process pool; None runs them in the node's thread.
 
     Args:
         input (str): Boolean expression defining the input keys needed from the state.
@@ -58,6 +87,10 @@ class ParseNode(BaseNode):
 
         self.llm_model = node_config.get("llm_model")
         self.chunk_size = node_config.get("chunk_size")
+        self.stream_chunks = node_config.get("stream_chunks", False)
+        self.boilerplate_store = node_config.get("boilerplate_store")
+        self.token_budget = node_config.get("token_budget")
+        self.parse_executor = node_config.get("parse_executor")
 
     def execute(self, state: dict) -> dict:
         """
@@ -82,56 +115,172 @@ class ParseNode(BaseNode):
         docs_transformed = input_data[0]
         source = input_data[1] if self.parse_urls else None
 
-        if self.parse_html:
-            docs_transformed = Html2TextTransformer(
-                ignore_links=False
-            ).transform_documents(input_data[0])
-            docs_transformed = docs_transformed[0]
-
-            link_urls, img_urls = self._extract_urls(
-                docs_transformed.page_content, source
-            )
+        docs_transformed = docs_transformed[0]
 
-            chunks = split_text_into_chunks(
-                text=docs_transformed.page_content,
-                chunk_size=self.chunk_size - 250,
-            )
+        if self.parse_html:
+            link_urls, img_urls = self._extract_document_urls(docs_transformed, source)
         else:
-            docs_transformed = docs_transformed[0]
-
             try:
-                link_urls, img_urls = self._extract_urls(
-                    docs_transformed.page_content, source
+                link_urls, img_urls = self._extract_document_urls(
+                    docs_transformed, source
                 )
             except Exception:
                 link_urls, img_urls = "", ""
 
-            chunk_size = self.chunk_size
-            chunk_size = min(chunk_size - 500, int(chunk_size * 0.8))
-
-            if isinstance(docs_transformed, Document):
-                chunks = split_text_into_chunks(
-                    text=docs_transformed.page_content,
-                    chunk_size=chunk_size,
-                )
-            else:
-                chunks = split_text_into_chunks(
-                    text=docs_transformed, chunk_size=chunk_size
-                )
+        chunk_size = self._chunk_size(state)
+        text = self._document_text(docs_transformed)
+        if self.boilerplate_store is not None:
+            text = self._strip_boilerplate(docs_transformed, text, state)
+        chunks = self._iter_chunks(text, chunk_size)
+
+        if self.stream_chunks:
+            # the chunks are produced while the next node consumes them; the
+            # single-use stream is replaced by their list once consumed
+            stream = ChunkStream(
+                chunks, on_exhausted=lambda done: self._publish_chunks(state, done)
+            )
+            state.update({self.output[0]: stream})
+        else:
+            self._publish_chunks(state, ChunkList(chunks))
 
-        state.update({self.output[0]: chunks})
-        state.update({"parsed_doc": chunks})
-        state.update({"content": chunks})
-        
         if self.parse_urls:
             state.update({self.output[1]: link_urls})
             state.update({self.output[2]: img_urls})
 
         return state
 
+    def _publish_chunks(self, state: dict, chunks: ChunkList):
+        """
+        Stores the list of chunks under the output key and the keys other
+        nodes read the parsed document from.
+        """
+        state.update({self.output[0]: chunks})
+        state.update({"parsed_doc": chunks})
+        state.update({"content": chunks})
+
+    def _document_text(self, document) -> str:
+        """
+        Returns the text of the document, converted to Markdown if it is HTML.
+        """
+        if not isinstance(document, Document):
+            return document
+        if not self.parse_html or document.metadata.get("format") == "markdown":
+            # already converted from the page parsed by FetchNode
+            return document.page_content
+        if self.parse_executor is not None:
+            return run_cpu_bound(self.parse_executor, _document_markdown, document)
+        return HTMLDocument.from_document(document).markdown
+
+    def _strip_boilerplate(self, document, text: str, state: dict) -> str:
+        """
+        Removes the blocks of the text repeated across the pages of its host
+        and reports the bytes and tokens removed under the "boilerplate" key
+        of the state.
+        """
+        source = None
+        if isinstance(document, Document):
+            source = document.metadata.get("source")
+        self.boilerplate_store.observe(source, text)
+        result = self.boilerplate_store.strip(source, text)
+        self.boilerplate_store.save_if_due()
+
+        tokens_removed = (
+            get_token_counter(self.llm_model).count("".join(result.removed))
+            if result.removed
+            else 0
+        )
+        state["boilerplate"] = {
+            "blocks_removed": len(result.removed),
+            "bytes_removed": result.bytes_removed,
+            "tokens_removed": tokens_removed,
+        }
+        if result.removed:
+            self.logger.info(
+                f"Removed {len(result.removed)} boilerplate blocks from {source} "
+                f"({result.bytes_removed} bytes, {tokens_removed} tokens)"
+            )
+        return result.text
+
+    def _chunk_size(self, state: dict) -> int:
+        """
+        Returns the number of tokens of each chunk: all the tokens the prompts
+        of the next node leave free with a token budget, otherwise the chunk
+        size minus a fixed headroom for prompts the node does not know.
+        """
+        if self.token_budget is not None:
+            return self.token_budget.chunk_size(state.get("user_prompt") or "")
+
+        if self.parse_html:
+            chunk_size = self.chunk_size - 250
+        else:
+            chunk_size = min(self.chunk_size - 500, int(self.chunk_size * 0.8))
+        return min(chunk_size, int(chunk_size * 0.9))
+
+    def _iter_chunks(self, text: str, chunk_size: int) -> Iterator[TextChunk]:
+        """
+        Returns an iterator over the chunks of the text, counted with the
+        tokenizer of the node's model. With a parse executor the chunks are
+        computed upfront in the executor, unless the tokenizer needs the model.
+        """
+        if self.parse_executor is not None:
+            tokenizer = tokenizer_spec(self.llm_model)
+            if tokenizer is not None:
+                return iter(
+                    run_cpu_bound(
+                        self.parse_executor, _chunk_text, text, chunk_size, tokenizer
+                    )
+                )
+        return iter_token_chunks(text, chunk_size=chunk_size, llm_model=self.llm_model)
+
+    def _extract_document_urls(
+        self, document, source: str
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Extracts the link and image URLs of a document from the anchor, img and
+        srcset attributes of its HTML, parsed once and cached in its metadata.
+        Plain-text inputs fall back to scanning the text with regexes.
+
+        Args:
+            document (Document | str): The document to extract URLs from.
+            source (str): The URL of the document, used to resolve relative URLs.
+
+        Returns:
+            Tuple[List[str], List[str]]: A tuple containing the extracted link URLs and image URLs.
+        """
+        if not self.parse_urls:
+            return [], []
+        if not isinstance(document, Document):
+            return self._extract_urls(document, source)
+
+        base_url = source if source and source.startswith("http") else None
+        parsed_html = document.metadata.get(PARSED_HTML_KEY, {})
+        if "links" in parsed_html:
+            links, images = parsed_html["links"], parsed_html["images"]
+        elif self.parse_html and document.metadata.get("format") != "markdown":
+            page = HTMLDocument.from_document(document, base_url=base_url)
+            links, images = page.links, page.images
+        else:
+            return self._extract_urls(document.page_content, source)
+
+        image_extensions = tuple(default_filters.filter_dict["img_exts"])
+        linked_images = [
+            url
+            for url in links
+            if urlsplit(url).path.lower().endswith(image_extensions)
+        ]
+        if linked_images:
+            linked = set(linked_images)
+            links = [url for url in links if url not in linked]
+            images = list(dict.fromkeys(images + linked_images))
+
+        if base_url is None:
+            links = [url for url in links if url.startswith("http")]
+            images = [url for url in images if url.startswith("http")]
+        return links, images
+
     def _extract_urls(self, text: str, source: str) -> Tuple[List[str], List[str]]:
         """
-        Extracts URLs from the given text.
+        Extracts URLs from the given text with regexes, for inputs that are not HTML.
 
         Args:
             text (str): The text to extract URLs from.
@@ -6,6 +6,7 @@ from typing import List, Optional
 
 from langchain_community.document_transformers import Html2TextTransformer
 
+from ..utils.tokenizer import get_token_counter
 from .base_node import BaseNode
 
 
@@ -18,6 +19,9 @@ class ParseNodeDepthK(BaseNode):
 
     Attributes:
         verbose (bool): A flag indicating whether to show print statements during execution.
+        boilerplate_store (Optional[BoilerplateStore]): Store of the blocks repeated
+            across the pages of a host, stripped from every document once all the
+            documents have been seen.
 
     Args:
         input (str): Boolean expression defining the input keys needed from the state.
@@ -38,6 +42,10 @@ class ParseNodeDepthK(BaseNode):
         self.verbose = (
             False if node_config is None else node_config.get("verbose", False)
         )
+        self.llm_model = None if node_config is None else node_config.get("llm_model")
+        self.boilerplate_store = (
+            None if node_config is None else node_config.get("boilerplate_store")
+        )
 
     def execute(self, state: dict) -> dict:
         """
@@ -68,6 +76,41 @@ class ParseNodeDepthK(BaseNode):
             )
             doc["document"] = document_md[0].page_content
 
+        if self.boilerplate_store is not None:
+            self._strip_boilerplate(documents, state)
+
         state.update({self.output[0]: documents})
 
         return state
+
+    def _strip_boilerplate(self, documents: List[dict], state: dict):
+        """
+        Removes the blocks repeated across the pages of each host from the
+        documents, after observing all of them, and reports the bytes and
+        tokens removed under the "boilerplate" key of the state.
+        """
+        store = self.boilerplate_store
+        for doc in documents:
+            store.observe(doc.get("source"), doc["document"])
+
+        removed = []
+        for doc in documents:
+            result = store.strip(doc.get("source"), doc["document"])
+            doc["document"] = result.text
+            removed.extend(result.removed)
+        store.save()
+
+        removed_text = "".join(removed)
+        report = {
+            "blocks_removed": len(removed),
+            "bytes_removed": len(removed_text.encode("utf-8")),
+            "tokens_removed": (
+                get_token_counter(self.llm_model).count(removed_text) if removed else 0
+            ),
+        }
+        state["boilerplate"] = report
+        self.logger.info(
+            f"Removed {report['blocks_removed']} boilerplate blocks from "
+            f"{len(documents)} pages ({report['bytes_removed']} bytes, "
+            f"{report['tokens_removed']} tokens)"
+        )
@@ -0,0 +1,111 @@
+"""
+RelevanceFilterNode Module
+"""
+
+from typing import List, Optional
+
+from ..utils.relevance import DEFAULT_MIN_SCORE, select_relevant_chunks
+from ..utils.split_text_into_chunks import ChunkList, TextChunk
+from ..utils.tokenizer import get_token_counter
+from .base_node import BaseNode
+
+
+class RelevanceFilterNode(BaseNode):
+    """
+    A node dropping the chunks of a document that are unrelated to the user
+    prompt before they reach the LLM. Chunks are ranked locally with BM25
+    against the prompt and the field names of the schema, without any model
+    call, and only the top ones are stored in the state, as a ChunkList
+    carrying their token counts.
+
+    The number of skipped chunks and the tokens they would have cost are stored
+    under the "relevance_filter" key of the state.
+
+    Attributes:
+        llm_model: The language model whose tokenizer counts the saved tokens.
+        top_k (Optional[int]): Maximum number of chunks kept.
+        min_score (float): Minimum score of a kept chunk relative to the best one.
+
+    Args:
+        input (str): Boolean expression defining the input keys needed from the state.
+        output (List[str]): List of output keys to be updated in the state.
+        node_config (dict): Additional configuration for the node.
+        node_name (str): The unique identifier name for the node, defaulting to "RelevanceFilter".
+    """
+
+    def __init__(
+        self,
+        input: str,
+        output: List[str],
+        node_config: Optional[dict] = None,
+        node_name: str = "RelevanceFilter",
+    ):
+        super().__init__(node_name, "node", input, output, 2, node_config)
+
+        node_config = node_config or {}
+        self.llm_model = node_config.get("llm_model")
+        self.schema = node_config.get("schema")
+        self.top_k = node_config.get("top_k")
+        self.min_score = node_config.get("min_score", DEFAULT_MIN_SCORE)
+        self.verbose = node_config.get("verbose", False)
+
+    def execute(self, state: dict) -> dict:
+        """
+        Keeps the chunks of the parsed document relevant to the user prompt.
+
+        Args:
+            state (dict): The current state of the graph. The input keys will be used
+                            to fetch the correct data from the state.
+
+        Returns:
+            dict: The updated state with the output key containing the relevant chunks.
+
+        Raises:
+            KeyError: If the input keys are not found in the state.
+        """
+        self.logger.info(f"--- Executing {self.node_name} Node ---")
+
+        input_keys = self.get_input_keys(state)
+        user_prompt, document = state[input_keys[0]], state[input_keys[1]]
+        chunks = list(document)
+        # counted when chunking, by ParseNode's ChunkList or ChunkStream
+        token_counts = getattr(document, "token_counts", None)
+
+        kept = select_relevant_chunks(
+            chunks, self._query(user_prompt), top_k=self.top_k, min_score=self.min_score
+        )
+        skipped = sorted(set(range(len(chunks))) - set(kept))
+
+        if not token_counts or len(token_counts) != len(chunks):
+            counter = get_token_counter(self.llm_model)
+            token_counts = [counter.count(chunk) for chunk in chunks]
+        tokens_saved = sum(token_counts[i] for i in skipped)
+        report = {
+            "chunks": len(chunks),
+            "kept": len(kept),
+            "skipped": len(skipped),
+            "tokens_saved": tokens_saved,
+        }
+        self.logger.info(
+            f"Skipped {report['skipped']} of {report['chunks']} chunks unrelated "
+            f"to the prompt, saving {report['tokens_saved']} tokens"
+        )
+
+        relevant_chunks = ChunkList(TextChunk(chunks[i], token_counts[i]) for i in kept)
+        state.update({self.output[0]: relevant_chunks, "relevance_filter": report})
+        return state
+
+    def _query(self, user_prompt: str) -> str:
+        """
+        Returns the prompt extended with the field names of the schema, which
+        often name the content to find better than the prompt itself.
+        """
+        schema = self.schema
+        if schema is None:
+            return user_prompt
+        if isinstance(schema, dict):
+            fields = list(schema.get("properties") or {})
+        else:
+            fields = list(getattr(schema, "model_fields", None) or {})
+        names = " ".join(field.replace("_", " ") for field in fields)
+        return f"{user_prompt} {names}"
@@ -2,6 +2,7 @@
     __init__.py file for utils folder
 """
 
+from .async_map import MapResult, amap_bounded
 from .cleanup_code import extract_code
 from .cleanup_html import cleanup_html, reduce_html
 from .code_error_analysis import (
@@ -19,6 +20,8 @@ from .code_error_correction import (
 from .convert_to_md import convert_to_md
 from .data_export import export_to_csv, export_to_json, export_to_xml
 from .dict_content_compare import are_content_equal
+from .html_document import HTMLDocument
+from .jsonl_sink import JSONLSink
 from .llm_callback_manager import CustomLLMCallbackManager
 from .logging import (
     get_logger,
@@ -53,13 +56,14 @@ from .screenshot_scraping.screenshot_preparation import (
 from .screenshot_scraping.text_detection import detect_text
 from .split_text_into_chunks import split_text_into_chunks
 from .sys_dynamic_import import dynamic_import, srcfile_import
-from .tokenizer import num_tokens_calculus
+from .tokenizer import TokenCounter, get_token_counter, num_tokens_calculus
 
 __all__ = [
     # Code cleanup and analysis
     "extract_code",
     "cleanup_html",
     "reduce_html",
+    "HTMLDocument",
     # Error analysis functions
     "execution_focused_analysis",
     "semantic_focused_analysis",
@@ -75,6 +79,7 @@ __all__ = [
     "export_to_csv",
     "export_to_json",
     "export_to_xml",
+    "JSONLSink",
     "save_audio_from_bytes",
     "save_code_to_file",
     # Utility functions
@@ -83,9 +88,13 @@ __all__ = [
     "prettify_exec_info",
     "transform_schema",
     "split_text_into_chunks",
+    "amap_bounded",
+    "MapResult",
     "dynamic_import",
     "srcfile_import",
     "num_tokens_calculus",
+    "get_token_counter",
+    "TokenCounter",
     # Proxy handling
     "Proxy",
     "parse_or_search_proxy",
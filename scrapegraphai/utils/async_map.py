@@ -0,0 +1,236 @@
+"""
+async_map module
+"""
+
+import asyncio
+import contextvars
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+from .logging import get_logger
+
+logger = get_logger("async-map")
+
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_MAX_RETRIES = 1
+DEFAULT_RETRY_BACKOFF = 1.0
+
+
+class MapResult(NamedTuple):
+    """
+    The outcome of one item of ``amap_bounded``.
+
+    Attributes:
+        value: The value returned for the item, None if it failed.
+        error (Optional[BaseException]): The error of the last attempt, None on success.
+        attempts (int): The number of attempts made.
+    """
+
+    value: Any
+    error: Optional[BaseException]
+    attempts: int
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+async def aiter_items(items: Union[Iterable, AsyncIterable]) -> AsyncIterator:
+    """
+    Iterates asynchronously over an iterable or an async iterable alike.
+    """
+    if hasattr(items, "__aiter__"):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def amap_bounded(
+    fn: Callable[[Any], Awaitable[Any]],
+    items: Union[Iterable, AsyncIterable],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    timeout: Optional[float] = None,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+) -> List[MapResult]:
+    """
+    Applies an async function to every item with at most ``max_concurrency``
+    calls in flight.
+
+    Each attempt is cancelled once it runs longer than ``timeout`` seconds.
+    Failed or timed-out items are retried on their own up to ``max_retries``
+    times, waiting ``retry_backoff`` seconds doubled at every retry; an item
+    failing every attempt does not stop the others, so the results of the
+    successful items are always returned. Items are pulled from the iterable
+    only when a slot is free, so a lazily produced input is consumed at the
+    pace of the calls.
+
+    Args:
+        fn: The async function to apply.
+        items: The items, as an iterable or an async iterable.
+        max_concurrency (int): Maximum number of calls in flight.
+        timeout (Optional[float]): Deadline of each attempt in seconds; None disables it.
+        max_retries (int): Number of retries of a failed item.
+        retry_backoff (float): Delay in seconds before the first retry.
+
+    Returns:
+        List[MapResult]: The outcome of each item, in the order of the items.
+
+    Example:
+        >>> results = await amap_bounded(fetch, urls, max_concurrency=4, timeout=30)
+        >>> pages = [result.value for result in results if result.ok]
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1.")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _run(index: int, item) -> MapResult:
+        try:
+            for attempt in range(1, max_retries + 2):
+                try:
+                    value = await asyncio.wait_for(fn(item), timeout)
+                    return MapResult(value, None, attempt)
+                except Exception as e:
+                    error = e
+                    if attempt > max_retries:
+                        break
+                    logger.warning(
+                        f"Item {index} failed (attempt {attempt}), retrying: "
+                        f"{type(e).__name__}: {e}"
+                    )
+                    await asyncio.sleep(retry_backoff * 2 ** (attempt - 1))
+            return MapResult(None, error, attempt)
+        finally:
+            semaphore.release()
+
+    tasks = []
+    try:
+        await semaphore.acquire()
+        async for item in aiter_items(items):
+            tasks.append(asyncio.create_task(_run(len(tasks), item)))
+            await semaphore.acquire()
+        semaphore.release()
+        return list(await asyncio.gather(*tasks))
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+_shared_loop: Optional[asyncio.AbstractEventLoop] = None
+_shared_loop_thread: Optional[threading.Thread] = None
+_shared_loop_lock = threading.Lock()
+
+
+def get_shared_loop() -> asyncio.AbstractEventLoop:
+    """
+    Returns the event loop running the coroutines of synchronous callers,
+    started on first use in a daemon thread and kept for the whole process.
+
+    Async clients stay bound to the loop they were first used on, e.g. the
+    httpx client langchain-openai shares across the process, so every
+    synchronous run must use the same loop rather than a new one per call.
+    """
+    global _shared_loop, _shared_loop_thread
+    with _shared_loop_lock:
+        if _shared_loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="scrapegraphai-loop", daemon=True
+            )
+            thread.start()
+            _shared_loop, _shared_loop_thread = loop, thread
+        return _shared_loop
+
+
+def run_sync(coro: Coroutine) -> Any:
+    """
+    Runs a coroutine to completion from synchronous code, on the shared event
+    loop of ``get_shared_loop``, and waits for its result.
+    """
+    loop = get_shared_loop()
+    if threading.current_thread() is _shared_loop_thread:
+        # waiting on the shared loop from its own thread would deadlock
+        context = contextvars.copy_context()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(context.run, asyncio.run, coro).result()
+
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    try:
+        return future.result()
+    except BaseException:
+        future.cancel()
+        raise
+
+
+def iter_sync(aiterable: AsyncIterable) -> Iterator:
+    """
+    Iterates over an async iterable from synchronous code.
+
+    The iterable is consumed on the shared event loop of ``get_shared_loop``,
+    so it keeps making progress while the caller processes the items; leaving
+    the loop early cancels it.
+    """
+    loop = get_shared_loop()
+    if threading.current_thread() is _shared_loop_thread:
+        raise RuntimeError("iter_sync cannot be called from the shared event loop.")
+
+    items = queue.Queue()
+    started = threading.Event()
+    running = {}
+    done = object()
+
+    async def _consume():
+        try:
+            async for item in aiterable:
+                items.put((item, None))
+        finally:
+            aclose = getattr(aiterable, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    def _finished(task: asyncio.Task):
+        error = None if task.cancelled() else task.exception()
+        items.put((done, error))
+
+    def _start():
+        running["task"] = loop.create_task(_consume())
+        running["task"].add_done_callback(_finished)
+        started.set()
+
+    # the task is created with a copy of the caller's context
+    loop.call_soon_threadsafe(_start)
+    finished = False
+    try:
+        while True:
+            item, error = items.get()
+            if item is done:
+                finished = True
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        if not finished:
+            started.wait()
+            loop.call_soon_threadsafe(running["task"].cancel)
+            # wait for the iterable to be closed
+            while items.get()[0] is not done:
+                pass
@@ -0,0 +1,320 @@
+"""
+boilerplate module
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import random
+import re
+import tempfile
+import threading
+import weakref
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+from .logging import get_logger
+
+logger = get_logger("boilerplate")
+
+DEFAULT_MIN_PAGES = 2
+DEFAULT_MIN_BLOCK_CHARS = 20
+DEFAULT_MAX_SIGNATURES_PER_HOST = 20000
+DEFAULT_SAVE_EVERY = 50
+
+SHINGLE_SIZE = 5
+MINHASH_BANDS = 4
+MINHASH_ROWS = 4
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(0x5C4A9E)
+# fixed permutations, so that signatures stay comparable across processes and runs
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(MINHASH_BANDS * MINHASH_ROWS)
+]
+
+_BLOCK_SEPARATOR = re.compile(r"\n[ \t]*\n")
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def _hash(data: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(data.encode("utf-8"), digest_size=8).digest(), "big"
+    )
+
+
+def block_signature(block: str) -> List[str]:
+    """
+    Returns the MinHash band keys of a block of text, computed over the
+    character shingles of its words so that blocks differing by a few words
+    (a date, a counter) share at least one key.
+
+    Args:
+        block (str): The block of text.
+
+    Returns:
+        List[str]: One key per band, empty for a block without words.
+    """
+    normalized = " ".join(_WORD_PATTERN.findall(block.lower()))
+    if not normalized:
+        return []
+    shingles = {
+        normalized[i : i + SHINGLE_SIZE]
+        for i in range(max(1, len(normalized) - SHINGLE_SIZE + 1))
+    }
+    hashes = [_hash(shingle) for shingle in shingles]
+    minhash = [
+        min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in _PERMUTATIONS
+    ]
+    bands = [
+        (band, minhash[band * MINHASH_ROWS : (band + 1) * MINHASH_ROWS])
+        for band in range(MINHASH_BANDS)
+    ]
+    return [
+        hashlib.blake2b(repr(band).encode(), digest_size=8).hexdigest()
+        for band in bands
+    ]
+
+
+def split_blocks(text: str) -> List[str]:
+    """
+    Splits a text into blocks separated by blank lines, keeping the separators
+    so that joining the blocks gives the text back.
+    """
+    blocks, start = [], 0
+    for match in _BLOCK_SEPARATOR.finditer(text):
+        blocks.append(text[start : match.end()])
+        start = match.end()
+    if start < len(text):
+        blocks.append(text[start:])
+    return blocks
+
+
+def _host(source: Optional[str]) -> Optional[str]:
+    if not source or not source.startswith("http"):
+        return None
+    return urlsplit(source).netloc.lower() or None
+
+
+class StripResult(NamedTuple):
+    """
+    The outcome of ``BoilerplateStore.strip``.
+
+    Attributes:
+        text (str): The text without its boilerplate blocks.
+        removed (List[str]): The removed blocks.
+    """
+
+    text: str
+    removed: List[str]
+
+    @property
+    def bytes_removed(self) -> int:
+        return sum(len(block.encode("utf-8")) for block in self.removed)
+
+
+class BoilerplateStore:
+    """
+    Signatures of the blocks of text seen on the pages of each host, used to
+    strip the blocks repeated across pages (headers, footers, navigation)
+    before a page is chunked and sent to the LLM.
+
+    A block is boilerplate once a near-duplicate of it was seen on
+    ``min_pages`` distinct pages of the same host. Pages are first observed
+    then stripped, so a batch of pages can be observed before any of them is
+    stripped. With a ``path`` the signatures are kept in a JSON file, so the
+    boilerplate learnt by a run is stripped from the first page of the next;
+    the file is rewritten every ``save_every`` pages and when the process exits.
+
+    Attributes:
+        path (Optional[str]): JSON file holding the signatures; None keeps them in memory.
+        min_pages (int): Number of pages a block must appear on to be boilerplate.
+        min_block_chars (int): Blocks shorter than this are never stripped.
+        max_signatures_per_host (int): Signatures kept per host, the oldest are dropped.
+        save_every (int): Number of pages observed between two saves by ``save_if_due``.
+
+    Example:
+        >>> store = BoilerplateStore()
+        >>> for url, text in pages:
+        ...     store.observe(url, text)
+        >>> store.strip(url, text).text
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        min_pages: int = DEFAULT_MIN_PAGES,
+        min_block_chars: int = DEFAULT_MIN_BLOCK_CHARS,
+        max_signatures_per_host: int = DEFAULT_MAX_SIGNATURES_PER_HOST,
+        save_every: int = DEFAULT_SAVE_EVERY,
+    ):
+        self.path = path
+        self.min_pages = min_pages
+        self.min_block_chars = min_block_chars
+        self.max_signatures_per_host = max_signatures_per_host
+        self.save_every = save_every
+
+        self._lock = threading.Lock()
+        # pages observed since the signatures were last written to path
+        self._unsaved_pages = 0
+        # host -> band key -> pages the key was seen on (at most min_pages)
+        self._signatures: Dict[str, Dict[str, List[str]]] = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self._signatures = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable boilerplate store {path}: {e}")
+        if path:
+            _stores_with_path.add(self)
+
+    def _blocks(self, text: str) -> List[Tuple[str, List[str]]]:
+        return [
+            (
+                block,
+                (
+                    block_signature(block)
+                    if len(block.strip()) >= self.min_block_chars
+                    else []
+                ),
+            )
+            for block in split_blocks(text)
+        ]
+
+    def observe(self, source: str, text: str):
+        """
+        Records the blocks of a page.
+
+        Args:
+            source (str): The URL of the page; pages without a host are ignored.
+            text (str): The text of the page.
+        """
+        host = _host(source)
+        if host is None:
+            return
+        blocks = self._blocks(text)
+        with self._lock:
+            signatures = self._signatures.setdefault(host, {})
+            for _, keys in blocks:
+                for key in keys:
+                    pages = signatures.pop(key, [])
+                    if source not in pages and len(pages) < self.min_pages:
+                        pages.append(source)
+                    # re-inserted last, so that the oldest keys are dropped first
+                    signatures[key] = pages
+            while len(signatures) > self.max_signatures_per_host:
+                del signatures[next(iter(signatures))]
+            self._unsaved_pages += 1
+
+    def strip(self, source: str, text: str) -> StripResult:
+        """
+        Removes the boilerplate blocks of a page.
+
+        Args:
+            source (str): The URL of the page.
+            text (str): The text of the page.
+
+        Returns:
+            StripResult: The remaining text and the removed blocks.
+        """
+        host = _host(source)
+        if host is None:
+            return StripResult(text, [])
+        blocks = self._blocks(text)
+        with self._lock:
+            signatures = self._signatures.get(host, {})
+            kept, removed = [], []
+            for block, keys in blocks:
+                if any(len(signatures.get(key, ())) >= self.min_pages for key in keys):
+                    removed.append(block)
+                else:
+                    kept.append(block)
+        return StripResult("".join(kept), removed)
+
+    def save_if_due(self):
+        """
+        Writes the signatures to ``path`` once ``save_every`` pages were observed
+        since the last save, so that pages are not each followed by a rewrite
+        of the whole file. The remaining pages are saved at exit.
+        """
+        if self._unsaved_pages >= self.save_every:
+            self.save()
+
+    def save(self):
+        """
+        Writes the signatures to ``path`` atomically; does nothing in memory
+        or when no page was observed since the last save.
+        """
+        if not self.path:
+            return
+        with self._lock:
+            pending = self._unsaved_pages
+            if not pending:
+                return
+            data = json.dumps(self._signatures)
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        with self._lock:
+            self._unsaved_pages -= pending
+
+
+_shared_stores: Dict[tuple, BoilerplateStore] = {}
+_shared_stores_lock = threading.Lock()
+_stores_with_path: "weakref.WeakSet[BoilerplateStore]" = weakref.WeakSet()
+
+
+def _save_stores():
+    for store in list(_stores_with_path):
+        try:
+            store.save()
+        except OSError as e:
+            logger.warning(f"Could not save boilerplate store {store.path}: {e}")
+
+
+atexit.register(_save_stores)
+
+
+def create_boilerplate_store(
+    boilerplate_filter: Union[bool, dict, BoilerplateStore, None],
+) -> Optional[BoilerplateStore]:
+    """
+    Builds the boilerplate store described by the ``boilerplate_filter`` graph config.
+
+    Args:
+        boilerplate_filter: False/None disables the filter, True uses a store
+            living as long as the graph, a dict sets the options of the store,
+            e.g. ``{"min_pages": 3}`` or ``{"path": "./boilerplate.json"}`` to
+            keep the signatures across runs, and a BoilerplateStore instance is
+            used as is.
+
+    Returns:
+        Optional[BoilerplateStore]: The store; stores with a path are shared by
+        every graph using the same file.
+    """
+    if not boilerplate_filter:
+        return None
+    if isinstance(boilerplate_filter, BoilerplateStore):
+        return boilerplate_filter
+
+    options = dict(boilerplate_filter) if isinstance(boilerplate_filter, dict) else {}
+    if not options.get("path"):
+        return BoilerplateStore(**options)
+
+    options["path"] = os.path.abspath(options["path"])
+    key = tuple(sorted(options.items()))
+    with _shared_stores_lock:
+        store = _shared_stores.get(key)
+        if store is None:
+            store = BoilerplateStore(**options)
+            _shared_stores[key] = store
+        return store
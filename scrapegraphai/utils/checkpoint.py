@@ -0,0 +1,147 @@
+"""
+checkpoint module
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Union
+
+from .jsonl_sink import JSONLSink
+from .logging import get_logger
+
+logger = get_logger("checkpoint")
+
+
+def _digest(data: str) -> str:
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()[:16]
+
+
+def prompt_hash(prompt: Optional[str]) -> str:
+    """
+    Returns the hash of a prompt.
+    """
+    return _digest(prompt or "")
+
+
+def schema_hash(schema) -> str:
+    """
+    Returns the hash of a pydantic model or JSON schema; empty without a schema.
+    """
+    if schema is None:
+        return ""
+    if hasattr(schema, "model_json_schema"):
+        schema = schema.model_json_schema()
+    return _digest(json.dumps(schema, sort_keys=True, default=str))
+
+
+class CheckpointStore:
+    """
+    Append-only journal of the results of the sources of batch runs, so that
+    a rerun of an interrupted job skips the sources already completed.
+
+    Each completed source is appended as one JSON line as soon as it finishes,
+    keyed by the source, the hash of the prompt and the hash of the schema, so
+    that changing the prompt or the schema runs the sources again. The journal
+    is read once when the store is opened; the last record of a key wins and
+    a line truncated by a crash is dropped before new records are appended.
+
+    Answers are stored as JSON: a pydantic answer is restored as its dict, the
+    form the graphs return, and other values JSON does not handle as strings.
+
+    Attributes:
+        path (str): The JSONL journal.
+
+    Example:
+        >>> store = CheckpointStore("./checkpoint.jsonl")
+        >>> key = CheckpointStore.make_key(url, prompt, schema)
+        >>> if store.get(key) is None:
+        ...     store.put(key, url, answer)
+    """
+
+    def __init__(self, path: str, fsync: bool = False):
+        self.path = path
+        self._records: Dict[str, dict] = {}
+        for record in JSONLSink.read(path):
+            if "key" in record:
+                self._records[record["key"]] = record
+        if self._records:
+            logger.info(f"Loaded {len(self._records)} completed sources from {path}")
+        self._sink = JSONLSink(path, fsync=fsync)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(source: str, prompt: Optional[str], schema=None) -> str:
+        """
+        Returns the key of a source for a prompt and a schema.
+        """
+        return _digest(f"{source}\0{prompt_hash(prompt)}\0{schema_hash(schema)}")
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Returns the record of a completed source, with its "source", "answer"
+        and "exec_info", or None if it has not completed.
+        """
+        with self._lock:
+            return self._records.get(key)
+
+    def put(self, key: str, source: str, answer: Any, exec_info: Optional[list] = None):
+        """
+        Records the result of a completed source.
+        """
+        record = {
+            "key": key,
+            "source": source,
+            "answer": answer,
+            "exec_info": exec_info or [],
+            "completed_at": time.time(),
+        }
+        with self._lock:
+            self._records[key] = record
+        self._sink.write(record)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._records)
+
+
+_shared_stores: Dict[str, CheckpointStore] = {}
+_shared_stores_lock = threading.Lock()
+
+
+def create_checkpoint_store(
+    checkpoint: Union[str, dict, CheckpointStore, None],
+) -> Optional[CheckpointStore]:
+    """
+    Builds the checkpoint store described by the ``checkpoint`` graph config.
+
+    Args:
+        checkpoint: None disables checkpointing, a path selects the journal,
+            a dict such as ``{"path": "./checkpoint.jsonl", "fsync": True}``
+            also sets its options, and a CheckpointStore instance is used as is.
+
+    Returns:
+        Optional[CheckpointStore]: The store, or None when disabled; stores are
+        shared by every graph using the same journal, so that it has a single writer.
+
+    Raises:
+        ValueError: If a dict config has no "path".
+    """
+    if not checkpoint:
+        return None
+    if isinstance(checkpoint, CheckpointStore):
+        return checkpoint
+
+    options = dict(checkpoint) if isinstance(checkpoint, dict) else {"path": checkpoint}
+    if not options.get("path"):
+        raise ValueError("The checkpoint config requires a 'path'.")
+
+    path = os.path.abspath(options.pop("path"))
+    with _shared_stores_lock:
+        store = _shared_stores.get(path)
+        if store is None:
+            store = CheckpointStore(path, **options)
+            _shared_stores[path] = store
+        return store
@@ -2,11 +2,9 @@
 Module for minimizing the code
 """
 
-import re
-from urllib.parse import urljoin
+from .html_document import HTMLDocument, minify_html
 
-from bs4 import BeautifulSoup, Comment
-from minify_html import minify
+__all__ = ["cleanup_html", "minify_html", "reduce_html"]
 
 
 def cleanup_html(html_content: str, base_url: str) -> str:
@@ -29,58 +27,7 @@ def cleanup_html(html_content: str, base_url: str) -> str:
     This function is particularly useful for preparing HTML content for
     environments where bandwidth usage needs to be minimized.
     """
-
-    soup = BeautifulSoup(html_content, "html.parser")
-
-    title_tag = soup.find("title")
-    title = title_tag.get_text() if title_tag else ""
-
-    for tag in soup.find_all(["script", "style"]):
-        tag.extract()
-
-    link_urls = [
-        urljoin(base_url, link["href"]) for link in soup.find_all("a", href=True)
-    ]
-
-    images = soup.find_all("img")
-    image_urls = []
-    for image in images:
-        if "src" in image.attrs:
-            if "http" not in image["src"]:
-                image_urls.append(urljoin(base_url, image["src"]))
-            else:
-                image_urls.append(image["src"])
-
-    body_content = soup.find("body")
-    if body_content:
-        minimized_body = minify(str(body_content))
-        return title, minimized_body, link_urls, image_urls
-
-    else:
-        raise ValueError(
-            f"""No HTML body content found, please try setting the 'headless'
-                         flag to False in the graph configuration. HTML content: {html_content}"""
-        )
-
-
-def minify_html(html):
-    """
-    minify_html function
-    """
-    # Combine multiple regex operations into one for better performance
-    patterns = [
-        (r"<!--.*?-->", "", re.DOTALL),
-        (r">\s+<", "><", 0),
-        (r"\s+>", ">", 0),
-        (r"<\s+", "<", 0),
-        (r"\s+", " ", 0),
-        (r"\s*=\s*", "=", 0),
-    ]
-
-    for pattern, repl, flags in patterns:
-        html = re.sub(pattern, repl, html, flags=flags)
-
-    return html.strip()
+    return HTMLDocument(html_content, base_url=base_url).cleanup()
 
 
 def reduce_html(html, reduction):
@@ -98,39 +45,4 @@ def reduce_html(html, reduction):
     Returns:
         str: The reduced HTML content based on the specified reduction level.
     """
-    if reduction == 0:
-        return minify_html(html)
-
-    soup = BeautifulSoup(html, "html.parser")
-
-    for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
-        comment.extract()
-
-    for tag in soup(["script", "style"]):
-        tag.string = ""
-
-    attrs_to_keep = ["class", "id", "href", "src"]
-    for tag in soup.find_all(True):
-        for attr in list(tag.attrs):
-            if attr not in attrs_to_keep:
-                del tag[attr]
-
-    if reduction == 1:
-        return minify_html(str(soup))
-
-    for tag in soup(["script", "style"]):
-        tag.decompose()
-
-    body = soup.body
-    if not body:
-        return "No <body> tag found in the HTML"
-
-    for tag in body.find_all(string=True):
-        if tag.parent.name not in ["script", "style"]:
-            tag.replace_with(re.sub(r"\s+", " ", tag.strip())[:20])
-
-    reduced_html = str(body)
-
-    reduced_html = minify_html(reduced_html)
-
-    return reduced_html
+    return HTMLDocument(html).reduce(reduction)
@@ -0,0 +1,111 @@
+"""
+crawl_frontier module
+"""
+
+from collections import deque
+from typing import Deque, Iterable, List, Set
+from urllib.parse import urlsplit, urlunsplit
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalizes a URL so that equivalent spellings map to the same string.
+
+    The scheme and host are lowercased, default ports, fragments and an
+    empty path are dropped; the query string is kept as is.
+
+    Args:
+        url (str): The URL to normalize.
+
+    Returns:
+        str: The normalized URL.
+
+    Example:
+        >>> normalize_url("HTTPS://Example.com:443/#top")
+        'https://example.com/'
+    """
+    try:
+        parts = urlsplit(url.strip())
+        scheme = parts.scheme.lower()
+        host = (parts.hostname or "").lower()
+        port = parts.port
+    except ValueError:
+        return url.strip()
+
+    netloc = host
+    if parts.username or parts.password:
+        userinfo = parts.username or ""
+        if parts.password:
+            userinfo += f":{parts.password}"
+        netloc = f"{userinfo}@{netloc}"
+    if port is not None and DEFAULT_PORTS.get(scheme) != port:
+        netloc += f":{port}"
+
+    return urlunsplit((scheme, netloc, parts.path or "/", parts.query, ""))
+
+
+class CrawlFrontier:
+    """
+    Breadth-first crawl frontier with a hash set of the normalized URLs seen.
+
+    Every URL is enqueued at most once, at the first depth it is discovered,
+    so building a crawl of N pages and L links costs O(N + L).
+
+    Attributes:
+        depth (int): The depth of the URLs currently being crawled, starting at 0.
+
+    Example:
+        >>> frontier = CrawlFrontier(["https://example.com"])
+        >>> frontier.pop_level()
+        ['https://example.com']
+        >>> frontier.add(["https://example.com/a", "https://example.com/#top"])
+        1
+        >>> frontier.pop_level()
+        ['https://example.com/a']
+    """
+
+    def __init__(self, seeds: Iterable[str]):
+        self.depth = -1
+        self._seen: Set[str] = set()
+        self._next: Deque[str] = deque()
+        self.add(seeds)
+
+    def __contains__(self, url: str) -> bool:
+        return normalize_url(url) in self._seen
+
+    def __len__(self) -> int:
+        return len(self._next)
+
+    def add(self, urls: Iterable[str]) -> int:
+        """
+        Enqueues the URLs not seen yet for the next depth level.
+
+        Args:
+            urls (Iterable[str]): The discovered URLs.
+
+        Returns:
+            int: The number of URLs enqueued.
+        """
+        added = 0
+        for url in urls:
+            key = normalize_url(url)
+            if key in self._seen:
+                continue
+            self._seen.add(key)
+            self._next.append(url)
+            added += 1
+        return added
+
+    def pop_level(self) -> List[str]:
+        """
+        Moves to the next depth level and returns its URLs in discovery order.
+
+        Returns:
+            List[str]: The URLs to crawl at the new depth.
+        """
+        self.depth += 1
+        level = list(self._next)
+        self._next.clear()
+        return level
@@ -0,0 +1,302 @@
+"""
+fetch_cache module
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Dict, Optional
+
+from .logging import get_logger
+
+logger = get_logger("fetch-cache")
+
+DEFAULT_CACHE_TTL = 24 * 60 * 60
+DEFAULT_CACHE_MAX_SIZE = 1024 * 1024 * 1024
+
+
+class FetchCache:
+    """
+    On-disk cache for fetched page content.
+
+    Entries are keyed by the URL plus the loader options used to fetch it and
+    point to content-addressed blobs, so identical pages are stored only once.
+    Blobs are written atomically (temporary file + rename), entries expire
+    after ``ttl`` seconds and the least recently used entries are evicted when
+    the total size of the blobs exceeds ``max_size`` bytes.
+
+    Layout of the cache directory:
+        index.sqlite3       entry index (key, url, blob digest, size, timestamps)
+        blobs/ab/abcdef...  content blobs named after their sha256 digest
+
+    Attributes:
+        cache_dir (str): Directory holding the index and the blobs.
+        ttl (Optional[float]): Time to live of an entry in seconds; None never expires.
+        max_size (Optional[int]): Maximum total size of the blobs in bytes;
+            None disables eviction.
+
+    Example:
+        >>> cache = FetchCache("./.scrapegraphai_cache")
+        >>> key = FetchCache.make_key("https://example.com", {"headless": True})
+        >>> cache.put(key, "<html>...</html>", url="https://example.com")
+        >>> cache.get(key)
+        '<html>...</html>'
+    """
+
+    _instances: Dict[str, "FetchCache"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(
+        self,
+        cache_path: str,
+        ttl: Optional[float] = DEFAULT_CACHE_TTL,
+        max_size: Optional[int] = DEFAULT_CACHE_MAX_SIZE,
+    ):
+        self.cache_dir = os.path.join(cache_path, "fetch")
+        self.ttl = ttl
+        self.max_size = max_size
+
+        os.makedirs(os.path.join(self.cache_dir, "blobs"), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            os.path.join(self.cache_dir, "index.sqlite3"),
+            timeout=30,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                url TEXT,
+                blob TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created REAL NOT NULL,
+                accessed REAL NOT NULL
+            )""")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)"
+        )
+        self._conn.commit()
+
+    @classmethod
+    def from_path(
+        cls,
+        cache_path: str,
+        ttl: Optional[float] = DEFAULT_CACHE_TTL,
+        max_size: Optional[int] = DEFAULT_CACHE_MAX_SIZE,
+    ) -> "FetchCache":
+        """
+        Returns the cache shared by every node using the same cache directory.
+
+        Args:
+            cache_path (str): The cache directory.
+            ttl (Optional[float]): Time to live of an entry in seconds.
+            max_size (Optional[int]): Maximum total size of the blobs in bytes.
+
+        Returns:
+            FetchCache: The shared cache instance.
+        """
+        path = os.path.abspath(cache_path)
+        with cls._instances_lock:
+            cache = cls._instances.get(path)
+            if cache is None:
+                cache = cls(path, ttl=ttl, max_size=max_size)
+                cls._instances[path] = cache
+            else:
+                cache.ttl = ttl
+                cache.max_size = max_size
+            return cache
+
+    @staticmethod
+    def make_key(url: str, options: Optional[dict] = None) -> str:
+        """
+        Builds the cache key of a URL fetched with the given loader options.
+
+        Args:
+            url (str): The fetched URL.
+            options (Optional[dict]): The options that influence the fetched content.
+
+        Returns:
+            str: A hex digest identifying the (url, options) pair.
+        """
+        payload = json.dumps(
+            {"url": url, "options": options or {}}, sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.cache_dir, "blobs", digest[:2], digest)
+
+    def _write_blob(self, digest: str, data: bytes):
+        """Atomically writes a blob unless it already exists."""
+        path = self._blob_path(digest)
+        if os.path.exists(path):
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def _delete_entry(self, key: str, digest: str):
+        """Deletes an entry and its blob if no other entry references it."""
+        self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+        (refs,) = self._conn.execute(
+            "SELECT COUNT(*) FROM entries WHERE blob = ?", (digest,)
+        ).fetchone()
+        if refs == 0:
+            try:
+                os.unlink(self._blob_path(digest))
+            except FileNotFoundError:
+                pass
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Returns the cached content for a key, or None on a miss.
+
+        Args:
+            key (str): The key built with ``make_key``.
+
+        Returns:
+            Optional[str]: The cached content.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT blob, created FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            digest, created = row
+            if self.ttl is not None and now - created > self.ttl:
+                self._delete_entry(key, digest)
+                self._conn.commit()
+                return None
+
+            try:
+                with open(self._blob_path(digest), "rb") as f:
+                    data = f.read()
+            except FileNotFoundError:
+                self._delete_entry(key, digest)
+                self._conn.commit()
+                return None
+
+            self._conn.execute(
+                "UPDATE entries SET accessed = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+
+        return data.decode("utf-8")
+
+    def put(self, key: str, content: str, url: Optional[str] = None):
+        """
+        Stores content under a key, evicting old entries if the cache is full.
+
+        Args:
+            key (str): The key built with ``make_key``.
+            content (str): The content to store.
+            url (Optional[str]): The fetched URL, kept for inspection only.
+        """
+        data = content.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        now = time.time()
+
+        with self._lock:
+            self._write_blob(digest, data)
+            row = self._conn.execute(
+                "SELECT blob FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                """INSERT OR REPLACE INTO entries
+                (key, url, blob, size, created, accessed)
+                VALUES (?, ?, ?, ?, ?, ?)""",
+                (key, url, digest, len(data), now, now),
+            )
+            if row is not None and row[0] != digest:
+                (refs,) = self._conn.execute(
+                    "SELECT COUNT(*) FROM entries WHERE blob = ?", (row[0],)
+                ).fetchone()
+                if refs == 0:
+                    try:
+                        os.unlink(self._blob_path(row[0]))
+                    except FileNotFoundError:
+                        pass
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """Evicts expired entries, then least recently used ones until under max_size."""
+        if self.ttl is not None:
+            expired = self._conn.execute(
+                "SELECT key, blob FROM entries WHERE created < ?",
+                (time.time() - self.ttl,),
+            ).fetchall()
+            for key, digest in expired:
+                self._delete_entry(key, digest)
+
+        if self.max_size is None:
+            return
+
+        (total,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM "
+            "(SELECT blob, MAX(size) AS size FROM entries GROUP BY blob)"
+        ).fetchone()
+        if total <= self.max_size:
+            return
+
+        for key, digest, size in self._conn.execute(
+            "SELECT key, blob, size FROM entries ORDER BY accessed ASC"
+        ).fetchall():
+            if total <= self.max_size:
+                break
+            self._delete_entry(key, digest)
+            (refs,) = self._conn.execute(
+                "SELECT COUNT(*) FROM entries WHERE blob = ?", (digest,)
+            ).fetchone()
+            if refs == 0:
+                total -= size
+                logger.debug(f"Evicted cached content {digest}")
+
+    def clear(self):
+        """
+        Removes every entry and blob from the cache.
+        """
+        with self._lock:
+            for key, digest in self._conn.execute(
+                "SELECT key, blob FROM entries"
+            ).fetchall():
+                self._delete_entry(key, digest)
+            self._conn.commit()
+
+
+def get_fetch_cache(
+    cache_path,
+    ttl: Optional[float] = DEFAULT_CACHE_TTL,
+    max_size: Optional[int] = DEFAULT_CACHE_MAX_SIZE,
+) -> Optional[FetchCache]:
+    """
+    Returns the shared FetchCache for a ``cache_path`` config value.
+
+    Args:
+        cache_path: The cache directory; a falsy value disables caching.
+        ttl (Optional[float]): Time to live of an entry in seconds.
+        max_size (Optional[int]): Maximum total size of the blobs in bytes.
+
+    Returns:
+        Optional[FetchCache]: The cache, or None when caching is disabled.
+    """
+    if not cache_path:
+        return None
+    return FetchCache.from_path(cache_path, ttl=ttl, max_size=max_size)
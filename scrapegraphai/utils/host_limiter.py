@@ -0,0 +1,194 @@
+"""
+host_limiter module
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+from urllib.parse import urlsplit
+
+# responses of a host asking to slow down
+THROTTLE_STATUS_CODES = (429, 503)
+DEFAULT_MAX_DELAY = 60.0
+# delay between two requests to a host after its first throttling signal
+BACKOFF_DELAY = 1.0
+# factor applied to the delay of a throttled host after each success
+RECOVERY_FACTOR = 0.8
+
+
+def get_host(url: str) -> str:
+    """
+    Returns the lowercased host name of a URL, or an empty string if it has none.
+    """
+    try:
+        return (urlsplit(url).hostname or "").lower()
+    except ValueError:
+        return ""
+
+
+def is_throttle_error(error: Optional[BaseException]) -> bool:
+    """
+    Tells whether an error, or one of the errors it was raised from, means that
+    the host is overloaded: a timeout or a 429/503 response.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        # playwright has its own TimeoutError
+        if isinstance(error, TimeoutError) or type(error).__name__ == "TimeoutError":
+            return True
+        response = getattr(error, "response", None)
+        status = getattr(response, "status_code", getattr(response, "status", None))
+        if status in THROTTLE_STATUS_CODES:
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+class HostLimiter:
+    """
+    Per-host politeness limits for asyncio tasks fetching URLs.
+
+    Limits the number of requests in flight to the same host and spaces the
+    start of consecutive requests to a host by at least ``min_delay`` seconds.
+    Requests to different hosts do not wait for each other. A limiter must be
+    used from a single event loop.
+
+    The delay of a host adapts to the errors raised within its slots: it is
+    doubled, up to ``max_delay``, when a request times out or gets a 429/503
+    response, and decreases back to ``min_delay`` as requests succeed. The
+    requests of each host are counted and reported by ``stats``.
+
+    Attributes:
+        max_per_host (Optional[int]): Maximum number of requests in flight per host;
+            None means unlimited.
+        min_delay (float): Minimum delay in seconds between the start of two
+            requests to the same host.
+        max_delay (float): Maximum delay in seconds of a throttled host.
+
+    Example:
+        >>> limiter = HostLimiter(max_per_host=2, min_delay=0.5)
+        >>> async def fetch(url):
+        ...     async with limiter.slot(url):
+        ...         return await download(url)
+    """
+
+    def __init__(
+        self,
+        max_per_host: Optional[int] = None,
+        min_delay: float = 0.0,
+        max_delay: float = DEFAULT_MAX_DELAY,
+    ):
+        if max_per_host is not None and max_per_host < 1:
+            raise ValueError("max_per_host must be at least 1.")
+        if min_delay < 0:
+            raise ValueError("min_delay cannot be negative.")
+
+        self.max_per_host = max_per_host
+        self.min_delay = min_delay
+        self.max_delay = max(max_delay, min_delay)
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._next_start: Dict[str, float] = {}
+        self._delays: Dict[str, float] = {}
+        self._stats: Dict[str, dict] = {}
+
+    def delay(self, url: str) -> float:
+        """
+        Returns the current delay in seconds between two requests to the host of ``url``.
+        """
+        return self._delays.get(get_host(url), self.min_delay)
+
+    def stats(self) -> Dict[str, dict]:
+        """
+        Returns the counters of each host: the requests made, succeeded, failed
+        and throttled, the current delay, the seconds from the first start to
+        the last completion and the throughput in successful requests per second.
+        """
+        stats = {}
+        for host, counters in self._stats.items():
+            elapsed = max(0.0, counters["last_end"] - counters["first_start"])
+            stats[host] = {
+                "requests": counters["requests"],
+                "succeeded": counters["succeeded"],
+                "failed": counters["failed"],
+                "throttled": counters["throttled"],
+                "delay": self._delays.get(host, self.min_delay),
+                "elapsed": elapsed,
+                "throughput": counters["succeeded"] / elapsed if elapsed else 0.0,
+            }
+        return stats
+
+    def _record(self, host: str, error: Optional[BaseException]):
+        counters = self._stats[host]
+        counters["last_end"] = time.monotonic()
+        delay = self._delays.get(host, self.min_delay)
+        if error is None:
+            counters["succeeded"] += 1
+            if delay > self.min_delay:
+                delay = max(self.min_delay, delay * RECOVERY_FACTOR)
+                self._delays[host] = self.min_delay if delay < 0.01 else delay
+            return
+
+        counters["failed"] += 1
+        if is_throttle_error(error):
+            counters["throttled"] += 1
+            delay = min(self.max_delay, max(BACKOFF_DELAY, delay * 2))
+            self._delays[host] = delay
+            # the requests not yet started wait for the new delay
+            self._next_start[host] = max(
+                self._next_start.get(host, 0.0), counters["last_end"] + delay
+            )
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """
+        Waits until a request to the host of ``url`` is allowed and holds
+        one of its slots for the duration of the block.
+
+        Args:
+            url (str): The URL about to be requested.
+        """
+        host = get_host(url)
+
+        semaphore = None
+        if self.max_per_host is not None:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self.max_per_host)
+                self._semaphores[host] = semaphore
+            await semaphore.acquire()
+
+        try:
+            delay = self._delays.get(host, self.min_delay)
+            next_start = self._next_start.get(host)
+            if delay or next_start:
+                # reserve the next start time before sleeping, so that concurrent
+                # waiters on the same host are spaced out as well
+                now = time.monotonic()
+                start = max(now, next_start or now)
+                self._next_start[host] = start + delay
+                if start > now:
+                    await asyncio.sleep(start - now)
+
+            counters = self._stats.setdefault(
+                host,
+                {
+                    "requests": 0,
+                    "succeeded": 0,
+                    "failed": 0,
+                    "throttled": 0,
+                    "first_start": time.monotonic(),
+                    "last_end": 0.0,
+                },
+            )
+            counters["requests"] += 1
+            try:
+                yield
+            except Exception as e:
+                self._record(host, e)
+                raise
+            self._record(host, None)
+        finally:
+            if semaphore is not None:
+                semaphore.release()
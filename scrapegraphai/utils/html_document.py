@@ -0,0 +1,503 @@
+"""
+html_document module
+"""
+
+import copy
+import re
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+import lxml.html
+from lxml import etree
+from minify_html import minify
+
+from .crawl_frontier import normalize_url
+from .logging import get_logger
+
+logger = get_logger("html-document")
+
+# metadata key under which the results derived from the HTML of a document are cached
+PARSED_HTML_KEY = "parsed_html"
+
+SKIPPED_TAGS = {"script", "style", "noscript", "template", "head", "title"}
+BLOCK_TAGS = {
+    "address",
+    "article",
+    "aside",
+    "body",
+    "dd",
+    "details",
+    "div",
+    "dl",
+    "dt",
+    "fieldset",
+    "figcaption",
+    "figure",
+    "footer",
+    "form",
+    "header",
+    "html",
+    "main",
+    "nav",
+    "p",
+    "section",
+    "summary",
+    "table",
+    "tbody",
+    "thead",
+    "tfoot",
+}
+HEADING_TAGS = {"h1": 1, "h2": 2, "h3": 3, "h4": 4, "h5": 5, "h6": 6}
+# tags starting a new paragraph in the flat rendering of deeply nested pages
+FLAT_BREAK_TAGS = (
+    BLOCK_TAGS | set(HEADING_TAGS) | {"blockquote", "li", "ol", "pre", "tr", "ul"}
+)
+REDUCED_ATTRS = {"class", "id", "href", "src"}
+
+# attributes holding the source of an image, lazy-loading libraries included
+LAZY_IMAGE_ATTRS = ("src", "data-src", "data-lazy-src", "data-original")
+IGNORED_URL_SCHEMES = ("javascript:", "mailto:", "tel:", "data:", "about:", "blob:")
+
+_WHITESPACE = re.compile(r"\s+")
+_BLANK_LINES = re.compile(r"\n{3,}")
+_BLOCK_BOUNDARY = re.compile(r" *\n\n *")
+# lxml adds a body to any page, the one written in the page is looked up instead
+_BODY_TAG = re.compile(r"<body[\s>/]", re.IGNORECASE)
+
+
+def _collapse(text: Optional[str]) -> str:
+    return _WHITESPACE.sub(" ", text) if text else ""
+
+
+def _resolve_url(url: str, base_url: Optional[str] = None) -> Optional[str]:
+    """
+    Resolves a URL found in a page against its base URL and normalizes it with
+    ``crawl_frontier.normalize_url``.
+
+    Returns:
+        str: The normalized URL, or None for fragments and URLs that do not
+        point to a resource (javascript:, mailto:, data:, ...).
+    """
+    url = url.strip()
+    if not url or url.startswith("#") or url.lower().startswith(IGNORED_URL_SCHEMES):
+        return None
+    if base_url:
+        url = urljoin(base_url, url)
+
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return None
+    if not parts.scheme:
+        # relative URL without a base to resolve it against
+        return urlunsplit(parts._replace(fragment=""))
+    if parts.scheme.lower() not in ("http", "https"):
+        return None
+    return normalize_url(url)
+
+
+def minify_html(html: str) -> str:
+    """
+    minify_html function
+    """
+    # Combine multiple regex operations into one for better performance
+    patterns = [
+        (r"<!--.*?-->", "", re.DOTALL),
+        (r">\s+<", "><", 0),
+        (r"\s+>", ">", 0),
+        (r"<\s+", "<", 0),
+        (r"\s+", " ", 0),
+        (r"\s*=\s*", "=", 0),
+    ]
+
+    for pattern, repl, flags in patterns:
+        html = re.sub(pattern, repl, html, flags=flags)
+
+    return html.strip()
+
+
+def _parse(html: str):
+    """
+    Parses a page with lxml, returning an empty document for empty input.
+    """
+    # without huge_tree, the elements nested deeper than 255 levels are dropped
+    parser = lxml.html.HTMLParser(
+        encoding="utf-8", remove_blank_text=False, huge_tree=True
+    )
+    try:
+        return lxml.html.document_fromstring(html.encode("utf-8"), parser=parser)
+    except etree.ParserError:
+        return lxml.html.document_fromstring("<html><body></body></html>")
+
+
+class _MarkdownWriter:
+    """
+    Renders an lxml tree as Markdown.
+    """
+
+    def __init__(self, base_url: Optional[str] = None):
+        self.base_url = base_url
+
+    def _url(self, url: str) -> str:
+        url = url.strip()
+        return urljoin(self.base_url, url) if self.base_url else url
+
+    def render(self, element) -> str:
+        markdown = self._children(element)
+        lines = []
+        in_code = False
+        for line in markdown.split("\n"):
+            if line.startswith("```"):
+                in_code = not in_code
+                lines.append(line)
+            else:
+                lines.append(line if in_code else line.rstrip())
+        return _BLANK_LINES.sub("\n\n", "\n".join(lines)).strip() + "\n"
+
+    def render_flat(self, element) -> str:
+        """
+        Renders a tree nested too deeply for ``render`` without recursion: its
+        text only, one paragraph per block and a prefix per heading.
+        """
+        parts = []
+        walker = etree.iterwalk(element, events=("start", "end"))
+        for event, node in walker:
+            tag = node.tag.lower() if isinstance(node.tag, str) else None
+            if event == "end":
+                if tag in FLAT_BREAK_TAGS:
+                    parts.append("\n\n")
+                parts.append(_collapse(node.tail))
+            elif tag is None or tag in SKIPPED_TAGS:
+                # the end event of the skipped element still adds its tail
+                walker.skip_subtree()
+            else:
+                if tag in FLAT_BREAK_TAGS:
+                    parts.append("\n\n")
+                if tag in HEADING_TAGS:
+                    parts.append("#" * HEADING_TAGS[tag] + " ")
+                parts.append(_collapse(node.text))
+
+        markdown = _BLOCK_BOUNDARY.sub("\n\n", "".join(parts))
+        lines = [line.rstrip() for line in markdown.split("\n")]
+        return _BLANK_LINES.sub("\n\n", "\n".join(lines)).strip() + "\n"
+
+    def _children(self, element) -> str:
+        parts = [_collapse(element.text)]
+        for child in element:
+            parts.append(self._element(child))
+            parts.append(_collapse(child.tail))
+        # spaces around block boundaries come from the indentation of the HTML
+        return _BLOCK_BOUNDARY.sub("\n\n", "".join(parts))
+
+    def _element(self, element) -> str:
+        tag = element.tag
+        if not isinstance(tag, str):
+            # comments and processing instructions
+            return ""
+        tag = tag.lower()
+
+        if tag in SKIPPED_TAGS:
+            return ""
+        if tag in HEADING_TAGS:
+            text = self._children(element).strip()
+            return f"\n\n{'#' * HEADING_TAGS[tag]} {text}\n\n" if text else ""
+        if tag == "br":
+            return "  \n"
+        if tag == "hr":
+            return "\n\n* * *\n\n"
+        if tag == "pre":
+            code = element.text_content().strip("\n")
+            return f"\n\n```\n{code}\n```\n\n"
+        if tag == "blockquote":
+            text = self._children(element).strip()
+            quoted = "\n".join(f"> {line}".rstrip() for line in text.split("\n"))
+            return f"\n\n{quoted}\n\n"
+        if tag in ("ul", "ol"):
+            return self._list(element, ordered=tag == "ol")
+        if tag == "tr":
+            cells = [
+                self._children(cell).strip().replace("\n", " ").replace("|", "\\|")
+                for cell in element
+                if isinstance(cell.tag, str) and cell.tag.lower() in ("td", "th")
+            ]
+            row = f"| {' | '.join(cells)} |\n"
+            table = next(element.iterancestors("table"), None)
+            if table is not None and next(table.iter("tr")) is element:
+                row += f"|{'---|' * len(cells)}\n"
+            return row
+        if tag in BLOCK_TAGS:
+            return f"\n\n{self._children(element).strip()}\n\n"
+        if tag == "a":
+            text = self._children(element).strip()
+            href = element.get("href")
+            if not href or href.startswith(("#", "javascript:")):
+                return text
+            return f"[{text or self._url(href)}]({self._url(href)})"
+        if tag == "img":
+            src = element.get("src")
+            if not src:
+                return ""
+            return f"![{_collapse(element.get('alt', '')).strip()}]({self._url(src)})"
+        if tag in ("strong", "b"):
+            text = self._children(element).strip()
+            return f"**{text}**" if text else ""
+        if tag in ("em", "i"):
+            text = self._children(element).strip()
+            return f"_{text}_" if text else ""
+        if tag == "code":
+            text = element.text_content().strip()
+            return f"`{text}`" if text else ""
+        return self._children(element)
+
+    def _list(self, element, ordered: bool) -> str:
+        items = []
+        for item in element:
+            if not isinstance(item.tag, str) or item.tag.lower() != "li":
+                continue
+            marker = f"{len(items) + 1}. " if ordered else "* "
+            text = _BLANK_LINES.sub("\n\n", self._children(item).strip())
+            text = text.replace("\n", "\n" + " " * len(marker))
+            items.append(marker + text)
+        return "\n\n" + "\n".join(items) + "\n\n"
+
+
+class HTMLDocument:
+    """
+    A page parsed once with lxml, from which the markdown, plain text, links,
+    images, title and reduced HTML are derived.
+
+    Derived results are computed on first access; documents created with
+    ``from_document`` also cache them in the metadata of the langchain
+    ``Document`` so that nodes further down the graph reuse them without
+    parsing the page again.
+
+    Attributes:
+        html (str): The HTML of the page.
+        base_url (str): The URL relative links are resolved against.
+
+    Example:
+        >>> page = HTMLDocument("<html><head><title>Hi</title></head><body><p>Hello</p></body></html>")
+        >>> page.title
+        'Hi'
+        >>> page.markdown
+        'Hello\\n'
+    """
+
+    def __init__(
+        self, html: str, base_url: Optional[str] = None, cache: Optional[dict] = None
+    ):
+        self.html = html
+        self.base_url = base_url
+        self._cache = {} if cache is None else cache
+        self._tree = None
+
+    @classmethod
+    def from_document(cls, document, base_url: Optional[str] = None) -> "HTMLDocument":
+        """
+        Wraps a langchain ``Document`` holding HTML, caching the derived results
+        in its metadata.
+
+        Args:
+            document (Document): The document to wrap.
+            base_url (str): The URL relative links are resolved against;
+                defaults to the ``source`` of the document when it is a URL.
+        """
+        if base_url is None:
+            source = document.metadata.get("source")
+            if isinstance(source, str) and source.startswith(("http://", "https://")):
+                base_url = source
+        cache = document.metadata.setdefault(PARSED_HTML_KEY, {})
+        return cls(document.page_content, base_url=base_url, cache=cache)
+
+    @property
+    def tree(self):
+        """
+        The lxml tree of the page, parsed on first access.
+        """
+        if self._tree is None:
+            self._tree = _parse(self.html)
+        return self._tree
+
+    def _cached(self, key: str, compute):
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    @property
+    def title(self) -> str:
+        """
+        The title of the page, or an empty string.
+        """
+        return self._cached(
+            "title", lambda: (self.tree.findtext(".//title") or "").strip()
+        )
+
+    @property
+    def markdown(self) -> str:
+        """
+        The page rendered as Markdown, with links and images resolved against
+        the base URL.
+        """
+
+        def _markdown():
+            writer = _MarkdownWriter(self.base_url)
+            try:
+                return writer.render(self.tree)
+            except RecursionError:
+                logger.warning("Page nested too deeply for Markdown, keeping its text")
+                return writer.render_flat(self.tree)
+
+        return self._cached("markdown", _markdown)
+
+    @property
+    def text(self) -> str:
+        """
+        The visible text of the page with collapsed whitespace.
+        """
+
+        def _text():
+            texts = self.tree.xpath(
+                "//body//text()[not(ancestor::script or ancestor::style"
+                " or ancestor::noscript or ancestor::template)]"
+            )
+            return _collapse(" ".join(texts)).strip()
+
+        return self._cached("text", _text)
+
+    @property
+    def links(self) -> List[str]:
+        """
+        The normalized, deduplicated URLs the anchors of the page point to.
+        """
+        if "links" not in self._cache:
+            self._extract_urls()
+        return self._cache["links"]
+
+    @property
+    def images(self) -> List[str]:
+        """
+        The normalized, deduplicated URLs of the images of the page, including
+        lazy-loaded sources and every ``srcset`` candidate.
+        """
+        if "images" not in self._cache:
+            self._extract_urls()
+        return self._cache["images"]
+
+    def _extract_urls(self):
+        """
+        Collects the links and images of the page in a single pass over the
+        elements carrying them.
+        """
+        base = self.tree.find(".//base[@href]")
+        base_url = self.base_url
+        if base is not None:
+            base_url = urljoin(base_url or "", base.get("href").strip())
+
+        links, images = {}, {}
+
+        def _add(urls: dict, url: Optional[str]):
+            url = _resolve_url(url, base_url) if url else None
+            if url is not None:
+                urls.setdefault(url, None)
+
+        for element in self.tree.iter("a", "area", "img", "source"):
+            if element.tag in ("a", "area"):
+                _add(links, element.get("href"))
+                continue
+            for attr in LAZY_IMAGE_ATTRS:
+                _add(images, element.get(attr))
+            for attr in ("srcset", "data-srcset"):
+                for candidate in (element.get(attr) or "").split(","):
+                    _add(images, candidate.strip().split(" ")[0])
+
+        self._cache["links"] = list(links)
+        self._cache["images"] = list(images)
+
+    def to_metadata(self) -> dict:
+        """
+        Derives the title, markdown, links and images of the page and returns
+        the dict caching them, to be stored in the metadata of a document.
+        """
+        for name in ("title", "markdown", "links", "images"):
+            getattr(self, name)
+        return self._cache
+
+    def cleanup(self) -> Tuple[str, str, List[str], List[str]]:
+        """
+        Returns the title, the minified body without scripts and styles, and
+        the links and images of the page.
+
+        Raises:
+            ValueError: If the page has no body.
+        """
+        body = self.tree.find("body") if _BODY_TAG.search(self.html) else None
+        if body is None:
+            raise ValueError(
+                f"""No HTML body content found, please try setting the 'headless'
+                         flag to False in the graph configuration. HTML content: {self.html}"""
+            )
+
+        def _minified_body():
+            cleaned = copy.deepcopy(body)
+            for tag in cleaned.xpath(".//script|.//style"):
+                tag.drop_tree()
+            return minify(lxml.html.tostring(cleaned, encoding="unicode"))
+
+        minified_body = self._cached("minified_body", _minified_body)
+        return self.title, minified_body, self.links, self.images
+
+    def reduce(self, reduction: int) -> str:
+        """
+        Reduces the size of the HTML based on the specified level of reduction.
+
+        Args:
+            reduction (int): The level of reduction to apply to the HTML content.
+                0: minification only,
+                1: minification and removing unnecessary tags and attributes,
+                2: minification, removing unnecessary tags and attributes,
+                simplifying text content, removing of the head tag
+
+        Returns:
+            str: The reduced HTML.
+        """
+        reduced: Dict[str, str] = self._cache.setdefault("reduced_html", {})
+        key = str(reduction)
+        if key not in reduced:
+            reduced[key] = self._reduce(reduction)
+        return reduced[key]
+
+    def _reduce(self, reduction: int) -> str:
+        if reduction == 0:
+            return minify_html(self.html)
+
+        tree = copy.deepcopy(self.tree)
+        for comment in tree.xpath("//comment()"):
+            comment.drop_tree()
+
+        for tag in tree.iter("script", "style"):
+            for child in list(tag):
+                tag.remove(child)
+            tag.text = ""
+
+        for tag in tree.iter(etree.Element):
+            for attr in list(tag.attrib):
+                if attr not in REDUCED_ATTRS:
+                    del tag.attrib[attr]
+
+        if reduction == 1:
+            return minify_html(lxml.html.tostring(tree, encoding="unicode"))
+
+        for tag in tree.xpath("//script|//style"):
+            tag.drop_tree()
+
+        body = tree.find("body")
+        if body is None:
+            return "No <body> tag found in the HTML"
+
+        for tag in body.iter(etree.Element):
+            if tag.text:
+                tag.text = _collapse(tag.text.strip())[:20]
+            if tag is not body and tag.tail:
+                tag.tail = _collapse(tag.tail.strip())[:20]
+
+        return minify_html(lxml.html.tostring(body, encoding="unicode"))
@@ -0,0 +1,116 @@
+"""
+jsonl_sink module
+"""
+
+import json
+import os
+import threading
+from typing import Iterator
+
+from .logging import get_logger
+
+logger = get_logger("jsonl-sink")
+
+_TAIL_BLOCK_SIZE = 64 * 1024
+
+
+def _to_json(value):
+    """
+    Serializes the values json does not handle: pydantic models as their JSON
+    dict, anything else as its string.
+    """
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    return str(value)
+
+
+def _strip_partial_line(path: str):
+    """
+    Truncates a file after its last newline, dropping the partial line left by
+    a writer interrupted mid-record, so that the next record starts a new line.
+    """
+    with open(path, "rb+") as f:
+        size = f.seek(0, os.SEEK_END)
+        if size == 0:
+            return
+        f.seek(size - 1)
+        if f.read(1) == b"\n":
+            return
+
+        end, position = 0, size
+        while position > 0:
+            step = min(_TAIL_BLOCK_SIZE, position)
+            position -= step
+            f.seek(position)
+            newline = f.read(step).rfind(b"\n")
+            if newline != -1:
+                end = position + newline + 1
+                break
+        logger.warning(f"Dropping the partial last line of {path}")
+        f.truncate(end)
+
+
+class JSONLSink:
+    """
+    Appends records to a JSON Lines file, one line per record, flushed as soon
+    as it is written so that the file can be read while it is still growing.
+
+    Attributes:
+        path (str): The JSONL file, created if missing and appended to otherwise;
+            a partial last line left by an interrupted writer is dropped first.
+        fsync (bool): Whether each record is also synced to disk.
+
+    Example:
+        >>> with JSONLSink("./results.jsonl") as sink:
+        ...     sink.write({"source": url, "answer": answer})
+        >>> records = list(JSONLSink.read("./results.jsonl"))
+    """
+
+    def __init__(self, path: str, fsync: bool = False):
+        self.path = path
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        if os.path.exists(path):
+            _strip_partial_line(path)
+        self._file = open(path, "a", encoding="utf-8")
+
+    def write(self, record: dict):
+        """
+        Appends a record; pydantic models are stored as their JSON dict and
+        other values that are not JSON serializable as strings.
+        """
+        line = json.dumps(record, ensure_ascii=False, default=_to_json)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> "JSONLSink":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @staticmethod
+    def read(path: str) -> Iterator[dict]:
+        """
+        Yields the records of a JSONL file, skipping the lines that cannot be
+        parsed, such as the last one of a file whose writer was interrupted.
+        """
+        if not os.path.exists(path):
+            return
+        with open(path, "r", encoding="utf-8") as f:
+            for number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    logger.warning(f"Skipping malformed line {number} of {path}")
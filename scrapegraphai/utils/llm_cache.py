@@ -0,0 +1,351 @@
+"""
+llm_cache module
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Optional, Union
+
+from langchain_core.runnables import Runnable, RunnableLambda
+from pydantic import BaseModel
+
+from .logging import get_logger
+
+logger = get_logger("llm-cache")
+
+DEFAULT_LLM_CACHE_MAX_ENTRIES = 1024
+
+
+class LLMCacheStats:
+    """
+    Thread-safe hit and miss counters of the LLM response cache.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def record(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+
+_current_stats: ContextVar[Optional[LLMCacheStats]] = ContextVar(
+    "llm_cache_stats", default=None
+)
+
+
+@contextmanager
+def track_llm_cache_stats():
+    """
+    Collects the cache hits and misses of every cached chain invoked in the
+    current context, including the threads spawned by RunnableParallel.
+
+    Yields:
+        LLMCacheStats: The counters for the tracked block.
+    """
+    stats = LLMCacheStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+class BaseLLMCache(ABC):
+    """
+    Base class of the LLM response cache backends.
+
+    Responses are keyed on the model identity, its temperature, the hash of the
+    rendered prompt and the hash of the output schema (see ``make_key``).
+    """
+
+    # whether lookup and update wait on disk; async chains then call them in a thread
+    blocking_io = False
+
+    @abstractmethod
+    def lookup(self, key: str) -> Optional[Any]:
+        """
+        Returns the cached response for a key, or None on a miss.
+        """
+
+    @abstractmethod
+    def update(self, key: str, value: Any):
+        """
+        Stores a response under a key.
+        """
+
+    @abstractmethod
+    def clear(self):
+        """
+        Removes every cached response.
+        """
+
+    def __copy__(self) -> "BaseLLMCache":
+        return self
+
+    def __deepcopy__(self, memo: Any) -> "BaseLLMCache":
+        return self
+
+    @staticmethod
+    def make_key(llm_model, prompt: Any, schema: Any = None) -> str:
+        """
+        Builds the cache key of a prompt sent to a model.
+
+        Args:
+            llm_model: The language model (or structured-output runnable) invoked.
+            prompt: The rendered prompt, a PromptValue or a string.
+            schema: The output schema, a pydantic model class or a dict.
+
+        Returns:
+            str: A hex digest identifying the request.
+        """
+        # unwrap structured-output sequences and bindings down to the chat model
+        model = llm_model
+        while True:
+            inner = getattr(model, "bound", None) or getattr(model, "first", None)
+            if inner is None:
+                break
+            model = inner
+
+        model_name = None
+        for attr in ("model_name", "model", "model_id"):
+            model_name = getattr(model, attr, None)
+            if model_name:
+                break
+
+        prompt_text = prompt.to_string() if hasattr(prompt, "to_string") else prompt
+
+        if schema is None:
+            schema_repr = None
+        elif isinstance(schema, type) and issubclass(schema, BaseModel):
+            schema_repr = schema.model_json_schema()
+        else:
+            schema_repr = schema
+
+        payload = json.dumps(
+            {
+                "model": f"{type(model).__name__}:{model_name}",
+                "temperature": getattr(model, "temperature", None),
+                "prompt": hashlib.sha256(str(prompt_text).encode("utf-8")).hexdigest(),
+                "schema": hashlib.sha256(
+                    json.dumps(schema_repr, sort_keys=True, default=str).encode("utf-8")
+                ).hexdigest(),
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class InMemoryLLMCache(BaseLLMCache):
+    """
+    LLM response cache kept in memory with least-recently-used eviction.
+
+    Attributes:
+        max_entries (int): Maximum number of cached responses.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_LLM_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()
+
+    def lookup(self, key: str) -> Optional[Any]:
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return copy.deepcopy(self._entries[key])
+
+    def update(self, key: str, value: Any):
+        with self._lock:
+            self._entries[key] = copy.deepcopy(value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteLLMCache(BaseLLMCache):
+    """
+    LLM response cache persisted in a SQLite database, shared across runs.
+
+    Responses are stored pickled: only point it at files written by this cache.
+
+    Attributes:
+        path (str): Path of the SQLite database file.
+    """
+
+    blocking_io = True
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value BLOB)"
+        )
+        self._conn.commit()
+
+    def lookup(self, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return pickle.loads(row[0])
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cached response: {e}")
+            return None
+
+    def update(self, key: str, value: Any):
+        try:
+            data = pickle.dumps(value)
+        except Exception as e:
+            logger.warning(f"Response cannot be cached: {e}")
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value) VALUES (?, ?)",
+                (key, data),
+            )
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+
+_shared_caches: Dict[tuple, BaseLLMCache] = {}
+_shared_caches_lock = threading.Lock()
+
+
+def create_llm_cache(
+    llm_cache: Union[bool, dict, BaseLLMCache, None],
+) -> Optional[BaseLLMCache]:
+    """
+    Builds the LLM response cache described by the ``llm_cache`` graph config.
+
+    Args:
+        llm_cache: False/None disables caching, True uses an in-memory cache,
+            a dict selects the backend, e.g. ``{"backend": "memory", "max_entries": 512}``
+            or ``{"backend": "sqlite", "path": "./llm_cache.sqlite3"}``,
+            and a BaseLLMCache instance is used as is.
+
+    Returns:
+        Optional[BaseLLMCache]: The cache shared by every graph with the same config.
+
+    Raises:
+        ValueError: If the backend is unknown or the sqlite path is missing.
+    """
+    if not llm_cache:
+        return None
+    if isinstance(llm_cache, BaseLLMCache):
+        return llm_cache
+
+    options = llm_cache if isinstance(llm_cache, dict) else {}
+    backend = options.get("backend", "memory")
+
+    if backend == "memory":
+        key = (backend, options.get("max_entries", DEFAULT_LLM_CACHE_MAX_ENTRIES))
+    elif backend == "sqlite":
+        if not options.get("path"):
+            raise ValueError("The sqlite LLM cache requires a 'path'.")
+        key = (backend, os.path.abspath(options["path"]))
+    else:
+        raise ValueError(f"Unsupported LLM cache backend: {backend}")
+
+    with _shared_caches_lock:
+        cache = _shared_caches.get(key)
+        if cache is None:
+            if backend == "memory":
+                cache = InMemoryLLMCache(max_entries=key[1])
+            else:
+                cache = SQLiteLLMCache(key[1])
+            _shared_caches[key] = cache
+        return cache
+
+
+def cached_chain(
+    prompt: Runnable,
+    llm_model,
+    output_parser=None,
+    llm_cache: Optional[BaseLLMCache] = None,
+    schema: Any = None,
+) -> Runnable:
+    """
+    Builds ``prompt | llm_model | output_parser``, memoizing the model response
+    (after parsing) on the rendered prompt when a cache is given.
+
+    Args:
+        prompt (Runnable): The prompt template of the chain.
+        llm_model: The language model.
+        output_parser: Optional parser applied to the model output.
+        llm_cache (Optional[BaseLLMCache]): The cache; None disables memoization.
+        schema: The output schema, part of the cache key.
+
+    Returns:
+        Runnable: The chain.
+    """
+    chain = llm_model | output_parser if output_parser else llm_model
+    if llm_cache is None:
+        return prompt | chain
+
+    def _record(hit: bool):
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.record(hit)
+
+    def _invoke(prompt_value, config):
+        key = llm_cache.make_key(llm_model, prompt_value, schema)
+        cached = llm_cache.lookup(key)
+        if cached is not None:
+            _record(True)
+            return cached
+        _record(False)
+        result = chain.invoke(prompt_value, config)
+        llm_cache.update(key, result)
+        return result
+
+    async def _ainvoke(prompt_value, config):
+        key = llm_cache.make_key(llm_model, prompt_value, schema)
+        if llm_cache.blocking_io:
+            cached = await asyncio.to_thread(llm_cache.lookup, key)
+        else:
+            cached = llm_cache.lookup(key)
+        if cached is not None:
+            _record(True)
+            return cached
+        _record(False)
+        result = await chain.ainvoke(prompt_value, config)
+        if llm_cache.blocking_io:
+            await asyncio.to_thread(llm_cache.update, key, result)
+        else:
+            llm_cache.update(key, result)
+        return result
+
+    return prompt | RunnableLambda(_invoke, afunc=_ainvoke, name="CachedLLM")
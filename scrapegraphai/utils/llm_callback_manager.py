@@ -29,10 +29,38 @@ class CustomLLMCallbackManager:
     Methods:
     exclusive_get_callback: A context manager that yields the appropriate callback based on
     the LLM model and its name, ensuring exclusive access to the callback.
+    exclusive_scope: A context manager holding the exclusive access for a whole block.
     """
 
     _lock = threading.Lock()
 
+    @contextmanager
+    def get_callback(self, llm_model, llm_model_name):
+        """
+        Provides the callback for the LLM model without taking the exclusive lock.
+        Only use it while holding the lock through ``exclusive_scope``.
+
+        Args:
+            llm_model: The LLM model instance (e.g., ChatOpenAI, AzureChatOpenAI, ChatBedrock).
+            llm_model_name (str): The name of the LLM model, used for model-specific callbacks.
+
+        Yields:
+            The appropriate callback for the LLM model.
+        """
+        if isinstance(llm_model, ChatOpenAI) or isinstance(llm_model, AzureChatOpenAI):
+            with get_openai_callback() as cb:
+                yield cb
+        elif (
+            isinstance(llm_model, ChatBedrock)
+            and llm_model_name is not None
+            and "claude" in llm_model_name
+        ):
+            with get_bedrock_anthropic_callback() as cb:
+                yield cb
+        else:
+            with get_custom_callback(llm_model_name) as cb:
+                yield cb
+
     @contextmanager
     def exclusive_get_callback(self, llm_model, llm_model_name):
         """
@@ -47,22 +75,26 @@ class CustomLLMCallbackManager:
         """
         if CustomLLMCallbackManager._lock.acquire(blocking=False):
             try:
-                if isinstance(llm_model, ChatOpenAI) or isinstance(
-                    llm_model, AzureChatOpenAI
-                ):
-                    with get_openai_callback() as cb:
-                        yield cb
-                elif (
-                    isinstance(llm_model, ChatBedrock)
-                    and llm_model_name is not None
-                    and "claude" in llm_model_name
-                ):
-                    with get_bedrock_anthropic_callback() as cb:
-                        yield cb
-                else:
-                    with get_custom_callback(llm_model_name) as cb:
-                        yield cb
+                with self.get_callback(llm_model, llm_model_name) as cb:
+                    yield cb
             finally:
                 CustomLLMCallbackManager._lock.release()
         else:
             yield None
+
+    @contextmanager
+    def exclusive_scope(self):
+        """
+        Holds the exclusive lock for a whole block, so that several nodes running
+        concurrently can each use ``get_callback`` while nested graphs get no callback.
+
+        Yields:
+            bool: Whether the lock was acquired; if not, no callback must be used.
+        """
+        if CustomLLMCallbackManager._lock.acquire(blocking=False):
+            try:
+                yield True
+            finally:
+                CustomLLMCallbackManager._lock.release()
+        else:
+            yield False
@@ -0,0 +1,95 @@
+"""
+process_pool module
+"""
+
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Callable, Dict, Optional, Union
+
+from .logging import get_logger
+
+logger = get_logger("process-pool")
+
+# workers are started clean rather than forked from a process running threads
+DEFAULT_START_METHOD = "spawn"
+
+_shared_pools: Dict[tuple, ProcessPoolExecutor] = {}
+_shared_pools_lock = threading.Lock()
+
+
+def _shutdown_shared_pools():
+    with _shared_pools_lock:
+        pools = list(_shared_pools.values())
+        _shared_pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(_shutdown_shared_pools)
+
+
+def create_parse_executor(
+    parse_executor: Union[str, dict, Executor, None],
+) -> Optional[Executor]:
+    """
+    Builds the executor of the CPU-bound stages of the graphs (HTML conversion,
+    tokenization and chunking) described by the ``parse_executor`` graph config.
+
+    Args:
+        parse_executor: None or "thread" keeps these stages in the threads of
+            the nodes, "process" runs them in a pool of worker processes, one
+            per core, a dict such as ``{"max_workers": 8, "start_method": "spawn"}``
+            sets the options of the pool, and an Executor instance is used as is.
+
+    Returns:
+        Optional[Executor]: The executor, or None to run in place; process pools
+        are shared by every graph using the same options and shut down at exit.
+
+    Raises:
+        ValueError: If the executor type is unknown.
+    """
+    if parse_executor is None or parse_executor == "thread":
+        return None
+    if isinstance(parse_executor, Executor):
+        return parse_executor
+
+    if isinstance(parse_executor, dict):
+        options = dict(parse_executor)
+        executor_type = options.pop("type", "process")
+    else:
+        options, executor_type = {}, parse_executor
+    if executor_type == "thread":
+        return None
+    if executor_type != "process":
+        raise ValueError(
+            f"Unknown parse_executor {executor_type!r}, use 'thread' or 'process'."
+        )
+
+    max_workers = options.get("max_workers") or os.cpu_count() or 1
+    start_method = options.get("start_method", DEFAULT_START_METHOD)
+    key = (max_workers, start_method)
+    with _shared_pools_lock:
+        pool = _shared_pools.get(key)
+        if pool is None:
+            logger.info(f"Starting a pool of {max_workers} parse processes")
+            pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context(start_method),
+            )
+            _shared_pools[key] = pool
+        return pool
+
+
+def run_cpu_bound(executor: Optional[Executor], fn: Callable, *args):
+    """
+    Runs a CPU-bound function in the executor and waits for its result, or
+    calls it in place without an executor. With a process pool, the function
+    must be defined at the top level of a module and its arguments and result
+    must be picklable.
+    """
+    if executor is None:
+        return fn(*args)
+    return executor.submit(fn, *args).result()
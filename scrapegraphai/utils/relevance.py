@@ -0,0 +1,120 @@
+"""
+relevance module
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Iterable, List, Optional
+
+DEFAULT_MIN_SCORE = 0.2
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+STOP_WORDS = frozenset("""
+    a an and any are as at be by can do does find for from get give has have how i
+    in into is it its list me my of on or please return show some that the their
+    them there these this those to was what when where which who why will with you
+    your all each every extract scrape page website site
+    """.split())
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Splits a text into lowercase terms without stop words, dropping the plural
+    "s" so that "prices" matches "price".
+    """
+    terms = []
+    for token in _TOKEN_PATTERN.findall(text.lower()):
+        if token in STOP_WORDS:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        terms.append(token)
+    return terms
+
+
+class BM25:
+    """
+    Okapi BM25 ranking of a fixed set of documents.
+
+    Attributes:
+        k1 (float): Saturation of the term frequencies.
+        b (float): Weight of the length normalization.
+
+    Example:
+        >>> bm25 = BM25(["cheap red shoes", "about us", "shoe sizes"])
+        >>> bm25.scores("red shoes")
+        [1.285..., 0.0, 0.502...]
+    """
+
+    def __init__(
+        self, documents: Iterable[str], k1: float = BM25_K1, b: float = BM25_B
+    ):
+        self.k1 = k1
+        self.b = b
+        self._term_frequencies = [Counter(tokenize(doc)) for doc in documents]
+        self._lengths = [sum(tf.values()) for tf in self._term_frequencies]
+        self._avg_length = (
+            sum(self._lengths) / len(self._lengths) if self._lengths else 0.0
+        )
+
+        document_frequencies = Counter()
+        for tf in self._term_frequencies:
+            document_frequencies.update(tf.keys())
+        num_docs = len(self._term_frequencies)
+        self._idf = {
+            term: math.log(1 + (num_docs - df + 0.5) / (df + 0.5))
+            for term, df in document_frequencies.items()
+        }
+
+    def scores(self, query: str) -> List[float]:
+        """
+        Returns the score of every document for the query.
+        """
+        terms = set(tokenize(query))
+        scores = []
+        for tf, length in zip(self._term_frequencies, self._lengths):
+            norm = self.k1 * (1 - self.b + self.b * length / (self._avg_length or 1.0))
+            score = 0.0
+            for term in terms:
+                freq = tf.get(term)
+                if freq:
+                    score += self._idf[term] * freq * (self.k1 + 1) / (freq + norm)
+            scores.append(score)
+        return scores
+
+
+def select_relevant_chunks(
+    chunks: List[str],
+    query: str,
+    top_k: Optional[int] = None,
+    min_score: float = DEFAULT_MIN_SCORE,
+) -> List[int]:
+    """
+    Selects the chunks relevant to a query with BM25.
+
+    A chunk is kept when its score reaches ``min_score`` times the best score
+    and, with ``top_k``, it is among the ``top_k`` best. The best chunk is
+    always kept, and every chunk is kept when none matches the query at all.
+
+    Args:
+        chunks (List[str]): The chunks to filter.
+        query (str): The query, usually the user prompt.
+        top_k (Optional[int]): Maximum number of chunks kept.
+        min_score (float): Minimum score of a kept chunk relative to the best one.
+
+    Returns:
+        List[int]: The indices of the kept chunks, in document order.
+    """
+    scores = BM25(chunks).scores(query)
+    best = max(scores, default=0.0)
+    if best <= 0:
+        return list(range(len(chunks)))
+
+    ranked = sorted(range(len(chunks)), key=lambda i: scores[i], reverse=True)
+    if top_k is not None:
+        ranked = ranked[: max(top_k, 1)]
+    kept = [i for i in ranked if scores[i] >= min_score * best] or ranked[:1]
+    return sorted(kept)
@@ -0,0 +1,193 @@
+"""
+render_detection module
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+from lxml import etree
+
+from .html_document import HTMLDocument
+from .logging import get_logger
+
+logger = get_logger("render-detection")
+
+DEFAULT_MIN_TEXT_LENGTH = 100
+DEFAULT_RENDER_TABLE_TTL = 7 * 24 * 60 * 60
+
+SPA_ROOT_IDS = {"root", "app", "__next", "__nuxt", "___gatsby", "svelte", "q-app"}
+SPA_ROOT_ATTRIBUTES = ("data-reactroot", "ng-app", "ng-version", "data-server-rendered")
+JS_WALL_PATTERN = re.compile(
+    r"(enable|activate|turn on|requires?|need)\s+(your\s+)?javascript"
+    r"|javascript\s+(is\s+)?(required|disabled|must be enabled)",
+    re.IGNORECASE,
+)
+_VISIBLE_TEXT = (
+    ".//text()[not(ancestor::script or ancestor::style"
+    " or ancestor::noscript or ancestor::template)]"
+)
+
+
+def _visible_text_length(element) -> int:
+    return len(" ".join(" ".join(element.xpath(_VISIBLE_TEXT)).split()))
+
+
+def _is_spa_root(element) -> bool:
+    return element.get("id") in SPA_ROOT_IDS or any(
+        attribute in element.attrib for attribute in SPA_ROOT_ATTRIBUTES
+    )
+
+
+def needs_js_rendering(
+    html: str, min_text_length: int = DEFAULT_MIN_TEXT_LENGTH
+) -> bool:
+    """
+    Tells whether a page fetched over plain HTTP must be rendered in a browser.
+
+    A page needs rendering when its visible body text is (almost) empty,
+    when it is a single-page-app shell whose mount point (e.g. a bare
+    ``<div id="root">``) has no content, or when it shows a noscript wall
+    asking to enable JavaScript instead of its content.
+
+    Parsing the page is CPU bound: async callers run this in a worker thread.
+
+    Args:
+        html (str): The HTML fetched without running scripts.
+        min_text_length (int): Minimum number of characters of visible text
+            of a page that renders without JavaScript.
+
+    Returns:
+        bool: True if the page should be fetched again with a browser.
+    """
+    tree = HTMLDocument(html).tree
+    body = tree.find("body")
+    if body is None:
+        body = tree
+
+    noscript_text = " ".join(
+        " ".join(tag.text_content().split()) for tag in body.iter("noscript")
+    )
+    text_length = _visible_text_length(body)
+
+    if text_length < min_text_length:
+        return True
+
+    for root in body.iter(etree.Element):
+        if _is_spa_root(root) and _visible_text_length(root) < min_text_length:
+            return True
+
+    # the content is too short to be the page itself next to a JavaScript notice
+    return bool(
+        JS_WALL_PATTERN.search(noscript_text) and text_length < 5 * min_text_length
+    )
+
+
+class HostRenderTable:
+    """
+    Per-host record of whether pages need a browser to be rendered, so that
+    hosts known to serve JavaScript apps skip the plain HTTP attempt.
+
+    The table is a small SQLite database, kept in memory when no path is given.
+    Decisions expire after ``ttl`` seconds, since sites change over time.
+
+    Attributes:
+        path (Optional[str]): Path of the SQLite database file, or None.
+        ttl (Optional[float]): Time to live of a decision in seconds; None never expires.
+
+    Example:
+        >>> table = HostRenderTable.from_path("./render_table.sqlite3")
+        >>> table.set("example.com", needs_js=False)
+        >>> table.get("example.com")
+        False
+    """
+
+    _instances: Dict[Optional[str], "HostRenderTable"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl: Optional[float] = DEFAULT_RENDER_TABLE_TTL,
+    ):
+        self.path = path
+        self.ttl = ttl
+
+        if path is not None:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path or ":memory:", timeout=30, check_same_thread=False
+        )
+        if path is not None:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""CREATE TABLE IF NOT EXISTS hosts (
+                host TEXT PRIMARY KEY,
+                needs_js INTEGER NOT NULL,
+                updated REAL NOT NULL
+            )""")
+        self._conn.commit()
+
+    @classmethod
+    def from_path(
+        cls, path: Optional[str] = None, ttl: Optional[float] = DEFAULT_RENDER_TABLE_TTL
+    ) -> "HostRenderTable":
+        """
+        Returns the table shared by every loader using the same path.
+
+        Args:
+            path (Optional[str]): Path of the SQLite database file; None shares
+                an in-memory table across the process.
+            ttl (Optional[float]): Time to live of a decision in seconds.
+
+        Returns:
+            HostRenderTable: The shared table.
+        """
+        key = os.path.abspath(path) if path else None
+        with cls._instances_lock:
+            table = cls._instances.get(key)
+            if table is None:
+                table = cls(key, ttl=ttl)
+                cls._instances[key] = table
+            else:
+                table.ttl = ttl
+            return table
+
+    def get(self, host: str) -> Optional[bool]:
+        """
+        Returns whether pages of a host need a browser, or None if unknown.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT needs_js, updated FROM hosts WHERE host = ?", (host,)
+            ).fetchone()
+        if row is None:
+            return None
+        needs_js, updated = row
+        if self.ttl is not None and time.time() - updated > self.ttl:
+            return None
+        return bool(needs_js)
+
+    def set(self, host: str, needs_js: bool):
+        """
+        Records whether pages of a host need a browser.
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO hosts (host, needs_js, updated) VALUES (?, ?, ?)",
+                (host, int(needs_js), time.time()),
+            )
+            self._conn.commit()
+        logger.debug(f"{host} {'needs' if needs_js else 'does not need'} a browser")
+
+    def clear(self):
+        """
+        Forgets every recorded decision.
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM hosts")
+            self._conn.commit()
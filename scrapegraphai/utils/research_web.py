@@ -5,10 +5,13 @@ research_web module
 import re
 from typing import List
 
+import httpx
 import requests
 from bs4 import BeautifulSoup
 from langchain_community.tools import DuckDuckGoSearchResults
 
+from .http_client import get_http_client
+
 
 def search_on_web(
     query: str,
@@ -70,9 +73,9 @@ def search_on_web(
 
         return filter_pdf_links(results)
 
-    except requests.Timeout:
+    except (requests.Timeout, httpx.TimeoutException):
         raise TimeoutError(f"Search request timed out after {timeout} seconds")
-    except requests.RequestException as e:
+    except (requests.RequestException, httpx.HTTPError) as e:
         raise RuntimeError(f"Search request failed: {str(e)}")
 
 
@@ -80,14 +83,8 @@ def _search_bing(
     query: str, max_results: int, timeout: int, proxy: str = None
 ) -> List[str]:
     """Helper function for Bing search"""
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-    }
-    search_url = f"https://www.bing.com/search?q={query}"
-
-    proxies = {"http": proxy, "https": proxy} if proxy else None
-    response = requests.get(
-        search_url, headers=headers, timeout=timeout, proxies=proxies
+    response = get_http_client(proxy=proxy).get(
+        "https://www.bing.com/search", params={"q": query}, timeout=timeout
     )
     response.raise_for_status()
 
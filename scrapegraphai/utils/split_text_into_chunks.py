@@ -2,58 +2,268 @@
 split_text_into_chunks module
 """
 
-from typing import List
+import asyncio
+import re
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import (
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+)
 
-from .tokenizer import num_tokens_calculus
+from .tokenizer import TokenCounter, get_token_counter
 
+# boundaries a chunk may end on, from the most to the least preferred; they
+# only contain ASCII, so they can be searched in the UTF-8 encoded text
+BOUNDARY_PATTERNS = (
+    re.compile(rb"\n+(?=#{1,6}\s)"),  # markdown heading
+    re.compile(rb"\n[ \t]*\n\s*"),  # paragraph
+    re.compile(rb"\n\s*"),  # line
+    re.compile(rb"[.!?;:][\"')\]]*\s+"),  # sentence
+    re.compile(rb"\s+"),  # word
+)
+WORD_PATTERN = re.compile(rb"\S+\s*")
 
-def split_text_into_chunks(text: str, chunk_size: int, use_semchunk=True) -> List[str]:
+
+class TextChunk(NamedTuple):
+    """
+    A chunk of text with its number of tokens.
+    """
+
+    text: str
+    num_tokens: int
+
+
+def _get_units(text: str, data: bytes, token_counter: TokenCounter):
+    """
+    Splits the text into units that chunks are made of: the tokens themselves
+    when the tokenizer maps them back to the text, words otherwise.
+
+    Returns:
+        tuple: The start offset of each unit in ``data``, the UTF-8 encoded
+        text, and the prefix sums of the units' token counts.
+    """
+    starts = token_counter.token_byte_offsets(text)
+    if starts is not None:
+        return starts, range(len(starts) + 1)
+
+    starts = [match.start() for match in WORD_PATTERN.finditer(data)]
+    if starts:
+        # leading whitespace belongs to the first word
+        starts[0] = 0
+    ends = starts[1:] + [len(data)]
+    words = [data[start:end].decode("utf-8") for start, end in zip(starts, ends)]
+    token_counts = token_counter.count_batch(words)
+    return starts, list(accumulate(token_counts, initial=0))
+
+
+def split_text_into_token_chunks(
+    text: str, chunk_size: int, llm_model=None
+) -> List[TextChunk]:
+    """
+    Splits the text into chunks of at most ``chunk_size`` tokens in linear time.
+
+    See ``iter_token_chunks`` for how the chunks are cut.
+
+    Args:
+        text (str): The text to split.
+        chunk_size (int): The maximum number of tokens per chunk.
+        llm_model: The language model whose tokenizer counts the tokens;
+            None uses gpt-4o's.
+
+    Returns:
+        List[TextChunk]: The chunks with their number of tokens.
+
+    Example:
+        >>> chunks = split_text_into_token_chunks(markdown, chunk_size=4096)
+        >>> all(chunk.num_tokens <= 4096 for chunk in chunks)
+        True
+    """
+    return list(iter_token_chunks(text, chunk_size, llm_model))
+
+
+def iter_token_chunks(
+    text: str, chunk_size: int, llm_model=None
+) -> Iterator[TextChunk]:
+    """
+    Yields the chunks of at most ``chunk_size`` tokens of the text one by one.
+
+    The text is tokenized once; each chunk is cut at the last markdown heading,
+    paragraph, line, sentence or word boundary that fits, in this order of
+    preference, as long as the chunk stays at least half full.
+
+    Args:
+        text (str): The text to split.
+        chunk_size (int): The maximum number of tokens per chunk.
+        llm_model: The language model whose tokenizer counts the tokens;
+            None uses gpt-4o's.
+
+    Yields:
+        TextChunk: The chunks with their number of tokens, in order.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+
+    data = text.encode("utf-8")
+    starts, cumulative = _get_units(text, data, get_token_counter(llm_model))
+    num_units = len(starts)
+
+    def _unit_offset(unit: int) -> int:
+        return starts[unit] if unit < num_units else len(data)
+
+    def _last_boundary(first: int, last: int) -> Optional[int]:
+        """Returns the unit after the preferred boundary between two units, if any."""
+        window_start = _unit_offset(first)
+        window = data[window_start : _unit_offset(last)]
+        for pattern in BOUNDARY_PATTERNS:
+            match = None
+            for match in pattern.finditer(window):
+                pass
+            if match is not None:
+                return bisect_left(starts, window_start + match.end())
+        return None
+
+    start = 0
+    while start < num_units:
+        # the last unit the chunk can end before without exceeding chunk_size
+        limit = bisect_right(cumulative, cumulative[start] + chunk_size) - 1
+        if limit >= num_units:
+            end = num_units
+        else:
+            # only boundaries keeping the chunk at least half full are considered
+            half_full = bisect_left(cumulative, cumulative[start] + chunk_size // 2)
+            end = _last_boundary(max(half_full, start + 1), limit)
+            if end is None or end <= start:
+                # no boundary: cut between tokens, but not inside a character
+                end = limit
+                while end > start + 1 and 0x80 <= data[starts[end]] < 0xC0:
+                    end -= 1
+            end = max(end, start + 1)
+
+        chunk = data[_unit_offset(start) : _unit_offset(end)]
+        chunk = chunk.decode("utf-8", errors="replace").strip()
+        if chunk:
+            yield TextChunk(chunk, cumulative[end] - cumulative[start])
+        start = end
+
+
+class ChunkList(list):
+    """
+    The texts of the chunks of a document, carrying the number of tokens of
+    each chunk so that the next nodes do not count them again.
+
+    Attributes:
+        token_counts (List[int]): The number of tokens of each chunk.
+    """
+
+    def __init__(self, chunks: Iterable[TextChunk] = ()):
+        chunks = list(chunks)
+        super().__init__(chunk.text for chunk in chunks)
+        self.token_counts: List[int] = [chunk.num_tokens for chunk in chunks]
+
+    def append_chunk(self, chunk: TextChunk):
+        """
+        Appends a chunk with its number of tokens.
+        """
+        self.append(chunk.text)
+        self.token_counts.append(chunk.num_tokens)
+
+
+class ChunkStream:
+    """
+    Chunks produced lazily, for nodes that process each chunk as soon as it
+    exists instead of waiting for the whole list.
+
+    The stream can be consumed once, with ``for`` or ``async for``; the async
+    iteration produces the chunks in a worker thread so that the event loop
+    keeps serving the requests of the chunks already produced.
+
+    Attributes:
+        chunks (ChunkList): The chunks consumed so far.
+        token_counts (List[int]): The number of tokens of the chunks consumed so far.
+
+    Args:
+        chunks (Iterable[TextChunk]): The chunks, produced lazily.
+        on_exhausted (Optional[Callable[[ChunkList], None]]): Called with all
+            the chunks once the stream has been consumed to its end.
+
+    Example:
+        >>> stream = ChunkStream(iter_token_chunks(markdown, chunk_size=4096))
+        >>> for chunk in stream:
+        ...     process(chunk)
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[TextChunk],
+        on_exhausted: Optional[Callable[[ChunkList], None]] = None,
+    ):
+        self._chunks = iter(chunks)
+        self._on_exhausted = on_exhausted
+        self.chunks = ChunkList()
+
+    @property
+    def token_counts(self) -> List[int]:
+        return self.chunks.token_counts
+
+    def _exhausted(self):
+        if self._on_exhausted is not None:
+            self._on_exhausted(self.chunks)
+
+    def __iter__(self) -> Iterator[str]:
+        for chunk in self._chunks:
+            self.chunks.append_chunk(chunk)
+            yield chunk.text
+        self._exhausted()
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        while True:
+            chunk = await asyncio.to_thread(next, self._chunks, None)
+            if chunk is None:
+                self._exhausted()
+                return
+            self.chunks.append_chunk(chunk)
+            yield chunk.text
+
+
+def split_text_into_chunks(
+    text: str, chunk_size: int, use_semchunk=True, llm_model=None
+) -> List[str]:
     """
     Splits the text into chunks based on the number of tokens.
 
     Args:
         text (str): The text to split.
         chunk_size (int): The maximum number of tokens per chunk.
+        use_semchunk (bool): Whether to split with semchunk instead of
+            ``split_text_into_token_chunks``.
+        llm_model: The language model whose tokenizer counts the tokens;
+            None uses gpt-4o's.
 
     Returns:
         List[str]: A list of text chunks.
     """
-
     if use_semchunk:
         from semchunk import chunk
 
-        def count_tokens(text):
-            return num_tokens_calculus(text)
-
         chunk_size = min(chunk_size, int(chunk_size * 0.9))
 
+        # the shared counter memoizes repeated segments with a bounded memo
         chunks = chunk(
-            text=text, chunk_size=chunk_size, token_counter=count_tokens, memoize=False
+            text=text,
+            chunk_size=chunk_size,
+            token_counter=get_token_counter(llm_model).count,
+            memoize=False,
         )
         return chunks
 
     else:
-        tokens = num_tokens_calculus(text)
-
-        if tokens <= chunk_size:
-            return [text]
-
-        chunks = []
-        current_chunk = []
-        current_length = 0
-
-        words = text.split()
-        for word in words:
-            word_tokens = num_tokens_calculus(word)
-            if current_length + word_tokens > chunk_size:
-                chunks.append(" ".join(current_chunk))
-                current_chunk = [word]
-                current_length = word_tokens
-            else:
-                current_chunk.append(word)
-                current_length += word_tokens
-
-        if current_chunk:
-            chunks.append(" ".join(current_chunk))
-
-        return chunks
+        return [
+            chunk.text
+            for chunk in split_text_into_token_chunks(text, chunk_size, llm_model)
+        ]
@@ -0,0 +1,135 @@
+"""
+token_budget module
+"""
+
+from typing import Dict, Iterable, Optional
+
+from langchain.prompts import PromptTemplate
+
+from .logging import get_logger
+from .tokenizer import get_token_counter
+
+logger = get_logger("token-budget")
+
+# tokens left for the answer when the model has no output limit of its own
+DEFAULT_OUTPUT_TOKENS = 1024
+# tokens wrapping the prompt in a chat message
+MESSAGE_OVERHEAD_TOKENS = 8
+# a chunk tokenized on its own may count a few more tokens than inside the page
+CHUNK_TOKEN_MARGIN = 16
+# share of the content tokens filled by a chunk when the tokenizer of the model is
+# approximated, e.g. by the gpt-4o encoding, which undercounts other models
+APPROXIMATE_CHUNK_RATIO = 0.75
+MIN_CHUNK_TOKENS = 128
+
+_OUTPUT_LIMIT_ATTRS = ("max_tokens", "max_output_tokens", "num_predict")
+# representative values of the variables filled at call time, the content of a
+# single-chunk prompt is sent as a list
+_PLACEHOLDERS = {"chunk_id": "chunk9999", "context": str([""])}
+
+
+def output_token_limit(llm_model) -> Optional[int]:
+    """
+    Returns the maximum number of output tokens configured on a model, if any.
+    """
+    limits = [getattr(llm_model, attr, None) for attr in _OUTPUT_LIMIT_ATTRS]
+    model_kwargs = getattr(llm_model, "model_kwargs", None) or {}
+    limits += [model_kwargs.get(attr) for attr in _OUTPUT_LIMIT_ATTRS]
+    for limit in limits:
+        if isinstance(limit, int) and limit > 0:
+            return limit
+    return None
+
+
+class TokenBudget:
+    """
+    Plans the number of content tokens of a prompt that fit the context window
+    of a model.
+
+    The fixed part of the prompt is measured by rendering its templates with
+    an empty content and counting the result with the tokenizer of the model;
+    the tokens of the answer are reserved from the output limit of the model,
+    ``DEFAULT_OUTPUT_TOKENS`` (at most a quarter of the window) when it has none.
+    Chunks fill only ``APPROXIMATE_CHUNK_RATIO`` of the content tokens when the
+    model is counted with another tokenizer than its own.
+    Measures are made on first use and kept per question.
+
+    Attributes:
+        context_window (int): The number of tokens of the context window.
+        llm_model: The language model whose tokenizer counts the tokens.
+        templates (List[str]): The prompt templates the content is sent with;
+            the largest one bounds the content.
+        variables (Dict[str, str]): Values of the template variables known upfront,
+            such as the format instructions.
+        output_tokens (int): The tokens reserved for the answer.
+
+    Example:
+        >>> budget = TokenBudget(128000, llm_model, [TEMPLATE_CHUNKS_MD],
+        ...                      {"format_instructions": instructions})
+        >>> chunk_size = budget.chunk_size(question="List me all the products")
+    """
+
+    def __init__(
+        self,
+        context_window: int,
+        llm_model=None,
+        templates: Iterable[str] = (),
+        variables: Optional[Dict[str, str]] = None,
+        output_tokens: Optional[int] = None,
+    ):
+        self.context_window = context_window
+        self.llm_model = llm_model
+        self.templates = list(templates)
+        self.variables = dict(variables or {})
+        if output_tokens is None:
+            output_tokens = output_token_limit(llm_model) or min(
+                DEFAULT_OUTPUT_TOKENS, context_window // 4
+            )
+        self.output_tokens = output_tokens
+        self._prompt_tokens: Dict[str, int] = {}
+
+    def prompt_tokens(self, question: str = "") -> int:
+        """
+        Returns the number of tokens of the largest prompt without its content.
+        """
+        if question not in self._prompt_tokens:
+            counter = get_token_counter(self.llm_model)
+            values = {**_PLACEHOLDERS, **self.variables, "question": question}
+            sizes = []
+            for template in map(PromptTemplate.from_template, self.templates):
+                names = template.input_variables
+                prompt = template.format(
+                    **{name: values.get(name, "") for name in names}
+                )
+                sizes.append(counter.count(prompt))
+            self._prompt_tokens[question] = max(sizes, default=0)
+        return self._prompt_tokens[question]
+
+    def content_tokens(self, question: str = "") -> int:
+        """
+        Returns the number of tokens left for the content of the prompt.
+        """
+        available = (
+            self.context_window
+            - self.prompt_tokens(question)
+            - self.output_tokens
+            - MESSAGE_OVERHEAD_TOKENS
+        )
+        if available < MIN_CHUNK_TOKENS:
+            logger.warning(
+                f"The prompt leaves only {available} of {self.context_window} tokens "
+                f"for the content, using {MIN_CHUNK_TOKENS}"
+            )
+            return MIN_CHUNK_TOKENS
+        return available
+
+    def chunk_size(self, question: str = "") -> int:
+        """
+        Returns the size of the chunks of the content, keeping a margin for the
+        tokenization of each chunk on its own, and a proportional one when the
+        tokenizer of the model is approximated.
+        """
+        chunk_size = self.content_tokens(question) - CHUNK_TOKEN_MARGIN
+        if getattr(get_token_counter(self.llm_model), "approximate", False):
+            chunk_size = int(chunk_size * APPROXIMATE_CHUNK_RATIO)
+        return max(MIN_CHUNK_TOKENS, chunk_size)
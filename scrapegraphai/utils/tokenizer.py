@@ -2,15 +2,224 @@
 Module for counting tokens and splitting text into chunks
 """
 
-from .tokenizers.tokenizer_openai import num_tokens_openai
+import threading
+from collections import OrderedDict
+from itertools import accumulate
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
+from .logging import get_logger
+from .tokenizers.tokenizer_mistral import num_tokens_mistral
+from .tokenizers.tokenizer_ollama import num_tokens_ollama
+from .tokenizers.tokenizer_openai import (
+    DEFAULT_OPENAI_MODEL,
+    get_openai_encoding,
+    has_openai_encoding,
+)
 
-def num_tokens_calculus(string: str) -> int:
+logger = get_logger("tokenizer")
+
+DEFAULT_TOKEN_MEMO_CHARS = 8 * 1024 * 1024
+
+
+def _get_model_name(llm_model) -> Optional[str]:
+    for attr in ("model_name", "model", "model_id"):
+        model_name = getattr(llm_model, attr, None)
+        if isinstance(model_name, str) and model_name:
+            return model_name
+    return None
+
+
+class TokenCounter:
     """
-    Returns the number of tokens in a text string.
+    Counts tokens with the tokenizer of a language model.
+
+    Mistral models use the Mistral tokenizer, Ollama models their own token
+    count, and every other model the tiktoken encoding of its name (gpt-4o's
+    when unknown). When a model-specific tokenizer is unavailable the counter
+    falls back to the gpt-4o encoding. Counts of recently seen texts are kept
+    in an LRU memo bounded by their total number of characters.
+
+    Attributes:
+        memo_chars (int): Maximum total length of the memoized texts; 0 disables the memo.
+        approximate (bool): Whether the counts come from another tokenizer than
+            the model's, e.g. the gpt-4o encoding for non-OpenAI models.
+
+    Example:
+        >>> counter = get_token_counter(llm_model)
+        >>> counter.count("Hello world")
+        2
+        >>> counter.count_batch(["Hello", "world"])
+        [1, 1]
     """
 
-    num_tokens_fn = num_tokens_openai
+    def __init__(self, llm_model=None, memo_chars: int = DEFAULT_TOKEN_MEMO_CHARS):
+        self.memo_chars = memo_chars
+        self._lock = threading.Lock()
+        self._memo: "OrderedDict[str, int]" = OrderedDict()
+        self._memo_size = 0
+        self._count_fn, self._encoding = self._select_tokenizer(llm_model)
+        self.approximate = self._approximates(llm_model)
+
+    @staticmethod
+    def _approximates(llm_model) -> bool:
+        if llm_model is None:
+            return False
+        if type(llm_model).__name__ in ("ChatMistralAI", "ChatOllama", "OllamaLLM"):
+            return False
+        return not has_openai_encoding(_get_model_name(llm_model))
+
+    @staticmethod
+    def _select_tokenizer(llm_model) -> Tuple[Callable[[str], int], Optional[object]]:
+        # class names cover both the langchain_community and the partner packages
+        model_class = type(llm_model).__name__
+        if model_class == "ChatMistralAI":
+            return (lambda text: num_tokens_mistral(text, llm_model)), None
+        if model_class in ("ChatOllama", "OllamaLLM"):
+            return (lambda text: num_tokens_ollama(text, llm_model)), None
+
+        model_name = _get_model_name(llm_model) if llm_model is not None else None
+        encoding = get_openai_encoding(model_name or DEFAULT_OPENAI_MODEL)
+        return (lambda text: len(encoding.encode_ordinary(text))), encoding
+
+    def _count(self, text: str) -> int:
+        try:
+            return self._count_fn(text)
+        except Exception as e:
+            if self._encoding is not None:
+                raise
+            logger.warning(
+                f"Counting tokens with the {DEFAULT_OPENAI_MODEL} encoding: {e}"
+            )
+            self._count_fn, self._encoding = self._select_tokenizer(None)
+            self.approximate = True
+            return self._count_fn(text)
+
+    def _lookup(self, text: str) -> Optional[int]:
+        with self._lock:
+            count = self._memo.get(text)
+            if count is not None:
+                self._memo.move_to_end(text)
+            return count
+
+    def _remember(self, text: str, count: int):
+        if len(text) > self.memo_chars:
+            return
+        with self._lock:
+            if text in self._memo:
+                return
+            self._memo[text] = count
+            self._memo_size += len(text)
+            while self._memo_size > self.memo_chars:
+                evicted, _ = self._memo.popitem(last=False)
+                self._memo_size -= len(evicted)
+
+    def count(self, text: str) -> int:
+        """
+        Returns the number of tokens of a text.
+        """
+        count = self._lookup(text)
+        if count is None:
+            count = self._count(text)
+            self._remember(text, count)
+        return count
+
+    def token_byte_offsets(self, text: str) -> Optional[List[int]]:
+        """
+        Tokenizes a text once and returns the offset where each token starts in
+        its UTF-8 encoding, or None if the tokenizer cannot map tokens back to text.
+        """
+        if self._encoding is None:
+            return None
+
+        token_bytes = self._encoding.decode_tokens_bytes(
+            self._encoding.encode_ordinary(text)
+        )
+        self._remember(text, len(token_bytes))
+        if not token_bytes:
+            return []
+        return list(accumulate(map(len, token_bytes[:-1]), initial=0))
+
+    def count_batch(self, texts: Iterable[str]) -> List[int]:
+        """
+        Returns the number of tokens of each text, tokenizing the texts missing
+        from the memo in a single batch when the tokenizer supports it.
+        """
+        texts = list(texts)
+        counts = [self._lookup(text) for text in texts]
+        missing = [i for i, count in enumerate(counts) if count is None]
+        if not missing:
+            return counts
+
+        if self._encoding is not None:
+            encoded = self._encoding.encode_ordinary_batch([texts[i] for i in missing])
+            missing_counts = [len(tokens) for tokens in encoded]
+        else:
+            missing_counts = [self._count(texts[i]) for i in missing]
+
+        for i, count in zip(missing, missing_counts):
+            counts[i] = count
+            self._remember(texts[i], count)
+        return counts
+
 
-    num_tokens = num_tokens_fn(string)
-    return num_tokens
+_counters: Dict[tuple, TokenCounter] = {}
+_counters_lock = threading.Lock()
+
+
+def get_token_counter(llm_model=None) -> TokenCounter:
+    """
+    Returns the token counter shared by every caller using the same model.
+
+    Args:
+        llm_model: The language model whose tokenizer is used; None uses gpt-4o's.
+
+    Returns:
+        TokenCounter: The shared counter.
+    """
+    if llm_model is None:
+        key = (None, DEFAULT_OPENAI_MODEL)
+    else:
+        key = (type(llm_model).__name__, _get_model_name(llm_model))
+
+    with _counters_lock:
+        counter = _counters.get(key)
+        if counter is None:
+            counter = TokenCounter(llm_model)
+            _counters[key] = counter
+        return counter
+
+
+def tokenizer_spec(llm_model) -> Optional[Tuple[Optional[str], Optional[str]]]:
+    """
+    Returns a picklable description of the tokenizer of a model, from which
+    ``tokenizer_model`` selects the same tokenizer in another process, or
+    None when counting tokens needs the model itself (Ollama).
+    """
+    if llm_model is None:
+        return (None, None)
+    model_class = type(llm_model).__name__
+    if model_class in ("ChatOllama", "OllamaLLM"):
+        return None
+    return (model_class, _get_model_name(llm_model))
+
+
+def tokenizer_model(spec: Tuple[Optional[str], Optional[str]]):
+    """
+    Returns a stand-in for the model described by ``tokenizer_spec``, for which
+    ``get_token_counter`` returns the tokenizer of the original model.
+    """
+    model_class, model_name = spec
+    if model_class is None:
+        return None
+    return type(model_class, (), {"model": model_name, "model_name": model_name})()
+
+
+def num_tokens_calculus(string: str, llm_model=None) -> int:
+    """
+    Returns the number of tokens in a text string.
+
+    Args:
+        string (str): The text to count.
+        llm_model: The language model whose tokenizer is used; None uses gpt-4o's.
+    """
+    return get_token_counter(llm_model).count(string)
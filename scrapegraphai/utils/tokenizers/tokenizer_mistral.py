@@ -2,11 +2,23 @@
 Tokenization utilities for Mistral models
 """
 
+from functools import lru_cache
+
 from langchain_core.language_models.chat_models import BaseChatModel
 
 from ..logging import get_logger
 
 
+@lru_cache(maxsize=None)
+def _get_mistral_tokenizer(model: str):
+    """
+    Returns the tokenizer of a Mistral model, loaded once per process.
+    """
+    from mistral_common.tokens.tokenizers.mistral import MistralTokenizer
+
+    return MistralTokenizer.from_model(model)
+
+
 def num_tokens_mistral(text: str, llm_model: BaseChatModel) -> int:
     """
     Estimate the number of tokens in a given text using Mistral's tokenization method,
@@ -34,13 +46,12 @@ def num_tokens_mistral(text: str, llm_model: BaseChatModel) -> int:
     try:
         from mistral_common.protocol.instruct.messages import UserMessage
         from mistral_common.protocol.instruct.request import ChatCompletionRequest
-        from mistral_common.tokens.tokenizers.mistral import MistralTokenizer
     except ImportError:
         raise ImportError(
             "mistral_common is not installed. Please install it using 'pip install mistral-common'."
         )
 
-    tokenizer = MistralTokenizer.from_model(model)
+    tokenizer = _get_mistral_tokenizer(model)
 
     tokenized = tokenizer.encode_chat_completion(
         ChatCompletionRequest(
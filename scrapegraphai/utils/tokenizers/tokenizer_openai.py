@@ -2,18 +2,57 @@
 Tokenization utilities for OpenAI models
 """
 
+from functools import lru_cache
+from typing import Iterable, List, Optional
+
 import tiktoken
 
 from ..logging import get_logger
 
+DEFAULT_OPENAI_MODEL = "gpt-4o"
+DEFAULT_OPENAI_ENCODING = "o200k_base"
+
+
+@lru_cache(maxsize=None)
+def get_openai_encoding(model_name: str = DEFAULT_OPENAI_MODEL) -> tiktoken.Encoding:
+    """
+    Returns the tiktoken encoding of a model, built once per process.
+
+    Args:
+        model_name (str): The OpenAI model name; models unknown to tiktoken
+            use the gpt-4o encoding.
+
+    Returns:
+        tiktoken.Encoding: The encoding.
+    """
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        return tiktoken.get_encoding(DEFAULT_OPENAI_ENCODING)
+
+
+def has_openai_encoding(model_name: Optional[str]) -> bool:
+    """
+    Returns whether tiktoken knows the encoding of a model, rather than
+    approximating its tokenizer with the gpt-4o encoding.
+    """
+    if not model_name:
+        return False
+    try:
+        tiktoken.encoding_name_for_model(model_name)
+    except KeyError:
+        return False
+    return True
+
 
-def num_tokens_openai(text: str) -> int:
+def num_tokens_openai(text: str, model_name: str = DEFAULT_OPENAI_MODEL) -> int:
     """
     Estimate the number of tokens in a given text using OpenAI's tokenization method,
     adjusted for different OpenAI models.
 
     Args:
         text (str): The text to be tokenized and counted.
+        model_name (str): The OpenAI model whose encoding is used.
 
     Returns:
         int: The number of tokens in the text.
@@ -23,7 +62,24 @@ def num_tokens_openai(text: str) -> int:
 
     logger.debug(f"Counting tokens for text of {len(text)} characters")
 
-    encoding = tiktoken.encoding_for_model("gpt-4o")
+    encoding = get_openai_encoding(model_name)
 
-    num_tokens = len(encoding.encode(text))
+    num_tokens = len(encoding.encode_ordinary(text))
     return num_tokens
+
+
+def num_tokens_openai_batch(
+    texts: Iterable[str], model_name: str = DEFAULT_OPENAI_MODEL
+) -> List[int]:
+    """
+    Counts the tokens of several texts at once, encoding them in parallel.
+
+    Args:
+        texts (Iterable[str]): The texts to be tokenized and counted.
+        model_name (str): The OpenAI model whose encoding is used.
+
+    Returns:
+        List[int]: The number of tokens of each text.
+    """
+    encoding = get_openai_encoding(model_name)
+    return [len(tokens) for tokens in encoding.encode_ordinary_batch(list(texts))]
@@ -0,0 +1,224 @@
+"""
+tree_reduce module
+"""
+
+import json
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from .async_map import DEFAULT_MAX_CONCURRENCY, DEFAULT_MAX_RETRIES, amap_bounded
+from .logging import get_logger
+
+logger = get_logger("tree-reduce")
+
+# share of the context window of the model filled with the answers of one merge,
+# the rest is left to the prompt and to the merged answer
+DEFAULT_MERGE_BUDGET_RATIO = 0.5
+
+
+def group_by_token_budget(sizes: List[int], budget: Optional[int]) -> List[List[int]]:
+    """
+    Groups consecutive items so that the sizes of each group add up to at most
+    ``budget`` tokens.
+
+    Every group but the last holds at least two items, even when they exceed
+    the budget together, so that each round of a tree reduce shrinks the items.
+
+    Args:
+        sizes (List[int]): The number of tokens of each item.
+        budget (Optional[int]): The number of tokens of a group; None puts all
+            the items in a single group.
+
+    Returns:
+        List[List[int]]: The indices of the items of each group.
+    """
+    if budget is None:
+        return [list(range(len(sizes)))]
+
+    groups, current, total = [], [], 0
+    for index, size in enumerate(sizes):
+        if len(current) >= 2 and total + size > budget:
+            groups.append(current)
+            current, total = [], 0
+        current.append(index)
+        total += size
+    if current:
+        groups.append(current)
+    return groups
+
+
+async def atree_reduce(
+    items: List[Any],
+    merge: Callable[[List[Any]], Awaitable[Any]],
+    count_tokens: Callable[[Any], int],
+    budget: Optional[int] = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    timeout: Optional[float] = None,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+) -> Any:
+    """
+    Merges items into one by merging groups that fit the token budget in
+    parallel, then merging the results the same way until one group remains.
+
+    Groups of a single item are carried over to the next round unmerged; the
+    last round always merges, even a single item.
+
+    Args:
+        items (List[Any]): The items to merge.
+        merge: The async function merging a list of items into one.
+        count_tokens: Returns the number of tokens of an item.
+        budget (Optional[int]): The number of tokens of the items of one merge;
+            None merges every item at once.
+        max_concurrency (int): Maximum number of merges in flight.
+        timeout (Optional[float]): Deadline of each merge in seconds.
+        max_retries (int): Number of retries of a failed merge.
+
+    Returns:
+        Any: The merged item.
+
+    Raises:
+        ValueError: If there are no items to merge.
+        Exception: The error of a merge failing all its attempts.
+    """
+    if not items:
+        raise ValueError("No items to merge")
+
+    level = 0
+    while True:
+        if budget is None:
+            groups = [list(range(len(items)))]
+        else:
+            sizes = [count_tokens(item) for item in items]
+            groups = group_by_token_budget(sizes, budget)
+        merged_groups = [
+            group for group in groups if len(groups) == 1 or len(group) > 1
+        ]
+        logger.info(
+            f"Merging {len(items)} answers in {len(merged_groups)} groups "
+            f"(level {level})"
+        )
+
+        results = await amap_bounded(
+            lambda group: merge([items[i] for i in group]),
+            merged_groups,
+            max_concurrency=max_concurrency,
+            timeout=timeout,
+            max_retries=max_retries,
+        )
+        for result in results:
+            if not result.ok:
+                raise result.error
+
+        if len(groups) == 1:
+            return results[0].value
+
+        merged = iter(results)
+        items = [
+            next(merged).value if len(group) > 1 else items[group[0]]
+            for group in groups
+        ]
+        level += 1
+
+
+def _unwrap_optional(annotation):
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def array_fields(schema) -> Optional[Tuple[str, ...]]:
+    """
+    Returns the fields of a schema whose answers are merged by concatenation.
+
+    Args:
+        schema: A pydantic model or a JSON schema.
+
+    Returns:
+        Optional[Tuple[str, ...]]: The names of the fields when every field of
+        the schema is a list, an empty tuple when the schema itself is an array,
+        and None when answers of the schema need an LLM to be merged.
+    """
+    if schema is None:
+        return None
+
+    if isinstance(schema, dict):
+        if schema.get("type") == "array":
+            return ()
+        properties = schema.get("properties") or {}
+        fields = tuple(
+            name for name, prop in properties.items() if prop.get("type") == "array"
+        )
+    else:
+        model_fields = getattr(schema, "model_fields", None) or {}
+        properties = model_fields
+        fields = tuple(
+            name
+            for name, field in model_fields.items()
+            if get_origin(_unwrap_optional(field.annotation)) in (list, List)
+        )
+
+    if not properties or len(fields) != len(properties):
+        return None
+    return fields
+
+
+def _dedup(values: List[Any]) -> List[Any]:
+    seen = set()
+    unique = []
+    for value in values:
+        key = json.dumps(value, sort_keys=True, default=str)
+        if key not in seen:
+            seen.add(key)
+            unique.append(value)
+    return unique
+
+
+def concat_answers(answers: List[Any], schema) -> Optional[Any]:
+    """
+    Merges answers of an array-like schema by concatenating their lists and
+    dropping duplicates, without calling an LLM.
+
+    Args:
+        answers (List[Any]): The answers to merge.
+        schema: The schema of the answers, see ``array_fields``.
+
+    Returns:
+        Optional[Any]: The merged answer, or None when the answers cannot be
+        merged by concatenation.
+    """
+    fields = array_fields(schema)
+    if fields is None:
+        return None
+
+    answers = [
+        answer.model_dump() if hasattr(answer, "model_dump") else answer
+        for answer in answers
+    ]
+    if not fields:
+        if not all(isinstance(answer, list) for answer in answers):
+            return None
+        return _dedup([value for answer in answers for value in answer])
+
+    for answer in answers:
+        if not isinstance(answer, dict) or not set(answer) <= set(fields):
+            return None
+        if not all(isinstance(answer.get(field) or [], list) for field in fields):
+            return None
+
+    return {
+        field: _dedup(
+            [value for answer in answers for value in answer.get(field) or []]
+        )
+        for field in fields
+    }
@@ -3,10 +3,15 @@ import pytest
 from langchain_aws import ChatBedrock
 from langchain_ollama import ChatOllama
 from langchain_openai import AzureChatOpenAI, ChatOpenAI
-from scrapegraphai.graphs import AbstractGraph, BaseGraph
+from scrapegraphai.graphs import (
+    AbstractGraph,
+    BaseGraph,
+    SmartScraperLiteGraph,
+    SmartScraperMultiGraph,
+)
 from scrapegraphai.models import DeepSeek, OneApi
 from scrapegraphai.nodes import FetchNode, ParseNode
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 """
 Tests for the AbstractGraph.
@@ -180,6 +185,55 @@ class TestAbstractGraph:
         assert graph.llm_model == mock_model
         assert graph.model_token == 1000
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "graph_class, source, inputs, final_state, answer",
+        [
+            (
+                SmartScraperLiteGraph,
+                "https://example.com",
+                {"url": "https://example.com"},
+                {"parsed_doc": ["chunk"]},
+                ["chunk"],
+            ),
+            (
+                SmartScraperMultiGraph,
+                ["https://example.com"],
+                {"urls": ["https://example.com"]},
+                {},
+                "No answer found.",
+            ),
+        ],
+    )
+    async def test_arun_uses_the_input_and_answer_keys(
+        self, graph_class, source, inputs, final_state, answer
+    ):
+        graph = graph_class(
+            prompt="List the products",
+            source=source,
+            config={
+                "llm": {"model": "openai/gpt-4o-mini", "openai_api_key": "sk-test"}
+            },
+        )
+        aexecute = AsyncMock(return_value=(final_state, []))
+
+        with patch.object(graph.graph, "aexecute", aexecute):
+            assert await graph.arun() == answer
+
+        aexecute.assert_awaited_once_with({"user_prompt": "List the products", **inputs})
+        assert graph.final_state == final_state
+
+    @pytest.mark.asyncio
+    async def test_arun_runs_graphs_without_an_answer_key_in_the_executor(self):
+        graph = TestGraph(
+            "Test prompt",
+            {"llm": {"model": "openai/gpt-3.5-turbo", "openai_api_key": "sk-test"}},
+        )
+
+        with patch.object(graph, "run", return_value="Sync result") as mock_run:
+            assert await graph.arun() == "Sync result"
+            mock_run.assert_called_once()
+
     def test_set_common_params(self):
         """
         Test that the set_common_params method correctly updates the configuration
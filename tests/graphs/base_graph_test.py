@@ -0,0 +1,181 @@
+import asyncio
+import threading
+
+import pytest
+
+from scrapegraphai.graphs import BaseGraph
+from scrapegraphai.nodes import ConditionalNode
+from scrapegraphai.nodes.base_node import BaseNode
+
+"""
+Tests for the parallel execution mode of the BaseGraph.
+"""
+
+
+class RecordingNode(BaseNode):
+    def __init__(self, input, output, node_name, barrier=None, fail=False):
+        super().__init__(node_name, "node", input, output)
+        self.barrier = barrier
+        self.fail = fail
+
+    def execute(self, state: dict) -> dict:
+        if self.barrier is not None:
+            # only passes if the other node sharing the barrier runs concurrently
+            self.barrier.wait()
+        if self.fail:
+            raise RuntimeError(f"{self.node_name} failed")
+        input_keys = self.get_input_keys(state)
+        state[self.output[0]] = [state[key] for key in input_keys]
+        return state
+
+
+def test_fan_out_branches_run_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+    fetch = RecordingNode("url", ["doc"], "Fetch")
+    left = RecordingNode("doc", ["left"], "Left", barrier=barrier)
+    right = RecordingNode("doc", ["right"], "Right", barrier=barrier)
+    merge = RecordingNode("left & right", ["answer"], "Merge")
+
+    graph = BaseGraph(
+        nodes=[fetch, left, right, merge],
+        edges=[(fetch, left), (fetch, right), (left, merge), (right, merge)],
+        entry_point=fetch,
+        parallel=True,
+    )
+    state, exec_info = graph.execute({"user_prompt": "q", "url": "page"})
+
+    assert graph.successors["Fetch"] == ["Left", "Right"]
+    assert state["answer"] == [[["page"]], [["page"]]]
+    assert {info["node_name"] for info in exec_info} == {
+        "Fetch",
+        "Left",
+        "Right",
+        "Merge",
+        "TOTAL RESULT",
+    }
+
+
+def test_nodes_with_independent_keys_overlap_on_a_chain():
+    barrier = threading.Barrier(2, timeout=5)
+    fetch = RecordingNode("url", ["doc"], "Fetch", barrier=barrier)
+    describe = RecordingNode(
+        "user_prompt", ["description"], "Describe", barrier=barrier
+    )
+    answer = RecordingNode("doc & description", ["answer"], "Answer")
+
+    graph = BaseGraph(
+        nodes=[fetch, describe, answer],
+        edges=[(fetch, describe), (describe, answer)],
+        entry_point=fetch,
+        parallel=True,
+    )
+    state, _ = graph.execute({"user_prompt": "q", "url": "page"})
+
+    assert state["answer"] == [["page"], ["q"]]
+
+
+def test_conditional_node_skips_the_branch_not_taken():
+    fetch = RecordingNode("url", ["doc"], "Fetch")
+    cond = ConditionalNode(
+        input="doc",
+        output=["doc"],
+        node_config={"key_name": "retry"},
+        node_name="Cond",
+    )
+    retry = RecordingNode("doc", ["retried"], "Retry")
+    after_retry = RecordingNode("retried", ["answer"], "AfterRetry")
+    answer = RecordingNode("doc", ["answer"], "Answer")
+
+    graph = BaseGraph(
+        nodes=[fetch, cond, retry, after_retry, answer],
+        edges=[
+            (fetch, cond),
+            (cond, retry),
+            (cond, answer),
+            (retry, after_retry),
+        ],
+        entry_point=fetch,
+        parallel=True,
+    )
+    state, exec_info = graph.execute({"user_prompt": "q", "url": "page"})
+
+    assert "retried" not in state
+    assert state["answer"] == [["page"]]
+    assert "Retry" not in {info["node_name"] for info in exec_info}
+
+
+def test_parallel_execution_propagates_node_errors():
+    fetch = RecordingNode("url", ["doc"], "Fetch")
+    broken = RecordingNode("doc", ["answer"], "Broken", fail=True)
+
+    graph = BaseGraph(
+        nodes=[fetch, broken],
+        edges=[(fetch, broken)],
+        entry_point=fetch,
+        parallel=True,
+    )
+    with pytest.raises(RuntimeError, match="Broken failed"):
+        graph.execute({"user_prompt": "q", "url": "page"})
+
+
+class AsyncRecordingNode(RecordingNode):
+    def __init__(self, input, output, node_name, event=None):
+        super().__init__(input, output, node_name)
+        self.event = event
+        self.threads = []
+
+    async def aexecute(self, state: dict) -> dict:
+        self.threads.append(threading.get_ident())
+        if self.event is not None:
+            # every graph waits for the others to start before completing
+            self.event.counter += 1
+            if self.event.counter == self.event.expected:
+                self.event.set()
+            await asyncio.wait_for(self.event.wait(), timeout=5)
+        return self.execute(state)
+
+
+@pytest.mark.asyncio
+async def test_aexecute_runs_graphs_concurrently_on_one_loop():
+    event = asyncio.Event()
+    event.counter, event.expected = 0, 8
+
+    graphs = []
+    for _ in range(8):
+        fetch = AsyncRecordingNode("url", ["doc"], "Fetch", event=event)
+        answer = AsyncRecordingNode("doc", ["answer"], "Answer")
+        graphs.append(
+            BaseGraph(nodes=[fetch, answer], edges=[(fetch, answer)], entry_point=fetch)
+        )
+
+    results = await asyncio.gather(
+        *(
+            graph.aexecute({"user_prompt": "q", "url": f"page{i}"})
+            for i, graph in enumerate(graphs)
+        )
+    )
+
+    assert [state["answer"] for state, _ in results] == [
+        [[f"page{i}"]] for i in range(8)
+    ]
+    assert {graph.nodes[0].threads[0] for graph in graphs} == {threading.get_ident()}
+    assert results[0][1][-1]["node_name"] == "TOTAL RESULT"
+
+
+@pytest.mark.asyncio
+async def test_aexecute_parallel_falls_back_to_threads_for_sync_nodes():
+    barrier = threading.Barrier(2, timeout=5)
+    fetch = RecordingNode("url", ["doc"], "Fetch")
+    left = RecordingNode("doc", ["left"], "Left", barrier=barrier)
+    right = RecordingNode("doc", ["right"], "Right", barrier=barrier)
+    merge = RecordingNode("left & right", ["answer"], "Merge")
+
+    graph = BaseGraph(
+        nodes=[fetch, left, right, merge],
+        edges=[(fetch, left), (fetch, right), (left, merge), (right, merge)],
+        entry_point=fetch,
+        parallel=True,
+    )
+    state, _ = await graph.aexecute({"user_prompt": "q", "url": "page"})
+
+    assert state["answer"] == [[["page"]], [["page"]]]
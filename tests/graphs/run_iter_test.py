@@ -0,0 +1,123 @@
+import asyncio
+import json
+from typing import List
+
+import pytest
+from pydantic import BaseModel
+
+from scrapegraphai.graphs import AbstractGraph, BaseGraph
+from scrapegraphai.nodes import BaseNode, GraphIteratorNode
+from scrapegraphai.utils.jsonl_sink import JSONLSink
+
+CONFIG = {"llm": {"model": "openai/gpt-4o-mini", "api_key": "sk-test"}}
+
+
+class Products(BaseModel):
+    products: List[str]
+
+
+class PageGraph:
+    def __init__(self, prompt, source, config, schema=None):
+        self.prompt = prompt
+        self.source = source
+        self.config = config
+
+    async def arun(self):
+        # the first page is the slowest
+        await asyncio.sleep(0.05 if self.source.endswith("/0") else 0)
+        if self.source.endswith("/broken"):
+            raise ValueError("unreachable")
+        self.execution_info = [{"node_name": "TOTAL RESULT", "total_tokens": 1}]
+        return {"products": [self.source]}
+
+
+class CountNode(BaseNode):
+    def __init__(self):
+        super().__init__("Count", "node", "results", ["answer"], 1)
+
+    def execute(self, state):
+        state["answer"] = {"count": len(state["results"])}
+        return state
+
+
+class MultiGraph(AbstractGraph):
+    def __init__(self, prompt, source, config, schema=None):
+        super().__init__(prompt, config, source, schema)
+
+    def _create_graph(self):
+        iterator = GraphIteratorNode(
+            input="user_prompt & urls",
+            output=["results"],
+            node_config={"graph_instance": PageGraph, "scraper_config": {}},
+        )
+        count = CountNode()
+        return BaseGraph(
+            nodes=[iterator, count],
+            edges=[(iterator, count)],
+            entry_point=iterator,
+            graph_name="MultiGraph",
+        )
+
+    def run(self):
+        raise AssertionError("run_iter must not call run")
+
+
+URLS = [f"https://shop.example/{i}" for i in range(3)]
+
+
+@pytest.mark.asyncio
+async def test_arun_iter_yields_in_completion_order_and_merges(tmp_path):
+    graph = MultiGraph("List the products", URLS, CONFIG, schema=Products)
+    sink = str(tmp_path / "results.jsonl")
+
+    results = [result async for result in graph.arun_iter(merge=True, sink=sink)]
+
+    assert [source for source, _, _ in results][-1] == URLS[0]
+    assert results[0][2] == [{"node_name": "TOTAL RESULT", "total_tokens": 1}]
+    assert graph.final_state["results"] == [{"products": [url]} for url in URLS]
+    assert graph.final_state["answer"] == {"count": 3}
+    assert [record["source"] for record in JSONLSink.read(sink)] == [
+        source for source, _, _ in results
+    ]
+
+
+@pytest.mark.asyncio
+async def test_arun_iter_concatenates_list_answers_as_they_arrive():
+    graph = MultiGraph("List the products", URLS, CONFIG, schema=Products)
+    partial = []
+
+    async for _ in graph.arun_iter(merge=True):
+        partial.append(len(graph.final_state["answer"]["products"]))
+
+    assert partial == [1, 2, 3]
+
+
+def test_run_iter_reports_failures_without_stopping():
+    urls = URLS + ["https://shop.example/broken"]
+    graph = MultiGraph("List the products", urls, CONFIG)
+
+    results = {source: answer for source, answer, _ in graph.run_iter()}
+
+    assert results[urls[-1]] == {"error": "ValueError: unreachable"}
+    assert results[URLS[2]] == {"products": [URLS[2]]}
+
+
+def test_run_iter_requires_several_sources():
+    class SingleGraph(MultiGraph):
+        def _create_graph(self):
+            count = CountNode()
+            return BaseGraph(nodes=[count], edges=[], entry_point=count)
+
+    with pytest.raises(TypeError):
+        SingleGraph("q", "https://shop.example/", CONFIG).run_iter()
+
+
+def test_jsonl_sink_skips_truncated_lines(tmp_path):
+    path = tmp_path / "results.jsonl"
+    with JSONLSink(str(path)) as sink:
+        sink.write({"source": "a"})
+    with open(path, "a") as f:
+        f.write('{"source": ')
+
+    assert list(JSONLSink.read(str(path))) == [{"source": "a"}]
+    assert json.loads(path.read_text().splitlines()[0]) == {"source": "a"}
@@ -0,0 +1,121 @@
+import asyncio
+
+import pytest
+from langchain_core.documents import Document
+
+from scrapegraphai.nodes import FetchNodeLevelK
+
+
+def _site(pages):
+    def fetch_content(self, source, loader_kwargs):
+        fetched.append(source)
+        links = "".join(f'<a href="{link}">link</a>' for link in pages.get(source, []))
+        return [Document(page_content=f"<html><body>{source}{links}</body></html>")]
+
+    fetched = []
+    return fetch_content, fetched
+
+
+def test_crawl_fetches_each_page_once_per_depth(mocker):
+    pages = {
+        "https://example.com": ["/a", "/b", "https://example.com/a#top"],
+        "https://example.com/a": ["/", "/b", "/c"],
+        "https://example.com/b": ["/c", "mailto:someone@example.com"],
+    }
+    fetch_content, fetched = _site(pages)
+    mocker.patch.object(FetchNodeLevelK, "fetch_content", fetch_content)
+    extract_links = mocker.spy(FetchNodeLevelK, "extract_links")
+
+    node = FetchNodeLevelK(
+        input="url",
+        output=["docs"],
+        node_config={"depth": 2},
+    )
+    state = node.execute({"url": "https://example.com"})
+
+    assert fetched == [
+        "https://example.com",
+        "https://example.com/a",
+        "https://example.com/b",
+    ]
+    assert [doc["source"] for doc in state["docs"]] == fetched
+    # the links of the last level are never extracted
+    assert extract_links.call_count == 1
+
+
+def _async_site(pages, delay=0.01):
+    in_flight = {"total": 0, "max": 0, "per_host": {}, "max_per_host": 0}
+    fetched = []
+
+    async def afetch_content(self, source, loader_kwargs):
+        host = source.split("/")[2]
+        in_flight["total"] += 1
+        in_flight["per_host"][host] = in_flight["per_host"].get(host, 0) + 1
+        in_flight["max"] = max(in_flight["max"], in_flight["total"])
+        in_flight["max_per_host"] = max(
+            in_flight["max_per_host"], in_flight["per_host"][host]
+        )
+        try:
+            await asyncio.sleep(delay)
+            fetched.append(source)
+            links = "".join(f'<a href="{link}">x</a>' for link in pages.get(source, []))
+            return [Document(page_content=f"<html><body>{source}{links}</body></html>")]
+        finally:
+            in_flight["total"] -= 1
+            in_flight["per_host"][host] -= 1
+
+    return afetch_content, fetched, in_flight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_crawl_honours_global_and_per_host_limits(mocker):
+    root = "https://example.com"
+    links = [f"https://host{i % 3}.com/page{i}" for i in range(30)]
+    afetch_content, fetched, in_flight = _async_site({root: links})
+    mocker.patch.object(FetchNodeLevelK, "afetch_content", afetch_content)
+
+    node = FetchNodeLevelK(
+        input="url",
+        output=["docs"],
+        node_config={"depth": 2, "concurrency": 4, "max_per_host": 1},
+    )
+    state = await node.aexecute({"url": root})
+
+    assert [doc["source"] for doc in state["docs"]] == [root] + links
+    assert in_flight["max"] == 3
+    assert in_flight["max_per_host"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_crawl_stops_at_the_page_budget(mocker):
+    root = "https://example.com"
+    links = [f"https://example.com/page{i}" for i in range(50)]
+    afetch_content, fetched, _ = _async_site({root: links})
+    mocker.patch.object(FetchNodeLevelK, "afetch_content", afetch_content)
+
+    node = FetchNodeLevelK(
+        input="url",
+        output=["docs"],
+        node_config={"depth": 3, "concurrency": 8, "max_per_host": 8, "max_pages": 10},
+    )
+    state = await node.aexecute({"url": root})
+
+    assert len(state["docs"]) == 10
+    assert len(fetched) < 20
+
+
+@pytest.mark.asyncio
+async def test_sync_concurrent_crawl_runs_under_a_running_loop(mocker):
+    root = "https://example.com"
+    links = [f"https://example.com/page{i}" for i in range(4)]
+    afetch_content, fetched, _ = _async_site({root: links})
+    mocker.patch.object(FetchNodeLevelK, "afetch_content", afetch_content)
+
+    node = FetchNodeLevelK(
+        input="url",
+        output=["docs"],
+        node_config={"depth": 2, "concurrency": 4},
+    )
+    state = node.execute({"url": root})
+
+    assert [doc["source"] for doc in state["docs"]] == [root] + links
@@ -1,3 +1,4 @@
+import pytest
 from langchain_core.documents import Document
 
 from scrapegraphai.nodes import FetchNode
@@ -74,3 +75,41 @@ def test_fetch_txt():
     with open("inputs/plain_html_example.txt") as f:
         result = node.execute({"txt": f.read()})
     assert result is not None
+
+
+@pytest.mark.asyncio
+async def test_fetch_html_async(mocker):
+    async def alazy_load():
+        yield Document(page_content="<html><body>Async page</body></html>")
+
+    mock_loader_cls = mocker.patch("scrapegraphai.nodes.fetch_node.ChromiumLoader")
+    mock_loader = mock_loader_cls.return_value
+    mock_loader.alazy_load = alazy_load
+    node = FetchNode(
+        input="url | local_dir",
+        output=["doc"],
+        node_config={"headless": True},
+    )
+    result = await node.aexecute({"url": "https://scrapegraph-ai.com/example"})
+
+    mock_loader.load.assert_not_called()
+    assert "Async page" in result["doc"][0].page_content
+
+
+def test_fetch_html_with_soup(mocker):
+    content = "<html><body><p>Plain HTTP page</p></body></html>"
+    mock_fetch = mocker.patch(
+        "scrapegraphai.nodes.fetch_node.http_fetch", return_value=content
+    )
+    mock_loader_cls = mocker.patch("scrapegraphai.nodes.fetch_node.ChromiumLoader")
+    node = FetchNode(
+        input="url | local_dir",
+        output=["doc"],
+        node_config={"use_soup": True, "loader_kwargs": {"timeout": 5}},
+    )
+    result = node.execute({"url": "https://scrapegraph-ai.com/example"})
+
+    mock_loader_cls.assert_not_called()
+    assert mock_fetch.call_args.kwargs["timeout"] == 5
+    assert result["original_html"][0].page_content == content
+    assert "Plain HTTP page" in result["doc"][0].page_content
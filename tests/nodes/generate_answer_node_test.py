@@ -0,0 +1,166 @@
+import asyncio
+from typing import List
+
+import pytest
+from langchain_core.runnables import RunnableLambda
+from pydantic import BaseModel
+
+from scrapegraphai.nodes import GenerateAnswerNode
+from scrapegraphai.utils.split_text_into_chunks import ChunkStream, TextChunk
+
+
+class FakeLLM:
+    model_name = "gpt-4o-mini"
+
+
+def make_node(calls, **config):
+    node = GenerateAnswerNode(
+        input="user_prompt & parsed_doc",
+        output=["answer"],
+        node_config={"llm_model": FakeLLM(), **config},
+    )
+
+    def make_chain(template, input_variables, partial_variables, output_parser):
+        def run(inputs):
+            if "chunk_id" in partial_variables:
+                calls.append(("chunk", partial_variables["context"]))
+                return {"content": partial_variables["context"].upper()}
+            if "context" in inputs:
+                calls.append(("merge", inputs["context"]))
+                return {"content": list(inputs["context"].values())}
+            calls.append(("single", partial_variables["context"]))
+            return {"content": partial_variables["context"]}
+
+        return RunnableLambda(run)
+
+    node._make_chain = make_chain
+    return node
+
+
+def produce(calls, texts):
+    for text in texts:
+        calls.append(("produced", text))
+        yield TextChunk(text, len(text.split()))
+
+
+def test_stream_dispatches_chunks_as_they_are_produced():
+    calls = []
+    node = make_node(calls, max_concurrency=1)
+    stream = ChunkStream(produce(calls, ["one", "two", "three"]))
+    state = {"user_prompt": "What is sold?", "parsed_doc": stream}
+
+    state = node.execute(state)
+
+    assert state["answer"] == {
+        "content": [{"content": "ONE"}, {"content": "TWO"}, {"content": "THREE"}]
+    }
+    # with one chunk in flight, the third chunk is produced after the first call
+    assert calls.index(("chunk", "one")) < calls.index(("produced", "three"))
+    assert stream.token_counts == [1, 1, 1]
+
+
+@pytest.mark.asyncio
+async def test_async_stream_of_one_chunk_uses_the_single_chunk_prompt():
+    calls = []
+    node = make_node(calls)
+    state = {
+        "user_prompt": "What is sold?",
+        "parsed_doc": ChunkStream(produce(calls, ["only chunk"])),
+    }
+
+    state = await node.aexecute(state)
+
+    assert state["answer"] == {"content": ["only chunk"]}
+    assert ("single", ["only chunk"]) in calls
+
+
+@pytest.mark.asyncio
+async def test_async_stream_merges_the_chunk_answers_in_order():
+    calls = []
+    node = make_node(calls, max_concurrency=2)
+    state = {
+        "user_prompt": "What is sold?",
+        "parsed_doc": ChunkStream(produce(calls, ["one", "two", "three"])),
+    }
+
+    state = await node.aexecute(state)
+
+    assert state["answer"] == {
+        "content": [{"content": "ONE"}, {"content": "TWO"}, {"content": "THREE"}]
+    }
+
+
+def test_failed_chunks_are_left_out_of_the_merge():
+    calls = []
+    node = make_node(calls, chunk_retries=1)
+    original = node._make_chain
+
+    def make_chain(template, input_variables, partial_variables, output_parser):
+        if partial_variables.get("context") == "two":
+            return RunnableLambda(lambda inputs: 1 / 0)
+        return original(template, input_variables, partial_variables, output_parser)
+
+    node._make_chain = make_chain
+    state = node.execute({"user_prompt": "What is sold?", "parsed_doc": ["one", "two"]})
+
+    assert state["answer"] == {"content": [{"content": "ONE"}]}
+
+
+def test_many_chunk_answers_are_merged_as_a_tree():
+    calls = []
+    node = make_node(calls, model_token=8)
+    node._count_tokens = lambda answer: 2
+
+    state = node.execute(
+        {"user_prompt": "What is sold?", "parsed_doc": ["a", "b", "c", "d"]}
+    )
+
+    merges = [context for kind, context in calls if kind == "merge"]
+    assert len(merges) == 3
+    assert state["answer"]["content"] == [
+        {"content": [{"content": "A"}, {"content": "B"}]},
+        {"content": [{"content": "C"}, {"content": "D"}]},
+    ]
+
+
+def test_list_answers_are_concatenated_without_the_llm():
+    calls = []
+
+    class Products(BaseModel):
+        products: List[str]
+
+    node = make_node(calls, schema=Products)
+    original = node._make_chain
+
+    def make_chain(template, input_variables, partial_variables, output_parser):
+        if "chunk_id" in partial_variables:
+            context = partial_variables["context"]
+            return RunnableLambda(lambda inputs: {"products": [context, "shared"]})
+        return original(template, input_variables, partial_variables, output_parser)
+
+    node._make_chain = make_chain
+    state = node.execute({"user_prompt": "List products", "parsed_doc": ["a", "b"]})
+
+    assert state["answer"] == {"products": ["a", "shared", "b"]}
+    assert not [call for call in calls if call[0] == "merge"]
+
+
+def test_repeated_sync_runs_share_one_event_loop():
+    # like the httpx client shared by langchain-openai, the chain only works
+    # on the event loop it was first used on
+    loops = []
+
+    async def call(inputs):
+        loop = asyncio.get_running_loop()
+        if loops and loops[0] is not loop:
+            raise RuntimeError("Connection error")
+        loops.append(loop)
+        return {"content": "ok"}
+
+    node = make_node([], chunk_retries=0)
+    node._make_chain = lambda *args: RunnableLambda(call)
+
+    for _ in range(2):
+        state = node.execute({"user_prompt": "What is sold?", "parsed_doc": ["one"]})
+        assert state["answer"] == {"content": "ok"}
+    assert len(loops) == 2
@@ -0,0 +1,181 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from scrapegraphai.nodes import GraphIteratorNode
+
+
+class FakeGraph:
+    threads = []
+
+    def __init__(self, prompt, source, config, schema=None):
+        self.prompt = prompt
+        self.source = source
+        self.config = config
+
+    def run(self):
+        raise AssertionError("the iterator must await arun")
+
+    async def arun(self):
+        FakeGraph.threads.append(threading.get_ident())
+        await asyncio.sleep(0)
+        return {"answer": self.source}
+
+
+@pytest.mark.asyncio
+async def test_graph_iterator_awaits_graph_instances():
+    node = GraphIteratorNode(
+        input="user_prompt & urls",
+        output=["results"],
+        node_config={"graph_instance": FakeGraph, "scraper_config": {}},
+    )
+    state = await node.aexecute(
+        {"user_prompt": "q", "urls": [f"https://example.com/{i}" for i in range(20)]}
+    )
+
+    assert state["results"] == [
+        {"answer": f"https://example.com/{i}"} for i in range(20)
+    ]
+    assert set(FakeGraph.threads) == {threading.get_ident()}
+
+
+class LoopGraph(FakeGraph):
+    loops = set()
+
+    async def arun(self):
+        LoopGraph.loops.add(asyncio.get_running_loop())
+        return {"answer": self.source}
+
+
+def test_repeated_sync_runs_share_one_event_loop():
+    node = GraphIteratorNode(
+        input="user_prompt & urls",
+        output=["results"],
+        node_config={"graph_instance": LoopGraph, "scraper_config": {}},
+    )
+
+    for _ in range(2):
+        state = node.execute({"user_prompt": "q", "urls": ["https://example.com/"]})
+        assert state["results"] == [{"answer": "https://example.com/"}]
+
+    assert len(LoopGraph.loops) == 1
+
+
+class CountingGraph(FakeGraph):
+    instances = 0
+    running = 0
+    max_running = 0
+
+    def __init__(self, prompt, source, config, schema=None):
+        super().__init__(prompt, source, config, schema)
+        CountingGraph.instances += 1
+
+    async def arun(self):
+        CountingGraph.running += 1
+        CountingGraph.max_running = max(
+            CountingGraph.max_running, CountingGraph.running
+        )
+        await asyncio.sleep(0)
+        CountingGraph.running -= 1
+        return {"answer": self.source, "prompt": self.prompt}
+
+
+@pytest.mark.asyncio
+async def test_graph_iterator_reuses_one_compiled_graph():
+    config = {"reuse_graph": True}
+    node = GraphIteratorNode(
+        input="user_prompt & urls",
+        output=["results"],
+        node_config={
+            "graph_instance": CountingGraph,
+            "scraper_config": config,
+            "batchsize": 4,
+        },
+    )
+    urls = [f"https://example.com/{i}" for i in range(50)]
+
+    state = await node.aexecute({"user_prompt": "q", "urls": urls})
+
+    assert state["results"] == [{"answer": url, "prompt": "q"} for url in urls]
+    assert CountingGraph.instances == 1
+    assert CountingGraph.max_running == 4
+    assert config["graph_depth"] == 1
+
+
+class HostGraph(FakeGraph):
+    running = {}
+    max_running = {}
+    throttled = set()
+
+    async def arun(self):
+        host = self.source.split("/")[2]
+        HostGraph.running[host] = HostGraph.running.get(host, 0) + 1
+        HostGraph.max_running[host] = max(
+            HostGraph.max_running.get(host, 0), HostGraph.running[host]
+        )
+        await asyncio.sleep(0.01)
+        HostGraph.running[host] -= 1
+        if self.source in HostGraph.throttled:
+            HostGraph.throttled.discard(self.source)
+            raise asyncio.TimeoutError()
+        return {"answer": self.source}
+
+
+@pytest.mark.asyncio
+async def test_graph_iterator_limits_each_host_and_retries_throttled_sources():
+    urls = [f"https://a.com/{i}" for i in range(6)] + [
+        f"https://b.com/{i}" for i in range(6)
+    ]
+    HostGraph.throttled = {"https://b.com/0"}
+    node = GraphIteratorNode(
+        input="user_prompt & urls",
+        output=["results"],
+        node_config={
+            "graph_instance": HostGraph,
+            "scraper_config": {"max_per_host": 2, "host_max_delay": 0.05},
+            "batchsize": 8,
+        },
+    )
+
+    state = await node.aexecute({"user_prompt": "q", "urls": urls})
+
+    assert state["results"] == [{"answer": url} for url in urls]
+    assert HostGraph.max_running == {"a.com": 2, "b.com": 2}
+    assert state["host_stats"]["b.com"]["throttled"] == 1
+    assert state["host_stats"]["a.com"]["succeeded"] == 6
+
+
+class DelayedHostGraph(FakeGraph):
+    durations = {"https://b.com/": 0.3, "https://c.com/": 0.3}
+    starts = {}
+
+    async def arun(self):
+        DelayedHostGraph.starts[self.source] = time.monotonic()
+        await asyncio.sleep(DelayedHostGraph.durations.get(self.source, 0.01))
+        return {"answer": self.source}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("reuse_graph", [False, True])
+async def test_host_delay_holds_when_batch_slots_free_up_together(reuse_graph):
+    # b.com and c.com end together and free both batch slots for a.com
+    urls = ["https://b.com/", "https://c.com/"] + [
+        f"https://a.com/{i}" for i in range(3)
+    ]
+    DelayedHostGraph.starts = {}
+    node = GraphIteratorNode(
+        input="user_prompt & urls",
+        output=["results"],
+        node_config={
+            "graph_instance": DelayedHostGraph,
+            "scraper_config": {"host_delay": 0.1, "reuse_graph": reuse_graph},
+            "batchsize": 2,
+        },
+    )
+
+    await node.aexecute({"user_prompt": "q", "urls": urls})
+
+    starts = sorted(DelayedHostGraph.starts[url] for url in urls[2:])
+    assert all(later - earlier >= 0.09 for earlier, later in zip(starts, starts[1:]))
@@ -0,0 +1,81 @@
+from langchain_core.documents import Document
+
+from scrapegraphai.nodes import ParseNode
+from scrapegraphai.utils.split_text_into_chunks import TextChunk
+
+HTML = """
+<html><body>
+    <a href="/products">Products</a>
+    <a href="/brochure.png">Brochure</a>
+    <img srcset="/small.jpg 1x, /large.jpg 2x">
+</body></html>
+"""
+
+
+def make_node(**config):
+    return ParseNode(
+        input="doc & url",
+        output=["parsed_doc", "link_urls", "img_urls"],
+        node_config={"chunk_size": 1024, "parse_urls": True, **config},
+    )
+
+
+def test_extracts_urls_from_the_dom():
+    node = make_node()
+    document = Document(page_content=HTML, metadata={"source": "https://shop.example/"})
+
+    links, images = node._extract_document_urls(document, "https://shop.example/")
+
+    assert links == ["https://shop.example/products"]
+    assert images == [
+        "https://shop.example/small.jpg",
+        "https://shop.example/large.jpg",
+        "https://shop.example/brochure.png",
+    ]
+
+
+def test_plain_text_falls_back_to_regexes():
+    node = make_node(parse_html=False)
+    document = Document(
+        page_content="Our logo: ![logo](/logo.png)",
+        metadata={"source": "local_dir"},
+    )
+
+    links, images = node._extract_document_urls(document, "https://shop.example/")
+
+    assert links == []
+    assert images == ["https://shop.example/logo.png"]
+
+
+def fake_chunks(text, chunk_size, llm_model):
+    for sentence in text.split(". "):
+        yield TextChunk(sentence, len(sentence.split()))
+
+
+def test_chunks_carry_their_token_counts(monkeypatch):
+    monkeypatch.setattr("scrapegraphai.nodes.parse_node.iter_token_chunks", fake_chunks)
+    node = ParseNode(
+        input="doc", output=["parsed_doc"], node_config={"chunk_size": 1024}
+    )
+
+    state = node.execute({"doc": ["A red chair. Two blue tables"]})
+
+    assert state["parsed_doc"] == ["A red chair", "Two blue tables"]
+    assert state["parsed_doc"].token_counts == [3, 3]
+
+
+def test_streamed_chunks_are_published_once_consumed(monkeypatch):
+    monkeypatch.setattr("scrapegraphai.nodes.parse_node.iter_token_chunks", fake_chunks)
+    node = ParseNode(
+        input="doc",
+        output=["chunks"],
+        node_config={"chunk_size": 1024, "stream_chunks": True},
+    )
+
+    state = node.execute({"doc": ["A red chair. Two blue tables"]})
+    stream = state["chunks"]
+
+    assert "parsed_doc" not in state and "content" not in state
+    assert list(stream) == ["A red chair", "Two blue tables"]
+    assert state["chunks"] is state["parsed_doc"] is state["content"]
+    assert state["parsed_doc"].token_counts == [3, 3]
@@ -0,0 +1,128 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from scrapegraphai.docloaders import BrowserPool, ChromiumLoader
+
+
+class FakePage:
+    def __init__(self, url_log):
+        self.url_log = url_log
+
+    async def goto(self, url, wait_until=None):
+        self.url_log.append(url)
+
+    async def wait_for_load_state(self, state):
+        pass
+
+    async def content(self):
+        return f"<html><body>{self.url_log[-1]}</body></html>"
+
+
+class FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+
+    async def new_page(self):
+        return FakePage(self.browser.urls)
+
+    async def add_init_script(self, *args, **kwargs):
+        pass
+
+    async def close(self):
+        self.browser.open_contexts -= 1
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.closed = False
+        self.open_contexts = 0
+        self.urls = []
+
+    def is_connected(self):
+        return self.connected and not self.closed
+
+    async def new_context(self, storage_state=None):
+        self.open_contexts += 1
+        return FakeContext(self)
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def pool():
+    launched = []
+
+    async def fake_launch(self):
+        browser = FakeBrowser()
+        launched.append(browser)
+        return browser
+
+    with patch.object(BrowserPool, "_launch_browser", fake_launch):
+        pool = BrowserPool(size=1, max_pages_per_browser=3)
+        pool.launched = launched
+        yield pool
+        pool.close()
+
+
+async def _fetch(pool, url):
+    async with pool.page() as page:
+        await page.goto(url)
+        return await page.content()
+
+
+def test_browser_is_reused_across_pages(pool):
+    for i in range(2):
+        assert f"https://example.com/{i}" in pool.run(
+            _fetch(pool, f"https://example.com/{i}")
+        )
+
+    assert len(pool.launched) == 1
+    assert pool.launched[0].open_contexts == 0
+
+
+def test_browser_is_recycled_after_max_pages(pool):
+    for i in range(4):
+        pool.run(_fetch(pool, f"https://example.com/{i}"))
+
+    assert len(pool.launched) == 2
+    assert pool.launched[0].closed
+    assert pool.launched[0].urls == [f"https://example.com/{i}" for i in range(3)]
+
+
+def test_disconnected_browser_is_replaced(pool):
+    pool.run(_fetch(pool, "https://example.com/a"))
+    pool.launched[0].connected = False
+    pool.run(_fetch(pool, "https://example.com/b"))
+
+    assert len(pool.launched) == 2
+    assert pool.launched[1].urls == ["https://example.com/b"]
+
+
+def test_arun_from_another_event_loop(pool):
+    async def main():
+        return await asyncio.gather(
+            *(pool.arun(_fetch(pool, f"https://example.com/{i}")) for i in range(2))
+        )
+
+    assert len(asyncio.run(main())) == 2
+
+
+def test_chromium_loader_uses_pool(pool):
+    loader = ChromiumLoader(["https://example.com/pooled"], browser_pool=pool)
+    docs = loader.load()
+
+    assert "https://example.com/pooled" in docs[0].page_content
+    assert len(pool.launched) == 1
+
+
+def test_get_returns_shared_pool():
+    first = BrowserPool.get(headless=True, size=3)
+    try:
+        assert BrowserPool.get(headless=True, size=3) is first
+        assert BrowserPool.get(headless=False, size=3) is not first
+    finally:
+        BrowserPool.close_all()
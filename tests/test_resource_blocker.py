@@ -0,0 +1,113 @@
+import pytest
+
+from scrapegraphai.docloaders import ChromiumLoader, ResourceBlocker
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type):
+        self.url = url
+        self.resource_type = resource_type
+
+
+class FakeRoute:
+    def __init__(self, request):
+        self.request = request
+        self.outcome = None
+
+    async def abort(self):
+        self.outcome = "aborted"
+
+    async def continue_(self):
+        self.outcome = "continued"
+
+
+class FakeResponse:
+    def __init__(self, length):
+        self.headers = {"content-length": str(length)}
+
+
+class FakePage:
+    """Replays a page load through the installed route handler."""
+
+    def __init__(self, requests):
+        self.requests = requests
+        self.routes = []
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    async def route(self, pattern, handler):
+        self.routes.append(handler)
+
+    async def goto(self, url, wait_until=None):
+        for request_url, resource_type, length in self.requests:
+            route = FakeRoute(FakeRequest(request_url, resource_type))
+            await self.routes[0](route)
+            if route.outcome == "continued":
+                self.handlers["response"](FakeResponse(length))
+
+    async def content(self):
+        return "<html><body>page</body></html>"
+
+
+def test_from_config():
+    assert ResourceBlocker.from_config(None) is None
+    assert ResourceBlocker.from_config(False) is None
+
+    default = ResourceBlocker.from_config(True)
+    assert "image" in default.resource_types
+    assert "doubleclick.net" in default.domains
+
+    custom = ResourceBlocker.from_config(
+        {"resource_types": ["media"], "extra_domains": ["tracker.example"]}
+    )
+    assert custom.resource_types == {"media"}
+    assert "tracker.example" in custom.domains
+    assert "doubleclick.net" in custom.domains
+
+
+def test_should_block():
+    blocker = ResourceBlocker(resource_types=["image"], domains=["ads.example"])
+
+    assert blocker.should_block("image", "https://example.com/logo.png")
+    assert blocker.should_block("script", "https://cdn.ads.example/tag.js")
+    assert not blocker.should_block("script", "https://notads.example/app.js")
+    assert not blocker.should_block("document", "https://ads.example/")
+
+
+@pytest.mark.asyncio
+async def test_attach_counts_blocked_and_loaded_requests():
+    blocker = ResourceBlocker.from_config(True)
+    page = FakePage(
+        [
+            ("https://example.com/", "document", 5000),
+            ("https://example.com/app.js", "script", 2000),
+            ("https://example.com/hero.jpg", "image", 300000),
+            ("https://example.com/font.woff2", "font", 40000),
+            ("https://www.google-analytics.com/analytics.js", "script", 50000),
+        ]
+    )
+
+    stats = await blocker.attach(page)
+    await page.goto("https://example.com/")
+
+    assert stats.as_dict() == {
+        "blocked_requests": 3,
+        "blocked_by_type": {"image": 1, "font": 1, "script": 1},
+        "loaded_requests": 2,
+        "loaded_bytes": 7000,
+    }
+
+
+@pytest.mark.asyncio
+async def test_chromium_loader_reports_resource_stats():
+    loader = ChromiumLoader(["https://example.com/"], block_resources=True)
+    page = FakePage([("https://example.com/hero.jpg", "image", 300000)])
+
+    await loader._attach_resource_blocker(page, "https://example.com/")
+    await page.goto("https://example.com/")
+    document = loader._make_document("https://example.com/", await page.content())
+
+    assert document.metadata["source"] == "https://example.com/"
+    assert document.metadata["resources"]["blocked_requests"] == 1
@@ -18,15 +18,15 @@ def test_scrape_do_fetch_without_proxy():
     encoded_url = urllib.parse.quote(target_url)
     expected_response = "Mocked API response"
 
-    with patch("requests.get") as mock_get:
+    with patch("scrapegraphai.docloaders.scrape_do.get_http_client") as mock_client:
         mock_response = Mock()
         mock_response.text = expected_response
-        mock_get.return_value = mock_response
+        mock_client.return_value.get.return_value = mock_response
 
         result = scrape_do_fetch(token, target_url, use_proxy=False)
 
         expected_url = f"http://api.scrape.do?token={token}&url={encoded_url}"
-        mock_get.assert_called_once_with(expected_url)
+        mock_client.return_value.get.assert_called_once_with(expected_url, timeout=60)
 
         assert result == expected_response
 
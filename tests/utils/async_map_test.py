@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from scrapegraphai.utils.async_map import amap_bounded, iter_sync, run_sync
+
+
+@pytest.mark.asyncio
+async def test_limits_the_calls_in_flight():
+    in_flight = peak = 0
+
+    async def work(item):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return item * 2
+
+    results = await amap_bounded(work, range(10), max_concurrency=3)
+
+    assert [result.value for result in results] == [i * 2 for i in range(10)]
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_cancels_slow_attempts_and_retries_them():
+    attempts = {}
+    cancelled = []
+
+    async def work(item):
+        attempts[item] = attempts.get(item, 0) + 1
+        if item == "slow" and attempts[item] == 1:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(item)
+                raise
+        return item
+
+    results = await amap_bounded(
+        work, ["fast", "slow"], timeout=0.05, max_retries=1, retry_backoff=0
+    )
+
+    assert [result.value for result in results] == ["fast", "slow"]
+    assert [result.attempts for result in results] == [1, 2]
+    assert cancelled == ["slow"]
+
+
+@pytest.mark.asyncio
+async def test_keeps_partial_results():
+    async def work(item):
+        if item == 2:
+            raise ValueError("bad chunk")
+        return item
+
+    results = await amap_bounded(work, [1, 2, 3], max_retries=2, retry_backoff=0)
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, ValueError)
+    assert results[1].attempts == 3
+
+
+def test_run_sync_from_a_running_loop():
+    async def inner():
+        return run_sync(asyncio.sleep(0, result="done"))
+
+    assert asyncio.run(inner()) == "done"
+
+
+def test_iter_sync_shares_the_loop_and_closes_on_early_exit():
+    closed = []
+
+    async def numbers():
+        try:
+            for i in range(1000):
+                await asyncio.sleep(0)
+                yield i, asyncio.get_running_loop()
+        finally:
+            closed.append(True)
+
+    items = []
+    for item in iter_sync(numbers()):
+        items.append(item)
+        if len(items) == 2:
+            break
+
+    assert [i for i, _ in items] == [0, 1]
+    assert items[0][1] is run_sync(_running_loop())
+    assert closed == [True]
+
+
+async def _running_loop():
+    return asyncio.get_running_loop()
@@ -0,0 +1,127 @@
+from langchain_core.documents import Document
+
+from scrapegraphai.nodes import ParseNode
+from scrapegraphai.utils.boilerplate import (
+    BoilerplateStore,
+    _save_stores,
+    block_signature,
+    create_boilerplate_store,
+    split_blocks,
+)
+
+HEADER = "* Home\n* Products\n* About us\n* Contact the sales team\n\n"
+FOOTER = "Copyright 2024 Example Shop. All rights reserved. Privacy policy.\n"
+
+
+def page(body: str, year: int = 2024) -> str:
+    return HEADER + body + "\n\n" + FOOTER.replace("2024", str(year))
+
+
+def test_split_blocks_keeps_the_text():
+    text = page("Product A costs $10 and ships in two days.")
+
+    assert "".join(split_blocks(text)) == text
+    assert split_blocks(text)[0] == HEADER
+
+
+def test_near_duplicate_blocks_share_a_band():
+    footer = block_signature(FOOTER)
+
+    assert set(footer) & set(block_signature(FOOTER.replace("2024", "2025")))
+    assert not set(footer) & set(block_signature("Product A costs $10 and ships fast."))
+
+
+def test_strips_blocks_repeated_across_pages_of_a_host():
+    store = BoilerplateStore()
+    first = page("Product A costs $10 and ships in two days.")
+    second = page("Product B costs $12 and ships in three days.", year=2025)
+    store.observe("https://shop.example/a", first)
+    store.observe("https://shop.example/b", second)
+    store.observe("https://other.example/", first)
+
+    result = store.strip("https://shop.example/a", first)
+
+    assert result.text == "Product A costs $10 and ships in two days.\n\n"
+    assert result.removed == [HEADER, FOOTER]
+    assert result.bytes_removed == len(HEADER) + len(FOOTER)
+    # a single page of a host has no boilerplate
+    assert store.strip("https://other.example/", first).removed == []
+
+
+def test_signatures_persist_across_runs(tmp_path):
+    path = str(tmp_path / "boilerplate.json")
+    store = BoilerplateStore(path)
+    store.observe("https://shop.example/a", page("Product A costs $10."))
+    store.observe("https://shop.example/b", page("Product B costs $12."))
+    store.save()
+
+    new_page = page("Product C costs $14.")
+    result = BoilerplateStore(path).strip("https://shop.example/c", new_page)
+
+    assert result.text == "Product C costs $14.\n\n"
+
+
+def test_saves_are_batched_and_flushed_at_exit(tmp_path):
+    path = tmp_path / "boilerplate.json"
+    store = BoilerplateStore(str(path), save_every=3)
+    for name in "ab":
+        store.observe(f"https://shop.example/{name}", page(f"Product {name}."))
+        store.save_if_due()
+    assert not path.exists()
+
+    store.observe("https://shop.example/c", page("Product c."))
+    store.save_if_due()
+    assert path.exists()
+
+    store.observe("https://blog.example/d", page("Post d."))
+    store.save_if_due()
+    assert "blog.example" not in path.read_text()
+
+    _save_stores()
+    assert "blog.example" in path.read_text()
+
+
+def test_create_boilerplate_store():
+    assert create_boilerplate_store(None) is None
+    assert create_boilerplate_store(True).min_pages == 2
+    assert create_boilerplate_store({"min_pages": 3}).min_pages == 3
+
+    store = BoilerplateStore()
+    assert create_boilerplate_store(store) is store
+
+
+def test_parse_node_strips_and_reports_boilerplate(monkeypatch):
+    class FakeCounter:
+        def count(self, text):
+            return len(text.split())
+
+    monkeypatch.setattr(
+        "scrapegraphai.nodes.parse_node.get_token_counter", lambda model: FakeCounter()
+    )
+    monkeypatch.setattr(
+        "scrapegraphai.nodes.parse_node.iter_token_chunks",
+        lambda text, chunk_size, llm_model: iter([]),
+    )
+    store = BoilerplateStore()
+    store.observe("https://shop.example/a", page("Product A costs $10."))
+    node = ParseNode(
+        input="doc",
+        output=["parsed_doc"],
+        node_config={
+            "chunk_size": 1024,
+            "parse_html": False,
+            "boilerplate_store": store,
+        },
+    )
+    document = Document(
+        page_content=page("Product B costs $12."),
+        metadata={"source": "https://shop.example/b"},
+    )
+
+    state = node.execute({"doc": [document]})
+
+    assert state["boilerplate"] == {
+        "blocks_removed": 2,
+        "bytes_removed": len(HEADER) + len(FOOTER),
+        "tokens_removed": len((HEADER + FOOTER).split()),
+    }
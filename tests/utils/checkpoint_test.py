@@ -0,0 +1,143 @@
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+
+from scrapegraphai.nodes import GraphIteratorNode
+from scrapegraphai.utils.checkpoint import CheckpointStore, create_checkpoint_store
+
+
+class Product(BaseModel):
+    name: str
+
+
+class FlakyGraph:
+    runs = []
+    broken = set()
+
+    def __init__(self, prompt, source, config, schema=None):
+        self.prompt = prompt
+        self.source = source
+        self.config = config
+
+    async def arun(self):
+        FlakyGraph.runs.append(self.source)
+        await asyncio.sleep(0)
+        if self.source in FlakyGraph.broken:
+            raise ValueError("unreachable")
+        self.execution_info = [{"node_name": "TOTAL RESULT"}]
+        if self.source.endswith("/empty"):
+            return {"error": "Invalid JSON response format"}
+        return {"name": self.source}
+
+
+URLS = [f"https://shop.example/{i}" for i in range(4)]
+
+
+def make_node(path, reuse_graph=False):
+    node = GraphIteratorNode(
+        input="user_prompt & urls",
+        output=["results"],
+        node_config={
+            "graph_instance": FlakyGraph,
+            "scraper_config": {"reuse_graph": reuse_graph, "checkpoint": path},
+        },
+        schema=Product,
+    )
+    node.checkpoint_store = CheckpointStore(path)
+    return node
+
+
+@pytest.fixture(autouse=True)
+def reset_graph():
+    FlakyGraph.runs = []
+    FlakyGraph.broken = set()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("reuse_graph", [False, True])
+async def test_rerun_repeats_only_the_failed_sources(tmp_path, reuse_graph):
+    path = str(tmp_path / "checkpoint.jsonl")
+    FlakyGraph.broken = {URLS[2]}
+
+    with pytest.raises(ValueError):
+        await make_node(path, reuse_graph).aexecute({"user_prompt": "q", "urls": URLS})
+
+    FlakyGraph.broken = set()
+    FlakyGraph.runs = []
+    state = await make_node(path, reuse_graph).aexecute(
+        {"user_prompt": "q", "urls": URLS}
+    )
+
+    assert FlakyGraph.runs == [URLS[2]]
+    assert state["results"] == [{"name": url} for url in URLS]
+
+
+@pytest.mark.asyncio
+async def test_prompt_and_schema_changes_invalidate_the_checkpoint(tmp_path):
+    path = str(tmp_path / "checkpoint.jsonl")
+    await make_node(path).aexecute({"user_prompt": "q", "urls": URLS})
+
+    FlakyGraph.runs = []
+    await make_node(path).aexecute({"user_prompt": "other", "urls": URLS})
+    assert sorted(FlakyGraph.runs) == URLS
+
+    assert CheckpointStore.make_key(URLS[0], "q", Product) != CheckpointStore.make_key(
+        URLS[0], "q", None
+    )
+
+
+@pytest.mark.asyncio
+async def test_error_answers_are_not_recorded(tmp_path):
+    path = str(tmp_path / "checkpoint.jsonl")
+    urls = [URLS[0], "https://shop.example/empty"]
+    await make_node(path).aexecute({"user_prompt": "q", "urls": urls})
+
+    store = CheckpointStore(path)
+    assert len(store) == 1
+    assert store.get(CheckpointStore.make_key(urls[1], "q", Product)) is None
+
+
+@pytest.mark.asyncio
+async def test_streamed_results_start_with_the_completed_sources(tmp_path):
+    path = str(tmp_path / "checkpoint.jsonl")
+    await make_node(path).aexecute({"user_prompt": "q", "urls": URLS[:2]})
+
+    FlakyGraph.runs = []
+    results = [r async for r in make_node(path).aiter_results("q", URLS)]
+
+    assert [source for source, _, _ in results][:2] == URLS[:2]
+    assert results[0][2] == [{"node_name": "TOTAL RESULT"}]
+    assert sorted(FlakyGraph.runs) == URLS[2:]
+
+
+def test_journal_survives_a_truncated_record(tmp_path):
+    path = tmp_path / "checkpoint.jsonl"
+    store = CheckpointStore(str(path))
+    store.put("a", URLS[0], {"name": "a"})
+    with open(path, "a") as f:
+        f.write('{"key": "b", "answ')
+
+    store = CheckpointStore(str(path))
+    store.put("c", URLS[1], {"name": "c"})
+    store = CheckpointStore(str(path))
+
+    assert store.get("a")["answer"] == {"name": "a"}
+    assert store.get("b") is None
+    assert store.get("c")["answer"] == {"name": "c"}
+
+
+def test_pydantic_answers_are_restored_as_dicts(tmp_path):
+    path = str(tmp_path / "checkpoint.jsonl")
+    CheckpointStore(path).put("a", URLS[0], Product(name="chair"))
+
+    assert CheckpointStore(path).get("a")["answer"] == {"name": "chair"}
+
+
+def test_create_checkpoint_store_shares_a_journal(tmp_path):
+    path = str(tmp_path / "checkpoint.jsonl")
+
+    assert create_checkpoint_store(None) is None
+    assert create_checkpoint_store(path) is create_checkpoint_store({"path": path})
+    with pytest.raises(ValueError):
+        create_checkpoint_store({"fsync": True})
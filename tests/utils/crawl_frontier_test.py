@@ -0,0 +1,22 @@
+from scrapegraphai.utils.crawl_frontier import CrawlFrontier, normalize_url
+
+
+def test_normalize_url_merges_equivalent_spellings():
+    assert normalize_url("HTTPS://Example.COM:443/#top") == "https://example.com/"
+    assert normalize_url("http://example.com:8080/a?b=1") == (
+        "http://example.com:8080/a?b=1"
+    )
+    assert normalize_url("https://example.com/a") != normalize_url(
+        "https://example.com/A"
+    )
+
+
+def test_frontier_enqueues_each_url_once_per_crawl():
+    frontier = CrawlFrontier(["https://example.com"])
+
+    assert frontier.pop_level() == ["https://example.com"]
+    assert frontier.add(["https://example.com/", "https://example.com/a"]) == 1
+    assert frontier.add(["https://EXAMPLE.com/a#section"]) == 0
+    assert frontier.pop_level() == ["https://example.com/a"]
+    assert frontier.depth == 1
+    assert frontier.pop_level() == []
@@ -0,0 +1,77 @@
+import os
+
+from langchain_core.documents import Document
+
+from scrapegraphai.nodes import FetchNode
+from scrapegraphai.utils.fetch_cache import FetchCache
+
+
+def test_put_and_get(tmp_path):
+    cache = FetchCache(str(tmp_path))
+    key = FetchCache.make_key("https://example.com", {"headless": True})
+
+    assert cache.get(key) is None
+    cache.put(key, "<html>hello</html>", url="https://example.com")
+    assert cache.get(key) == "<html>hello</html>"
+
+
+def test_key_depends_on_options():
+    assert FetchCache.make_key("https://example.com", {"headless": True}) != (
+        FetchCache.make_key("https://example.com", {"headless": False})
+    )
+
+
+def test_expired_entries_are_dropped(tmp_path):
+    cache = FetchCache(str(tmp_path), ttl=-1)
+    key = FetchCache.make_key("https://example.com")
+    cache.put(key, "<html>old</html>")
+
+    assert cache.get(key) is None
+
+
+def test_identical_content_is_stored_once(tmp_path):
+    cache = FetchCache(str(tmp_path))
+    cache.put(FetchCache.make_key("https://a.com"), "<html>same</html>")
+    cache.put(FetchCache.make_key("https://b.com"), "<html>same</html>")
+
+    blobs = [
+        name
+        for _, _, files in os.walk(os.path.join(cache.cache_dir, "blobs"))
+        for name in files
+    ]
+    assert len(blobs) == 1
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = FetchCache(str(tmp_path), max_size=25)
+    first = FetchCache.make_key("https://example.com/1")
+    second = FetchCache.make_key("https://example.com/2")
+    third = FetchCache.make_key("https://example.com/3")
+
+    cache.put(first, "a" * 10)
+    cache.put(second, "b" * 10)
+    cache.get(first)
+    cache.put(third, "c" * 10)
+
+    assert cache.get(first) == "a" * 10
+    assert cache.get(second) is None
+    assert cache.get(third) == "c" * 10
+
+
+def test_fetch_node_serves_repeated_urls_from_cache(mocker, tmp_path):
+    mock_loader_cls = mocker.patch("scrapegraphai.nodes.fetch_node.ChromiumLoader")
+    mock_loader = mock_loader_cls.return_value
+    mock_loader.load.return_value = [
+        Document(page_content="<html><body><p>cached page</p></body></html>")
+    ]
+    node = FetchNode(
+        input="url | local_dir",
+        output=["doc"],
+        node_config={"cache_path": str(tmp_path)},
+    )
+
+    first = node.execute({"url": "https://example.com/page"})
+    second = node.execute({"url": "https://example.com/page"})
+
+    mock_loader.load.assert_called_once()
+    assert first["doc"][0].page_content == second["doc"][0].page_content
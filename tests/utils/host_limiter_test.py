@@ -0,0 +1,84 @@
+import asyncio
+import time
+
+import pytest
+
+from scrapegraphai.utils.host_limiter import HostLimiter, get_host, is_throttle_error
+
+
+def test_get_host_ignores_case_and_port():
+    assert get_host("https://Example.com:8443/path") == "example.com"
+    assert get_host("not a url") == ""
+
+
+@pytest.mark.asyncio
+async def test_min_delay_spaces_requests_to_the_same_host_only():
+    limiter = HostLimiter(max_per_host=None, min_delay=0.1)
+    starts = {}
+
+    async def request(url):
+        async with limiter.slot(url):
+            starts.setdefault(get_host(url), []).append(time.monotonic())
+
+    await asyncio.gather(
+        *(request(f"https://a.com/{i}") for i in range(3)),
+        request("https://b.com/"),
+    )
+
+    a_starts = starts["a.com"]
+    assert all(
+        later - earlier >= 0.09 for earlier, later in zip(a_starts, a_starts[1:])
+    )
+    assert starts["b.com"][0] - a_starts[0] < 0.05
+
+
+def test_invalid_limits_are_rejected():
+    with pytest.raises(ValueError):
+        HostLimiter(max_per_host=0)
+    with pytest.raises(ValueError):
+        HostLimiter(min_delay=-1)
+
+
+class Throttled(Exception):
+    def __init__(self, status):
+        super().__init__(f"HTTP {status}")
+        self.response = type("Response", (), {"status_code": status})()
+
+
+def test_throttle_errors_are_found_in_the_error_chain():
+    try:
+        try:
+            raise Throttled(429)
+        except Throttled:
+            raise RuntimeError("Failed to fetch over HTTP")
+    except RuntimeError as e:
+        assert is_throttle_error(e)
+
+    assert is_throttle_error(asyncio.TimeoutError())
+    assert not is_throttle_error(Throttled(404))
+    assert not is_throttle_error(ValueError("bad page"))
+
+
+@pytest.mark.asyncio
+async def test_throttled_host_backs_off_and_recovers():
+    limiter = HostLimiter(min_delay=0.0, max_delay=4.0)
+    url = "https://a.com/"
+
+    for _ in range(4):
+        with pytest.raises(Throttled):
+            async with limiter.slot(url):
+                raise Throttled(503)
+        limiter._next_start.clear()
+
+    assert limiter.delay(url) == 4.0
+    assert limiter.delay("https://b.com/") == 0.0
+
+    for _ in range(30):
+        limiter._next_start.clear()
+        async with limiter.slot(url):
+            pass
+
+    stats = limiter.stats()["a.com"]
+    assert limiter.delay(url) == 0.0
+    assert (stats["requests"], stats["succeeded"], stats["throttled"]) == (34, 30, 4)
+    assert stats["throughput"] > 0
@@ -0,0 +1,110 @@
+import pytest
+from langchain_core.documents import Document
+
+from scrapegraphai.utils.cleanup_html import cleanup_html, reduce_html
+from scrapegraphai.utils.html_document import PARSED_HTML_KEY, HTMLDocument
+
+PAGE = """
+<html>
+    <head><title> Products </title><style>p { color: red; }</style></head>
+    <body>
+        <!-- navigation -->
+        <h1>Our <em>products</em></h1>
+        <p>See the <a href="/catalog">catalog</a> or <a href="https://other.example/">partners</a>.</p>
+        <ul><li>First</li><li>Second</li></ul>
+        <img src="img/logo.png" alt="Logo">
+        <script>track();</script>
+    </body>
+</html>
+"""
+
+
+def test_derives_everything_from_one_tree():
+    page = HTMLDocument(PAGE, base_url="https://shop.example/products/")
+
+    assert page.title == "Products"
+    assert page.links == ["https://shop.example/catalog", "https://other.example/"]
+    assert page.images == ["https://shop.example/products/img/logo.png"]
+    assert page.markdown == (
+        "# Our _products_\n\n"
+        "See the [catalog](https://shop.example/catalog) or "
+        "[partners](https://other.example/).\n\n"
+        "* First\n* Second\n\n"
+        "![Logo](https://shop.example/products/img/logo.png)\n"
+    )
+    assert "track" not in page.text
+    assert page.text.startswith("Our products See the catalog")
+
+
+def test_results_are_cached_on_the_document_metadata(monkeypatch):
+    document = Document(page_content=PAGE, metadata={"source": "https://shop.example/"})
+    assert (
+        HTMLDocument.from_document(document).links[0] == "https://shop.example/catalog"
+    )
+
+    def fail(html):
+        raise AssertionError("the page was parsed again")
+
+    monkeypatch.setattr("scrapegraphai.utils.html_document._parse", fail)
+    page = HTMLDocument.from_document(document)
+
+    assert page.links == document.metadata[PARSED_HTML_KEY]["links"]
+
+
+def test_cleanup_and_reduce_html():
+    title, body, links, images = cleanup_html(PAGE, "https://shop.example/")
+
+    assert title == "Products"
+    assert body.startswith("<body><h1>")
+    assert "track" not in body
+    assert links[0] == "https://shop.example/catalog"
+    assert images == ["https://shop.example/img/logo.png"]
+
+    reduced = reduce_html(PAGE, 2)
+    assert reduced.startswith("<body>")
+    assert "navigation" not in reduced and "alt" not in reduced
+
+
+def test_cleanup_html_requires_a_body():
+    with pytest.raises(ValueError):
+        cleanup_html("", "https://shop.example/")
+    with pytest.raises(ValueError):
+        cleanup_html("<p>A red chair</p>", "https://shop.example/")
+
+
+def test_links_and_images_are_normalized_and_deduplicated():
+    page = HTMLDocument(
+        """
+        <html><head><base href="https://cdn.example/assets/"></head><body>
+            <a href="HTTPS://Shop.Example/cart#top">Cart</a>
+            <a href="https://shop.example/cart">Cart again</a>
+            <a href="#reviews">Reviews</a>
+            <a href="mailto:sales@shop.example">Mail</a>
+            <area href="map.html">
+            <img data-src="lazy.jpg" src="placeholder.gif">
+            <picture><source srcset="hero-1x.webp 1x, hero-2x.webp 2x"></picture>
+            <img srcset="thumb.png 320w, hero-2x.webp 640w">
+        </body></html>
+        """,
+        base_url="https://shop.example/",
+    )
+
+    assert page.links == [
+        "https://shop.example/cart",
+        "https://cdn.example/assets/map.html",
+    ]
+    assert page.images == [
+        "https://cdn.example/assets/placeholder.gif",
+        "https://cdn.example/assets/lazy.jpg",
+        "https://cdn.example/assets/hero-1x.webp",
+        "https://cdn.example/assets/hero-2x.webp",
+        "https://cdn.example/assets/thumb.png",
+    ]
+
+
+def test_deeply_nested_pages_keep_their_text():
+    # deeper than both the default limit of libxml2 and the recursion limit
+    nested = "<div>" * 1000 + "<p>deep <b>text</b></p>" + "</div>" * 1000
+    page = HTMLDocument(f"<html><body><h1>Top</h1>{nested}<p>after</p></body></html>")
+
+    assert page.markdown == "# Top\n\ndeep text\n\nafter\n"
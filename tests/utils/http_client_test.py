@@ -0,0 +1,112 @@
+import asyncio
+import gzip
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from scrapegraphai.docloaders import ChromiumLoader
+from scrapegraphai.utils.async_map import run_sync
+from scrapegraphai.utils.http_client import (
+    _close_async_clients,
+    ahttp_fetch,
+    get_async_http_client,
+    http_fetch,
+)
+
+HTML = "<html><body><h1>Caffè</h1></body></html>"
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/big":
+        return httpx.Response(200, content=b"x" * 2048)
+    if request.url.path == "/missing":
+        return httpx.Response(404)
+    return httpx.Response(
+        200,
+        content=gzip.compress(HTML.encode("utf-8")),
+        headers={
+            "Content-Encoding": "gzip",
+            "Content-Type": "text/html; charset=utf-8",
+        },
+    )
+
+
+def test_http_fetch_decodes_compressed_pages():
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    with patch("scrapegraphai.utils.http_client.get_http_client", return_value=client):
+        assert http_fetch("https://example.com/") == HTML
+
+        with pytest.raises(ValueError, match="larger than 1024 bytes"):
+            http_fetch("https://example.com/big", max_body_size=1024)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            http_fetch("https://example.com/missing")
+
+
+@pytest.mark.asyncio
+async def test_ahttp_fetch_uses_the_loop_client():
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with patch(
+        "scrapegraphai.utils.http_client.get_async_http_client", return_value=client
+    ):
+        assert await ahttp_fetch("https://example.com/") == HTML
+
+        with pytest.raises(ValueError):
+            await ahttp_fetch("https://example.com/big", max_body_size=1024)
+
+
+def test_async_clients_are_closed_when_their_loop_shuts_down():
+    async def get_clients():
+        return get_async_http_client(), get_async_http_client(verify=False)
+
+    clients = asyncio.run(get_clients())
+
+    assert all(client.is_closed for client in clients)
+
+
+def test_async_clients_of_running_loops_are_closed_at_exit():
+    async def get_client():
+        return get_async_http_client()
+
+    client = run_sync(get_client())
+    assert not client.is_closed
+
+    _close_async_clients()
+
+    assert client.is_closed
+    assert run_sync(get_client()) is not client
+
+
+def test_chromium_loader_http_backend_falls_back_to_the_browser():
+    loader = ChromiumLoader(["https://example.com/"], backend="http")
+
+    with (
+        patch(
+            "scrapegraphai.docloaders.chromium.http_fetch",
+            side_effect=httpx.ConnectError("refused"),
+        ),
+        patch.object(
+            ChromiumLoader, "ascrape_playwright", return_value="<html>rendered</html>"
+        ) as mock_playwright,
+    ):
+        documents = loader.load()
+
+    mock_playwright.assert_called_once_with("https://example.com/")
+    assert documents[0].page_content == "<html>rendered</html>"
+
+
+def test_chromium_loader_http_backend_without_fallback():
+    loader = ChromiumLoader(
+        ["https://example.com/"], backend="http", browser_fallback=False
+    )
+
+    with patch("scrapegraphai.docloaders.chromium.http_fetch", return_value=HTML):
+        assert loader.load()[0].page_content == HTML
+
+    with patch(
+        "scrapegraphai.docloaders.chromium.http_fetch",
+        side_effect=httpx.ConnectError("refused"),
+    ):
+        with pytest.raises(RuntimeError, match="over HTTP"):
+            loader.load()
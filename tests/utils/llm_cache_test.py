@@ -0,0 +1,122 @@
+import threading
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.prompts import PromptTemplate
+
+from scrapegraphai.graphs import BaseGraph
+from scrapegraphai.nodes import GenerateAnswerNode
+from scrapegraphai.utils.llm_cache import (
+    InMemoryLLMCache,
+    SQLiteLLMCache,
+    cached_chain,
+    create_llm_cache,
+)
+
+
+def _fake_llm():
+    return FakeListChatModel(
+        responses=['{"content": "first"}', '{"content": "second"}']
+    )
+
+
+def test_cached_chain_memoizes_rendered_prompt():
+    llm = _fake_llm()
+    cache = InMemoryLLMCache()
+    prompt = PromptTemplate.from_template("Answer: {question}")
+    chain = cached_chain(prompt, llm, llm_cache=cache)
+
+    assert chain.invoke({"question": "a"}).content == '{"content": "first"}'
+    assert chain.invoke({"question": "a"}).content == '{"content": "first"}'
+    assert chain.invoke({"question": "b"}).content == '{"content": "second"}'
+
+
+def test_key_depends_on_schema():
+    llm = _fake_llm()
+    assert InMemoryLLMCache.make_key(llm, "prompt") != InMemoryLLMCache.make_key(
+        llm, "prompt", {"type": "object"}
+    )
+
+
+def test_in_memory_cache_evicts_least_recently_used():
+    cache = InMemoryLLMCache(max_entries=2)
+    cache.update("a", 1)
+    cache.update("b", 2)
+    cache.lookup("a")
+    cache.update("c", 3)
+
+    assert cache.lookup("a") == 1
+    assert cache.lookup("b") is None
+
+
+def test_sqlite_cache_persists_across_instances(tmp_path):
+    path = str(tmp_path / "llm_cache.sqlite3")
+    SQLiteLLMCache(path).update("key", {"content": "cached"})
+
+    assert SQLiteLLMCache(path).lookup("key") == {"content": "cached"}
+
+
+@pytest.mark.asyncio
+async def test_async_chain_reads_sqlite_off_the_event_loop(tmp_path):
+    threads = []
+
+    class RecordingCache(SQLiteLLMCache):
+        def lookup(self, key):
+            threads.append(threading.current_thread())
+            return super().lookup(key)
+
+        def update(self, key, value):
+            threads.append(threading.current_thread())
+            super().update(key, value)
+
+    cache = RecordingCache(str(tmp_path / "llm_cache.sqlite3"))
+    prompt = PromptTemplate.from_template("Answer: {question}")
+    chain = cached_chain(prompt, _fake_llm(), llm_cache=cache)
+
+    first = await chain.ainvoke({"question": "a"})
+    assert (await chain.ainvoke({"question": "a"})).content == first.content
+    assert len(threads) == 3
+    assert threading.current_thread() not in threads
+
+
+def test_create_llm_cache_shares_instances():
+    assert create_llm_cache(False) is None
+    assert create_llm_cache(True) is create_llm_cache({"backend": "memory"})
+
+
+def test_generate_answer_node_reports_cache_hits():
+    llm = _fake_llm()
+    node = GenerateAnswerNode(
+        input="user_prompt & doc",
+        output=["answer"],
+        node_config={"llm_model": llm, "llm_cache": InMemoryLLMCache()},
+    )
+    graph = BaseGraph(nodes=[node], edges=[], entry_point=node)
+
+    state = {"user_prompt": "What is it?", "doc": ["some page"]}
+    first_state, first_info = graph.execute(dict(state))
+    second_state, second_info = graph.execute(dict(state))
+
+    assert first_state["answer"] == second_state["answer"] == {"content": "first"}
+    assert first_info[0]["cache_misses"] == 1
+    assert second_info[0]["cache_hits"] == 1
+    assert second_info[-1]["cache_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_generate_answer_node_aexecute_shares_the_cache():
+    llm = _fake_llm()
+    node = GenerateAnswerNode(
+        input="user_prompt & doc",
+        output=["answer"],
+        node_config={"llm_model": llm, "llm_cache": InMemoryLLMCache()},
+    )
+    graph = BaseGraph(nodes=[node], edges=[], entry_point=node)
+
+    state = {"user_prompt": "What is it?", "doc": ["first chunk", "second chunk"]}
+    first_state, first_info = await graph.aexecute(dict(state))
+    second_state, second_info = graph.execute(dict(state))
+
+    assert first_state["answer"] == second_state["answer"]
+    assert first_info[0]["cache_misses"] == 3
+    assert second_info[0]["cache_hits"] == 3
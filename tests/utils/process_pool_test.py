@@ -0,0 +1,86 @@
+import pickle
+from concurrent.futures import Executor, Future
+
+import pytest
+from langchain_core.documents import Document
+from langchain_openai import ChatOpenAI
+
+from scrapegraphai.nodes import ParseNode
+from scrapegraphai.nodes.parse_node import _document_markdown
+from scrapegraphai.utils.process_pool import create_parse_executor, run_cpu_bound
+from scrapegraphai.utils.split_text_into_chunks import TextChunk
+from scrapegraphai.utils.tokenizer import tokenizer_model, tokenizer_spec
+
+HTML = "<html><body><h1>Products</h1><p>A red chair</p></body></html>"
+
+
+class PicklingExecutor(Executor):
+    """Runs the calls in place, through pickle like a process pool."""
+
+    def __init__(self):
+        self.calls = []
+
+    def submit(self, fn, *args):
+        fn, args = pickle.loads(pickle.dumps((fn, args)))
+        self.calls.append(fn.__name__)
+        future = Future()
+        future.set_result(pickle.loads(pickle.dumps(fn(*args))))
+        return future
+
+
+def test_create_parse_executor():
+    assert create_parse_executor(None) is None
+    assert create_parse_executor("thread") is None
+    executor = PicklingExecutor()
+    assert create_parse_executor(executor) is executor
+    assert create_parse_executor({"max_workers": 1}) is create_parse_executor(
+        {"type": "process", "max_workers": 1}
+    )
+    with pytest.raises(ValueError):
+        create_parse_executor("gpu")
+
+
+def test_process_pool_converts_documents():
+    executor = create_parse_executor({"max_workers": 1})
+
+    markdown = run_cpu_bound(executor, _document_markdown, Document(page_content=HTML))
+
+    assert "# Products" in markdown
+    assert "A red chair" in markdown
+
+
+def test_tokenizer_spec_selects_the_same_tokenizer():
+    llm_model = ChatOpenAI(model="gpt-4o-mini", api_key="sk-test")
+
+    stand_in = tokenizer_model(pickle.loads(pickle.dumps(tokenizer_spec(llm_model))))
+
+    assert type(stand_in).__name__ == "ChatOpenAI"
+    assert stand_in.model_name == "gpt-4o-mini"
+    assert tokenizer_model(tokenizer_spec(None)) is None
+    assert tokenizer_spec(type("ChatOllama", (), {})()) is None
+
+
+def test_parse_node_converts_and_chunks_in_the_executor(monkeypatch):
+    models = []
+
+    def fake_chunks(text, chunk_size, llm_model=None):
+        models.append(type(llm_model).__name__)
+        return iter([TextChunk(text, len(text.split()))])
+
+    monkeypatch.setattr("scrapegraphai.nodes.parse_node.iter_token_chunks", fake_chunks)
+    executor = PicklingExecutor()
+    node = ParseNode(
+        input="doc",
+        output=["parsed_doc"],
+        node_config={
+            "chunk_size": 4096,
+            "llm_model": ChatOpenAI(model="gpt-4o-mini", api_key="sk-test"),
+            "parse_executor": executor,
+        },
+    )
+
+    state = node.execute({"doc": [Document(page_content=HTML)], "user_prompt": "q"})
+
+    assert executor.calls == ["_document_markdown", "_chunk_text"]
+    assert models == ["ChatOpenAI"]
+    assert "A red chair" in state["parsed_doc"][0]
@@ -0,0 +1,109 @@
+from typing import List
+
+from pydantic import BaseModel
+
+from scrapegraphai.graphs import SmartScraperGraph
+from scrapegraphai.nodes import ParseNode, RelevanceFilterNode
+from scrapegraphai.utils.relevance import BM25, select_relevant_chunks, tokenize
+from scrapegraphai.utils.split_text_into_chunks import ChunkList, TextChunk
+
+CHUNKS = [
+    "Our company was founded in 1990 by two friends.",
+    "Product A costs $10. Product B costs $12 and ships in two days.",
+    "Contact us by email or phone, our team answers in a day.",
+    "Shipping is free above $50 for every product.",
+]
+COUNTED_CHUNKS = ChunkList(
+    TextChunk(text, num_tokens) for text, num_tokens in zip(CHUNKS, [10, 20, 30, 40])
+)
+
+
+def test_tokenize_drops_stop_words_and_plurals():
+    assert tokenize("List me all the Products and their prices") == [
+        "product",
+        "price",
+    ]
+
+
+def test_bm25_ranks_matching_documents_first():
+    scores = BM25(CHUNKS).scores("product prices")
+
+    assert scores[1] > scores[3] > 0
+    assert scores[0] == scores[2] == 0
+
+
+def test_select_relevant_chunks_keeps_document_order():
+    assert select_relevant_chunks(CHUNKS, "List the products") == [1, 3]
+    assert select_relevant_chunks(CHUNKS, "List the products", top_k=1) == [1]
+    assert select_relevant_chunks(CHUNKS, "product costs", min_score=0.9) == [1]
+
+
+def test_select_relevant_chunks_keeps_everything_without_a_match():
+    assert select_relevant_chunks(CHUNKS, "opening hours") == [0, 1, 2, 3]
+    assert select_relevant_chunks([], "products") == []
+
+
+def test_node_reports_skipped_chunks_and_saved_tokens():
+    node = RelevanceFilterNode(
+        input="user_prompt & parsed_doc",
+        output=["relevant_chunks"],
+        node_config={"llm_model": None},
+    )
+    state = {
+        "user_prompt": "What do the products cost?",
+        "parsed_doc": COUNTED_CHUNKS,
+    }
+
+    state = node.execute(state)
+
+    assert state["relevant_chunks"] == [CHUNKS[1], CHUNKS[3]]
+    assert state["relevant_chunks"].token_counts == [20, 40]
+    assert state["relevance_filter"] == {
+        "chunks": 4,
+        "kept": 2,
+        "skipped": 2,
+        "tokens_saved": 40,
+    }
+
+
+def test_node_queries_the_schema_fields():
+    class Company(BaseModel):
+        founders: List[str]
+
+    node = RelevanceFilterNode(
+        input="user_prompt & parsed_doc",
+        output=["relevant_chunks"],
+        node_config={"llm_model": None, "schema": Company},
+    )
+    state = {
+        "user_prompt": "Tell me about the company",
+        "parsed_doc": COUNTED_CHUNKS,
+    }
+
+    assert (
+        node._query("Tell me about the company") == "Tell me about the company founders"
+    )
+    assert node.execute(state)["relevant_chunks"] == [CHUNKS[0]]
+
+
+def test_smart_scraper_inserts_the_filter_after_parsing():
+    graph = SmartScraperGraph(
+        "List the products",
+        "https://example.com",
+        {
+            "llm": {"model": "openai/gpt-4o-mini", "api_key": "sk-test"},
+            "relevance_filter": {"top_k": 3},
+            "stream_chunks": True,
+        },
+    )
+
+    nodes = {node.node_name: node for node in graph.graph.nodes}
+    assert list(nodes) == ["Fetch", "ParseNode", "RelevanceFilter", "GenerateAnswer"]
+    assert nodes["RelevanceFilter"].top_k == 3
+    assert nodes["ParseNode"].stream_chunks is False
+    assert graph.graph.edges == {
+        "Fetch": "ParseNode",
+        "ParseNode": "RelevanceFilter",
+        "RelevanceFilter": "GenerateAnswer",
+    }
+    assert isinstance(nodes["ParseNode"], ParseNode)
@@ -0,0 +1,122 @@
+import asyncio
+import threading
+from unittest.mock import AsyncMock, patch
+
+from scrapegraphai.docloaders import ChromiumLoader
+from scrapegraphai.utils.render_detection import HostRenderTable, needs_js_rendering
+
+ARTICLE = "<p>" + "Server rendered paragraph with plenty of text. " * 10 + "</p>"
+
+
+def test_static_page_does_not_need_js():
+    html = f"<html><body><script>track()</script>{ARTICLE}</body></html>"
+    assert not needs_js_rendering(html)
+
+
+def test_empty_body_needs_js():
+    assert needs_js_rendering(
+        "<html><body><script src='app.js'></script></body></html>"
+    )
+
+
+def test_spa_shell_needs_js():
+    html = (
+        "<html><body><header>" + ARTICLE + "</header>"
+        "<div id='root'></div><script src='bundle.js'></script></body></html>"
+    )
+    assert needs_js_rendering(html)
+
+
+def test_server_rendered_spa_does_not_need_js():
+    html = f"<html><body><div id='__next'>{ARTICLE}</div></body></html>"
+    assert not needs_js_rendering(html)
+
+
+def test_noscript_wall_needs_js():
+    html = (
+        "<html><body><noscript>Please enable JavaScript to continue.</noscript>"
+        f"{ARTICLE}</body></html>"
+    )
+    assert needs_js_rendering(html)
+
+
+def test_host_render_table_persists_decisions(tmp_path):
+    path = str(tmp_path / "render_table.sqlite3")
+    table = HostRenderTable(path)
+    table.set("static.example.com", needs_js=False)
+    table.set("app.example.com", needs_js=True)
+
+    reopened = HostRenderTable(path)
+    assert reopened.get("static.example.com") is False
+    assert reopened.get("app.example.com") is True
+    assert reopened.get("unknown.example.com") is None
+
+    expired = HostRenderTable(path, ttl=-1)
+    assert expired.get("app.example.com") is None
+
+
+def test_auto_backend_escalates_only_when_needed(tmp_path):
+    path = str(tmp_path / "render_table.sqlite3")
+    shell = "<html><body><div id='app'></div></body></html>"
+    static = f"<html><body>{ARTICLE}</body></html>"
+
+    def fake_fetch(url, **kwargs):
+        return shell if "app.example.com" in url else static
+
+    loader = ChromiumLoader(
+        [
+            "https://app.example.com/a",
+            "https://static.example.com/",
+            "https://app.example.com/b",
+        ],
+        backend="auto",
+        render_table_path=path,
+    )
+    with (
+        patch(
+            "scrapegraphai.docloaders.chromium.http_fetch", side_effect=fake_fetch
+        ) as mock_fetch,
+        patch.object(
+            ChromiumLoader,
+            "ascrape_with_js_support",
+            return_value="<html>rendered</html>",
+        ) as mock_browser,
+    ):
+        documents = loader.load()
+
+    assert [doc.page_content for doc in documents] == [
+        "<html>rendered</html>",
+        static,
+        "<html>rendered</html>",
+    ]
+    # the second page of the JavaScript host skips the HTTP attempt
+    assert mock_fetch.call_count == 2
+    assert mock_browser.call_count == 2
+    assert HostRenderTable.from_path(path).get("app.example.com") is True
+
+
+def test_async_auto_backend_detects_off_the_event_loop(tmp_path):
+    threads = []
+
+    def detect(html):
+        threads.append(threading.current_thread())
+        return needs_js_rendering(html)
+
+    loader = ChromiumLoader(
+        ["https://static.example.com/"],
+        backend="auto",
+        render_table_path=str(tmp_path / "render_table.sqlite3"),
+    )
+    with (
+        patch(
+            "scrapegraphai.docloaders.chromium.ahttp_fetch",
+            new=AsyncMock(return_value=f"<html><body>{ARTICLE}</body></html>"),
+        ),
+        patch(
+            "scrapegraphai.docloaders.chromium.needs_js_rendering", side_effect=detect
+        ),
+    ):
+        html = asyncio.run(loader.ascrape_auto("https://static.example.com/"))
+
+    assert ARTICLE in html
+    assert threads and threads[0] is not threading.main_thread()
@@ -0,0 +1,106 @@
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.documents import Document
+
+from scrapegraphai.graphs import SmartScraperGraph
+from scrapegraphai.nodes import ParseNode
+from scrapegraphai.utils import token_budget
+from scrapegraphai.utils.token_budget import (
+    APPROXIMATE_CHUNK_RATIO,
+    CHUNK_TOKEN_MARGIN,
+    MESSAGE_OVERHEAD_TOKENS,
+    MIN_CHUNK_TOKENS,
+    TokenBudget,
+    output_token_limit,
+)
+
+
+class WordCounter:
+    def count(self, text):
+        return len(text.split())
+
+
+@pytest.fixture(autouse=True)
+def count_words(monkeypatch):
+    monkeypatch.setattr(token_budget, "get_token_counter", lambda model: WordCounter())
+
+
+def test_output_token_limit():
+    assert output_token_limit(SimpleNamespace(max_tokens=2000)) == 2000
+    assert output_token_limit(SimpleNamespace(num_predict=512)) == 512
+    assert output_token_limit(SimpleNamespace(model_kwargs={"max_tokens": 300})) == 300
+    assert output_token_limit(SimpleNamespace(max_tokens=None)) is None
+
+
+def test_budget_measures_the_largest_rendered_template():
+    budget = TokenBudget(
+        10000,
+        SimpleNamespace(max_tokens=1000),
+        [
+            "Answer {question} from {context}",
+            "Chunk {chunk_id}: {context} {format_instructions}",
+        ],
+        {"format_instructions": "reply with one two three four"},
+    )
+
+    # the second template renders to "Chunk chunk9999: [''] reply with one two three four"
+    content_tokens = 10000 - 9 - 1000 - MESSAGE_OVERHEAD_TOKENS
+    assert budget.prompt_tokens("what is it") == 9
+    assert budget.content_tokens("what is it") == content_tokens
+    assert budget.chunk_size("what is it") == content_tokens - CHUNK_TOKEN_MARGIN
+
+
+def test_budget_keeps_a_proportional_margin_for_approximate_counts(monkeypatch):
+    counter = WordCounter()
+    counter.approximate = True
+    monkeypatch.setattr(token_budget, "get_token_counter", lambda model: counter)
+    budget = TokenBudget(10000, templates=["{question} {context}"], output_tokens=1000)
+
+    content_tokens = 10000 - 4 - 1000 - MESSAGE_OVERHEAD_TOKENS
+    assert budget.chunk_size("what is it") == int(
+        (content_tokens - CHUNK_TOKEN_MARGIN) * APPROXIMATE_CHUNK_RATIO
+    )
+
+
+def test_budget_reserves_output_tokens_without_a_model_limit():
+    assert TokenBudget(100000).output_tokens == 1024
+    assert TokenBudget(2000).output_tokens == 500
+
+
+def test_budget_never_goes_below_the_minimum_chunk():
+    budget = TokenBudget(600, templates=["word " * 1000], output_tokens=100)
+
+    assert budget.chunk_size() == MIN_CHUNK_TOKENS
+
+
+def test_parse_node_sizes_chunks_from_the_budget(monkeypatch):
+    sizes = []
+
+    def fake_chunks(text, chunk_size, llm_model):
+        sizes.append(chunk_size)
+        return iter([])
+
+    monkeypatch.setattr("scrapegraphai.nodes.parse_node.iter_token_chunks", fake_chunks)
+    budget = TokenBudget(8192, templates=["{question} {context}"], output_tokens=1000)
+    node = ParseNode(
+        input="doc",
+        output=["parsed_doc"],
+        node_config={"chunk_size": 8192, "parse_html": False, "token_budget": budget},
+    )
+
+    node.execute({"doc": [Document(page_content="text")], "user_prompt": "a b c"})
+
+    assert sizes == [8192 - 4 - 1000 - MESSAGE_OVERHEAD_TOKENS - CHUNK_TOKEN_MARGIN]
+
+
+def test_graphs_plan_the_chunks_of_their_answer_node():
+    graph = SmartScraperGraph(
+        "List the products",
+        "https://example.com",
+        {"llm": {"model": "openai/gpt-4o-mini", "api_key": "sk-test"}},
+    )
+
+    (parse_node,) = [node for node in graph.graph.nodes if isinstance(node, ParseNode)]
+    assert parse_node.token_budget.context_window == graph.model_token
+    assert len(parse_node.token_budget.templates) == 2
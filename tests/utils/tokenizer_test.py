@@ -0,0 +1,151 @@
+import re
+
+import pytest
+
+from scrapegraphai.utils import split_text_into_chunks, tokenizer
+from scrapegraphai.utils.split_text_into_chunks import split_text_into_token_chunks
+from scrapegraphai.utils.tokenizer import TokenCounter, get_token_counter
+
+
+class FakeEncoding:
+    """Encodes every word with its trailing whitespace as one token."""
+
+    pattern = re.compile(r"\S+\s*|\s+")
+
+    def __init__(self):
+        self.calls = 0
+        self.batch_calls = 0
+
+    def encode_ordinary(self, text):
+        self.calls += 1
+        return self.pattern.findall(text)
+
+    def encode_ordinary_batch(self, texts):
+        self.batch_calls += 1
+        return [self.pattern.findall(text) for text in texts]
+
+    def decode_tokens_bytes(self, tokens):
+        return [token.encode("utf-8") for token in tokens]
+
+
+class ChatMistralAI:
+    model = "mistral-large-latest"
+
+
+class ChatOpenAI:
+    model_name = "gpt-4o-mini"
+
+
+class ChatAnthropic:
+    model = "claude-3-5-sonnet-latest"
+
+
+@pytest.fixture
+def encoding(monkeypatch):
+    encoding = FakeEncoding()
+    requested = []
+
+    def fake_get_openai_encoding(model_name="gpt-4o"):
+        requested.append(model_name)
+        return encoding
+
+    encoding.requested = requested
+    monkeypatch.setattr(tokenizer, "get_openai_encoding", fake_get_openai_encoding)
+    monkeypatch.setattr(tokenizer, "_counters", {})
+    return encoding
+
+
+def test_counter_memoizes_repeated_texts(encoding):
+    counter = TokenCounter()
+
+    assert counter.count("one two three") == 3
+    assert counter.count("one two three") == 3
+    assert encoding.calls == 1
+
+
+def test_count_batch_tokenizes_misses_in_one_batch(encoding):
+    counter = TokenCounter()
+    counter.count("a b")
+
+    assert counter.count_batch(["a b", "c", "d e f", "c"]) == [2, 1, 3, 1]
+    assert encoding.batch_calls == 1
+    assert counter.count("d e f") == 3
+    assert encoding.calls == 1
+
+
+def test_memo_is_bounded_by_characters(encoding):
+    counter = TokenCounter(memo_chars=10)
+    counter.count_batch(["aaaa", "bbbb", "cccc"])
+
+    assert "aaaa" not in counter._memo
+    assert list(counter._memo) == ["bbbb", "cccc"]
+
+
+def test_counters_follow_the_active_model(encoding):
+    openai_counter = get_token_counter(ChatOpenAI())
+
+    assert get_token_counter(ChatOpenAI()) is openai_counter
+    assert encoding.requested == ["gpt-4o-mini"]
+    assert get_token_counter() is not openai_counter
+
+
+def test_mistral_counter_falls_back_without_its_tokenizer(encoding, monkeypatch):
+    def missing_tokenizer(text, llm_model):
+        raise ImportError("mistral_common is not installed")
+
+    monkeypatch.setattr(tokenizer, "num_tokens_mistral", missing_tokenizer)
+    counter = get_token_counter(ChatMistralAI())
+
+    assert counter.count("one two") == 2
+    assert counter.count("three four five") == 3
+    assert counter.approximate
+
+
+def test_counters_of_other_models_are_approximate(encoding):
+    assert not get_token_counter().approximate
+    assert not get_token_counter(ChatOpenAI()).approximate
+    assert get_token_counter(ChatAnthropic()).approximate
+
+
+def test_split_text_into_chunks_uses_the_model_counter(encoding):
+    text = " ".join(f"word{i}" for i in range(100))
+
+    chunks = split_text_into_chunks(text, chunk_size=30, use_semchunk=False)
+
+    assert [len(chunk.split()) for chunk in chunks] == [30, 30, 30, 10]
+    assert " ".join(chunks) == text
+    assert encoding.calls == 1
+
+
+def test_token_byte_offsets(encoding):
+    counter = TokenCounter()
+
+    assert counter.token_byte_offsets("caffè latte è") == [0, 7, 13]
+    assert counter.token_byte_offsets("") == []
+
+
+def test_token_chunks_snap_to_headings_and_paragraphs(encoding):
+    intro = " ".join(["intro"] * 12)
+    section = " ".join(["body"] * 8)
+    text = f"{intro}\n\n# Section\n\n{section}. {section}"
+
+    chunks = split_text_into_token_chunks(text, chunk_size=20)
+
+    assert chunks[0].text == intro
+    assert chunks[1].text.startswith("# Section")
+    assert all(chunk.num_tokens <= 20 for chunk in chunks)
+    assert sum(chunk.num_tokens for chunk in chunks) == len(
+        encoding.encode_ordinary(text)
+    )
+
+
+def test_token_chunks_count_words_without_offsets(encoding, monkeypatch):
+    monkeypatch.setattr(TokenCounter, "token_byte_offsets", lambda self, text: None)
+    text = "First sentence here. " * 10
+
+    chunks = split_text_into_token_chunks(text, chunk_size=7)
+
+    assert [chunk.text for chunk in chunks] == [
+        "First sentence here. First sentence here."
+    ] * 5
+    assert [chunk.num_tokens for chunk in chunks] == [6] * 5
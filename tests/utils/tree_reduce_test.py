@@ -0,0 +1,91 @@
+from typing import List, Optional
+
+import pytest
+from pydantic import BaseModel
+
+from scrapegraphai.nodes import MergeAnswersNode
+from scrapegraphai.utils.tree_reduce import (
+    array_fields,
+    atree_reduce,
+    concat_answers,
+    group_by_token_budget,
+)
+
+
+class Product(BaseModel):
+    name: str
+
+
+class Products(BaseModel):
+    products: List[Product]
+    categories: Optional[List[str]] = None
+
+
+class Summary(BaseModel):
+    summary: str
+    products: List[Product]
+
+
+def test_group_by_token_budget():
+    assert group_by_token_budget([3, 3, 3, 3, 3], budget=7) == [[0, 1], [2, 3], [4]]
+    # oversized items are still paired so that every round makes progress
+    assert group_by_token_budget([10, 10, 10], budget=5) == [[0, 1], [2]]
+    assert group_by_token_budget([10, 10, 10], budget=None) == [[0, 1, 2]]
+
+
+@pytest.mark.asyncio
+async def test_tree_reduce_merges_groups_level_by_level():
+    merges = []
+
+    async def merge(group):
+        merges.append(list(group))
+        return "".join(group)
+
+    merged = await atree_reduce(
+        ["a", "b", "c", "d", "e"], merge, count_tokens=len, budget=2
+    )
+
+    assert merged == "abcde"
+    assert merges == [["a", "b"], ["c", "d"], ["ab", "cd"], ["abcd", "e"]]
+
+
+
+@pytest.mark.asyncio
+async def test_tree_reduce_rejects_empty_input():
+    async def merge(group):
+        raise AssertionError("nothing to merge")
+
+    with pytest.raises(ValueError):
+        await atree_reduce([], merge, count_tokens=len, budget=100)
+
+
+def test_merge_node_without_answers_skips_the_llm():
+    node = MergeAnswersNode(
+        input="user_prompt & results",
+        output=["answer"],
+        node_config={"llm_model": None, "model_token": 1000},
+    )
+
+    state = node.execute({"user_prompt": "List the products", "results": []})
+
+    assert state["answer"] == {}
+
+def test_array_fields():
+    assert array_fields(Products) == ("products", "categories")
+    assert array_fields(Summary) is None
+    assert array_fields({"type": "array", "items": {"type": "string"}}) == ()
+    assert array_fields(None) is None
+
+
+def test_concat_answers():
+    answers = [
+        {"products": [{"name": "a"}, {"name": "b"}]},
+        {"products": [{"name": "b"}, {"name": "c"}], "categories": ["tools"]},
+    ]
+
+    assert concat_answers(answers, Products) == {
+        "products": [{"name": "a"}, {"name": "b"}, {"name": "c"}],
+        "categories": ["tools"],
+    }
+    assert concat_answers(answers, Summary) is None
+    assert concat_answers([{"error": "timeout"}], Products) is None